@@ -0,0 +1,228 @@
+"""Benchmark backfills end to end against a local fake API.
+
+Starts the stand-in server of fake_server.py and runs the tap in a fresh
+process for backfills of 1, 5 and 20 years. Reports records/s, requests/s,
+peak RSS and bytes written per backfill, and appends the results with the
+git commit to benchmarks/results/backfill.jsonl, so changes to the fetch
+engine, the serializer or the checkpoints can be compared run over run.
+
+Usage:
+    python benchmarks/bench_backfill.py [--years 1 5 20] [--latency-ms 20]
+        [--error-rate 0] [--rate-limit-rate 0] [--currencies 168]
+        [--time-series] [--concurrency 8] [--serializer template]
+        [--streams exchange_rate_EUR] [--label name]
+"""
+# -*- coding: utf-8 -*-
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser, Namespace
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+from fake_server import DEFAULT_LATENCY_MS, FakeServer
+
+from tap_open_exchange.discover import compile_catalog
+from tap_open_exchange.fetcher import DEFAULT_CONCURRENCY
+from tap_open_exchange.serialize import DEFAULT_SERIALIZER, SERIALIZERS
+from tap_open_exchange.streams import CURRENCIES
+
+DEFAULT_YEARS: List[int] = [1, 5, 20]
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+RSS_UNITS_PER_MB: int = 1024 ** 2 if sys.platform == 'darwin' else 1024
+
+# Results of every run, one JSON object per line
+RESULTS: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'results',
+    'backfill.jsonl',
+)
+
+
+def git_commit() -> str:
+    """Return the current git commit.
+
+    Returns:
+        str -- Short commit hash or an empty string
+    """
+    try:
+        return subprocess.run(  # noqa: S603, S607
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def write_catalog(path: str, streams: List[str]) -> None:
+    """Write a catalog with the given streams selected.
+
+    Arguments:
+        path {str} -- Path of the catalog
+        streams {List[str]} -- Streams to select
+    """
+    catalog: dict = compile_catalog().to_dict()
+    for stream in catalog['streams']:
+        stream['schema']['selected'] = stream['tap_stream_id'] in streams
+    with open(path, 'w') as catalog_file:
+        json.dump(catalog, catalog_file)
+
+
+def run_tap(config_path: str, catalog_path: str) -> dict:
+    """Run the tap and measure its output.
+
+    Arguments:
+        config_path {str} -- Path of the tap config
+        catalog_path {str} -- Path of the catalog
+
+    Returns:
+        dict -- Records, bytes written, seconds and peak RSS
+    """
+    start: float = time.perf_counter()
+    process: subprocess.Popen = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'tap_open_exchange.tap',
+            '--config',
+            config_path,
+            '--catalog',
+            catalog_path,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    records: int = 0
+    bytes_written: int = 0
+    for line in process.stdout:  # type: ignore
+        bytes_written += len(line)
+        if b'"RECORD"' in line:
+            records += 1
+
+    # wait4 returns the resource usage of the tap process only
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    seconds: float = time.perf_counter() - start
+    if process.returncode:
+        raise RuntimeError(f'The tap exited with {process.returncode}')
+
+    return {
+        'records': records,
+        'bytes_written': bytes_written,
+        'seconds': round(seconds, 3),
+        'peak_rss_mb': round(rusage.ru_maxrss / RSS_UNITS_PER_MB, 1),
+    }
+
+
+def main() -> None:  # noqa: WPS210
+    """Run the benchmark."""
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument('--years', type=int, nargs='+', default=DEFAULT_YEARS)
+    parser.add_argument('--latency-ms', type=float, default=DEFAULT_LATENCY_MS)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--currencies', type=int, default=len(CURRENCIES))
+    parser.add_argument('--time-series', action='store_true')
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+    )
+    parser.add_argument(
+        '--serializer',
+        choices=SERIALIZERS,
+        default=DEFAULT_SERIALIZER,
+    )
+    parser.add_argument(
+        '--streams',
+        nargs='+',
+        default=['exchange_rate_EUR'],
+    )
+    parser.add_argument('--label', default='')
+    parser.add_argument('--results', default=RESULTS)
+    args: Namespace = parser.parse_args()
+
+    commit: str = git_commit()
+    os.makedirs(os.path.dirname(args.results), exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        catalog_path: str = os.path.join(directory, 'catalog.json')
+        write_catalog(catalog_path, args.streams)
+
+        for years in args.years:
+            start_date: date = (
+                datetime.now(timezone.utc).date()
+                - timedelta(days=round(years * 365.25))
+            )
+
+            with FakeServer(
+                latency_ms=args.latency_ms,
+                error_rate=args.error_rate,
+                rate_limit_rate=args.rate_limit_rate,
+                currencies=args.currencies,
+                time_series=args.time_series,
+            ) as server:
+                config_path: str = os.path.join(directory, 'config.json')
+                with open(config_path, 'w') as config_file:
+                    json.dump({
+                        'api_key': 'benchmark',
+                        'start_date': start_date.isoformat(),
+                        'api_base_url': server.url,
+                        'concurrency': args.concurrency,
+                        'serializer': args.serializer,
+                        'time_series': args.time_series,
+                    }, config_file)
+
+                measured: dict = run_tap(config_path, catalog_path)
+                server_stats: dict = server.stats.as_dict()
+
+            result: dict = {
+                'time': datetime.now(timezone.utc).isoformat(),
+                'commit': commit,
+                'label': args.label,
+                'years': years,
+                'days': (
+                    datetime.now(timezone.utc).date() - start_date
+                ).days,
+                'latency_ms': args.latency_ms,
+                'error_rate': args.error_rate,
+                'rate_limit_rate': args.rate_limit_rate,
+                'currencies': args.currencies,
+                'time_series': args.time_series,
+                'concurrency': args.concurrency,
+                'serializer': args.serializer,
+                'streams': args.streams,
+                **measured,
+                **server_stats,
+                'records_per_s': round(
+                    measured['records'] / measured['seconds'],
+                    1,
+                ),
+                'requests_per_s': round(
+                    server_stats['requests'] / measured['seconds'],
+                    1,
+                ),
+            }
+
+            print(  # noqa: WPS421
+                f'{years:>3} years: {result["records"]:>8,} records '
+                f'{result["records_per_s"]:>10,.1f} records/s '
+                f'{result["requests_per_s"]:>8,.1f} requests/s '
+                f'{result["peak_rss_mb"]:>7,.1f} MB peak RSS '
+                f'{result["bytes_written"] / 1e6:>8,.1f} MB written',
+            )
+
+            with open(args.results, 'a') as results_file:
+                results_file.write(json.dumps(result))
+                results_file.write('\n')
+
+
+if __name__ == '__main__':
+    main()
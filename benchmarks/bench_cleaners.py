@@ -0,0 +1,99 @@
+"""Benchmark the exchange rate cleaner.
+
+Compares the compiled cleaner in CLEANERS and the batch cleaner in
+BATCH_CLEANERS with interpreting the stream mapping per record through
+clean_row, which is how records were cleaned before the cleaners were
+compiled.
+
+Usage:
+    python benchmarks/bench_cleaners.py [records]
+"""
+# -*- coding: utf-8 -*-
+import sys
+import timeit
+
+from tap_open_exchange.cleaners import (
+    BATCH_CLEANERS,
+    CLEANERS,
+    RESPONSE_KEYS,
+    clean_row,
+    iter_rows,
+)
+from tap_open_exchange.streams import CURRENCIES, STREAMS
+
+DEFAULT_RECORDS: int = 20000
+BATCH_SIZE: int = 31
+
+
+def interpreted_cleaner(date_day: str, response_data: dict) -> dict:
+    """Clean a response by interpreting the mapping.
+
+    Arguments:
+        date_day {str} -- Day
+        response_data {dict} -- Response
+
+    Returns:
+        dict -- Cleaned record
+    """
+    mapping: dict = STREAMS['exchange_rate_EUR']['mapping']
+    row: dict = {
+        key: (
+            response_data.get(key) if key in RESPONSE_KEYS
+            else response_data.get('rates').get(key)
+        )
+        for key in mapping
+    }
+    return clean_row(row, mapping)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    records: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORDS
+    response_data: dict = {
+        'timestamp': '2020-01-01T23:59:59.000000',
+        'base': 'EUR',
+        'rates': {
+            currency: 1.0 + position / 100
+            for position, currency in enumerate(CURRENCIES)
+        },
+    }
+    compiled = CLEANERS['exchange_rate_EUR']
+    assert compiled('2020-01-01', response_data) == interpreted_cleaner(
+        '2020-01-01',
+        response_data,
+    )
+    batch_cleaner = BATCH_CLEANERS['exchange_rate_EUR']
+    batch: list = [('2020-01-01', response_data)] * BATCH_SIZE
+    assert next(iter_rows(batch_cleaner(batch))) == interpreted_cleaner(
+        '2020-01-01',
+        response_data,
+    )
+
+    for name, cleaner in (
+        ('interpreted', interpreted_cleaner),
+        ('compiled', compiled),
+    ):
+        seconds: float = min(timeit.repeat(
+            lambda: cleaner('2020-01-01', response_data),  # noqa: WPS430
+            number=records,
+            repeat=3,
+        ))
+        print(  # noqa: WPS421
+            f'{name:>12}: {records / seconds:>12,.0f} records/s '
+            f'({seconds / records * 1e6:.2f} us/record)',
+        )
+
+    batches: int = max(1, records // BATCH_SIZE)
+    seconds = min(timeit.repeat(
+        lambda: list(iter_rows(batch_cleaner(batch))),  # noqa: WPS430
+        number=batches,
+        repeat=3,
+    ))
+    print(  # noqa: WPS421
+        f'{"batch":>12}: {batches * BATCH_SIZE / seconds:>12,.0f} records/s '
+        f'({seconds / batches / BATCH_SIZE * 1e6:.2f} us/record)',
+    )
+
+
+if __name__ == '__main__':
+    main()
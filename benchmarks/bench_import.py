@@ -0,0 +1,191 @@
+"""Benchmark the startup time of the tap.
+
+Imports the tap in fresh interpreters with python -X importtime and reports
+the fastest total import time, the time spent in the tap's own modules and
+the wall time of a discovery run. Fails when the import time exceeds its
+budget, when a module that should be imported lazily is imported at
+startup, or when the sync imports a module whose setting is not configured.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--budget-ms 250]
+        [--own-budget-ms 10]
+"""
+# -*- coding: utf-8 -*-
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Dict, List, Tuple
+
+DEFAULT_RUNS: int = 10
+DEFAULT_BUDGET_MS: float = 250.0
+DEFAULT_OWN_BUDGET_MS: float = 10.0
+
+# Modules only needed in sync mode or on first use
+LAZY_MODULES: Tuple[str, ...] = (
+    'pkg_resources',
+    'asyncio',
+    'httpx',
+    'dateutil.rrule',
+    'tap_open_exchange.exchange',
+    'tap_open_exchange.cleaners',
+    'tap_open_exchange.timezones',
+)
+
+# Modules only needed in sync mode when they are configured, e.g. by cache_dir
+CONFIGURED_MODULES: Tuple[str, ...] = (
+    'tap_open_exchange.archive',
+    'tap_open_exchange.cache',
+    'tap_open_exchange.replay',
+)
+
+# Imports of run_sync
+SYNC_IMPORTS: str = (
+    'import tap_open_exchange.tap, tap_open_exchange.sync, '
+    'tap_open_exchange.exchange'
+)
+
+
+def environment() -> Dict[str, str]:
+    """Environment of the interpreters, with bytecode caching enabled.
+
+    Returns:
+        Dict[str, str] -- Environment
+    """
+    env: Dict[str, str] = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def import_times(
+    statement: str = 'import tap_open_exchange.tap',
+) -> Dict[str, Tuple[int, int]]:
+    """Import the tap in a fresh interpreter.
+
+    Keyword Arguments:
+        statement {str} -- Import statement (default: {the tap})
+
+    Returns:
+        Dict[str, Tuple[int, int]] -- Self and cumulative microseconds per
+            imported module
+    """
+    process: subprocess.CompletedProcess = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            '-X',
+            'importtime',
+            '-c',
+            statement,
+        ],
+        capture_output=True,
+        check=True,
+        env=environment(),
+        text=True,
+    )
+
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def discover_seconds(config_path: str) -> float:
+    """Run the tap in discovery mode.
+
+    Arguments:
+        config_path {str} -- Path of a tap config
+
+    Returns:
+        float -- Wall time in seconds
+    """
+    start: float = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'tap_open_exchange.tap',
+            '--config',
+            config_path,
+            '--discover',
+        ],
+        capture_output=True,
+        check=True,
+        env=environment(),
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:  # noqa: WPS210, WPS213
+    """Run the benchmark."""
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument(
+        '--own-budget-ms',
+        type=float,
+        default=DEFAULT_OWN_BUDGET_MS,
+    )
+    args: Namespace = parser.parse_args()
+
+    # The first run writes the bytecode caches
+    runs: List[Dict[str, Tuple[int, int]]] = [
+        import_times() for _ in range(args.runs + 1)
+    ][1:]
+
+    total_ms: float = min(
+        times['tap_open_exchange.tap'][1] for times in runs
+    ) / 1000
+    own_ms: float = min(
+        sum(
+            self_us for module, (self_us, _) in times.items()
+            if module.startswith('tap_open_exchange')
+        )
+        for times in runs
+    ) / 1000
+    singer_ms: float = min(
+        times['singer'][1] for times in runs if 'singer' in times
+    ) / 1000
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json') as config_file:
+        json.dump({'api_key': '', 'start_date': '2021-01-01'}, config_file)
+        config_file.flush()
+        discover_s: float = min(
+            discover_seconds(config_file.name) for _ in range(args.runs)
+        )
+
+    print(  # noqa: WPS421
+        f'import: {total_ms:>8.1f} ms (budget {args.budget_ms:.0f} ms)\n'
+        f'   own: {own_ms:>8.1f} ms (budget {args.own_budget_ms:.0f} ms)\n'
+        f'singer: {singer_ms:>8.1f} ms\n'
+        f'discover: {discover_s * 1000:>6.1f} ms wall time',
+    )
+
+    failures: List[str] = [
+        f'{module} is imported at startup'
+        for module in LAZY_MODULES
+        if any(module in times for times in runs)
+    ]
+    sync_times: Dict[str, Tuple[int, int]] = import_times(SYNC_IMPORTS)
+    failures.extend(
+        f'{module} is imported in sync mode without its config'
+        for module in CONFIGURED_MODULES
+        if module in sync_times
+    )
+    if total_ms > args.budget_ms:
+        failures.append(f'Import takes {total_ms:.1f} ms')
+    if own_ms > args.own_budget_ms:
+        failures.append(f'Own modules take {own_ms:.1f} ms')
+
+    if failures:
+        print('\n'.join(failures), file=sys.stderr)  # noqa: WPS421
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
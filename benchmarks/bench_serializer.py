@@ -0,0 +1,70 @@
+"""Benchmark the RECORD message serializers.
+
+Formats exchange_rate_EUR records with every serializer in SERIALIZERS and
+reports records/s. The template output is checked to be byte-identical with
+singer.
+
+Usage:
+    python benchmarks/bench_serializer.py [records]
+"""
+# -*- coding: utf-8 -*-
+import io
+import sys
+import time
+from datetime import datetime, timezone
+
+import singer
+
+from tap_open_exchange.serialize import SERIALIZERS, RecordWriter
+from tap_open_exchange.streams import CURRENCIES
+
+DEFAULT_RECORDS: int = 50000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    records: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORDS
+    record: dict = {'timestamp': '2020-01-01T23:59:59.000000', 'base': 'EUR'}
+    record.update({
+        currency: None if position % 7 == 0 else 1.2345678 * position
+        for position, currency in enumerate(CURRENCIES)
+    })
+    time_extracted: datetime = datetime.now(timezone.utc)
+
+    expected: str = singer.format_message(singer.RecordMessage(
+        'exchange_rate_EUR',
+        record,
+        time_extracted=time_extracted,
+    ))
+    assert RecordWriter('exchange_rate_EUR').format(
+        record,
+        time_extracted,
+    ) == expected
+
+    for serializer in SERIALIZERS:
+        output: io.StringIO = io.StringIO()
+        writer: RecordWriter = RecordWriter(
+            'exchange_rate_EUR',
+            serializer,
+            output=output,
+        )
+
+        # The singer serializer writes to stdout
+        stdout = sys.stdout
+        sys.stdout = output
+        start: float = time.perf_counter()
+        try:
+            for _ in range(records):
+                writer.write(record, time_extracted)
+        finally:
+            sys.stdout = stdout
+        seconds: float = time.perf_counter() - start
+
+        print(  # noqa: WPS421
+            f'{writer.serializer:>10}: {records / seconds:>10,.0f} records/s '
+            f'{output.tell() / seconds / 1e6:>8,.1f} MB/s',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+"""Local stand-in for the Open Exchange Rates API.
+
+Serves api/historical/<date>.json, api/latest.json and, optionally,
+api/time-series.json with deterministic rates. The latest rates change every
+latest_period seconds and honor If-None-Match. api/usage.json counts the
+rate requests against a monthly quota. Latency, the share of 500 errors, the
+share of 429 responses and the number of currencies per response are
+configurable.
+
+Usage:
+    python benchmarks/fake_server.py [--port 8765] [--latency-ms 20]
+        [--error-rate 0] [--rate-limit-rate 0] [--currencies 168]
+        [--time-series] [--latest-period 3600] [--requests-quota 0]
+"""
+# -*- coding: utf-8 -*-
+import json
+import random
+import threading
+import time
+from argparse import ArgumentParser, Namespace
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from tap_open_exchange.streams import CURRENCIES
+
+DEFAULT_PORT: int = 8765
+DEFAULT_LATENCY_MS: float = 20.0
+DEFAULT_LATEST_PERIOD: int = 3600
+
+
+class FakeServerStats(object):
+    """Counters of a fake server."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.requests: int = 0
+        self.errors: int = 0
+        self.rate_limited: int = 0
+        self.bytes_sent: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def count(self, status: int, size: int) -> None:
+        """Count a response.
+
+        Arguments:
+            status {int} -- HTTP status
+            size {int} -- Bytes of the body
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+            if status == 429:  # noqa: WPS432
+                self.rate_limited += 1
+            elif status >= 500:  # noqa: WPS432
+                self.errors += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters.
+
+        Returns:
+            Dict[str, int] -- Counters
+        """
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'rate_limited': self.rate_limited,
+            'bytes_sent': self.bytes_sent,
+        }
+
+
+class FakeServer(object):  # noqa: WPS230
+    """Stand-in Open Exchange Rates API, served from a background thread."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        port: int = 0,
+        latency_ms: float = DEFAULT_LATENCY_MS,
+        error_rate: float = 0,
+        rate_limit_rate: float = 0,
+        currencies: int = len(CURRENCIES),
+        time_series: bool = False,
+        latest_period: int = DEFAULT_LATEST_PERIOD,
+        requests_quota: int = 0,
+    ) -> None:
+        """Initialize server.
+
+        Keyword Arguments:
+            port {int} -- Port, 0 picks a free port (default: {0})
+            latency_ms {float} -- Delay of every response (default: {20})
+            error_rate {float} -- Share of 500 responses (default: {0})
+            rate_limit_rate {float} -- Share of 429 responses (default: {0})
+            currencies {int} -- Currencies per response (default: {all})
+            time_series {bool} -- Serve the time-series endpoint, plans
+                without it get a 403 (default: {False})
+            latest_period {int} -- Seconds between changes of the latest
+                rates (default: {3600})
+            requests_quota {int} -- Rate requests per month, 0 is unlimited
+                (default: {0})
+        """
+        self.latency: float = latency_ms / 1000
+        self.error_rate: float = error_rate
+        self.rate_limit_rate: float = rate_limit_rate
+        self.currencies: Tuple[str, ...] = _currencies(currencies)
+        self.time_series: bool = time_series
+        self.latest_period: int = max(1, latest_period)
+        self.requests_quota: int = requests_quota
+        self.requests_used: int = 0
+        self.stats: FakeServerStats = FakeServerStats()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ('127.0.0.1', port),
+            _handler(self),
+        )
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the server, to be used as api_base_url.
+
+        Returns:
+            str -- e.g. http://127.0.0.1:8765/
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def start(self) -> 'FakeServer':
+        """Serve from a background thread.
+
+        Returns:
+            FakeServer -- The server
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve from the current thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeServer':
+        """Start the server.
+
+        Returns:
+            FakeServer -- The server
+        """
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the server.
+
+        Arguments:
+            args {object} -- Exception info
+        """
+        self.stop()
+
+    def respond(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, dict, dict]:
+        """Build the response to a request.
+
+        Arguments:
+            path {str} -- Path and query of the request
+
+        Keyword Arguments:
+            headers {Optional[Dict[str, str]]} -- Request headers
+
+        Returns:
+            Tuple[int, dict, dict] -- Status, headers and body
+        """
+        time.sleep(self.latency)
+
+        draw: float = random.random()  # noqa: S311
+        if draw < self.rate_limit_rate:
+            return 429, {'Retry-After': '0'}, _error(429, 'too_many_requests')
+        if draw < self.rate_limit_rate + self.error_rate:
+            return 500, {}, _error(500, 'internal_error')  # noqa: WPS432
+
+        url = urlparse(path)
+        query: Dict[str, list] = parse_qs(url.query)
+        base: str = query.get('base', ['EUR'])[0]
+
+        if url.path == '/api/usage.json':
+            return 200, {}, self.usage()
+        self.requests_used += 1
+
+        if url.path.startswith('/api/historical/'):
+            day: date = date.fromisoformat(url.path.rsplit('/', 1)[-1][:10])
+            end_of_day: datetime = datetime.combine(
+                day,
+                datetime.max.time(),
+                tzinfo=timezone.utc,
+            )
+            return 200, {}, {
+                'timestamp': int(end_of_day.timestamp()),
+                'base': base,
+                'rates': self.rates(day),
+            }
+
+        if url.path == '/api/latest.json':
+            now: int = int(time.time())
+            timestamp: int = now - now % self.latest_period
+            etag: str = f'"{timestamp}"'
+            if (headers or {}).get('If-None-Match') == etag:
+                return 304, {'ETag': etag}, {}  # noqa: WPS432
+            return 200, {'ETag': etag}, {
+                'timestamp': timestamp,
+                'base': base,
+                'rates': self.rates(
+                    datetime.fromtimestamp(timestamp, tz=timezone.utc).date(),
+                ),
+            }
+
+        if url.path == '/api/time-series.json':
+            if not self.time_series:
+                return 403, {}, _error(403, 'not_allowed')  # noqa: WPS432
+            start: date = date.fromisoformat(query['start'][0])
+            days: int = (date.fromisoformat(query['end'][0]) - start).days
+            return 200, {}, {
+                'base': base,
+                'rates': {
+                    (start + timedelta(days=offset)).isoformat(): self.rates(
+                        start + timedelta(days=offset),
+                    )
+                    for offset in range(days + 1)
+                },
+            }
+
+        return 404, {}, _error(404, 'not_found')  # noqa: WPS432
+
+    def usage(self) -> dict:
+        """Usage of the quota in the current month.
+
+        Returns:
+            dict -- Body of api/usage.json, -1 requests when unlimited
+        """
+        today: date = datetime.now(timezone.utc).date()
+        next_month: date = (today.replace(day=28) + timedelta(days=4)).replace(
+            day=1,
+        )
+        remaining: int = -1
+        if self.requests_quota:
+            remaining = max(0, self.requests_quota - self.requests_used)
+        return {
+            'status': 200,
+            'data': {
+                'status': 'active',
+                'usage': {
+                    'requests': self.requests_used,
+                    'requests_quota': self.requests_quota or -1,
+                    'requests_remaining': remaining,
+                    'days_elapsed': today.day,
+                    'days_remaining': (next_month - today).days,
+                },
+            },
+        }
+
+    def rates(self, day: date) -> Dict[str, float]:
+        """Deterministic EUR rates of a day.
+
+        Arguments:
+            day {date} -- Day
+
+        Returns:
+            Dict[str, float] -- Rate per currency
+        """
+        rates: Dict[str, float] = {
+            currency: round(1 + position + day.toordinal() % 100 / 1000, 6)
+            for position, currency in enumerate(self.currencies)
+        }
+        rates['EUR'] = 1.0
+        return rates
+
+
+def _currencies(count: int) -> Tuple[str, ...]:
+    """Return the first currencies, always including EUR.
+
+    Arguments:
+        count {int} -- Number of currencies
+
+    Returns:
+        Tuple[str, ...] -- Currencies
+    """
+    currencies: Tuple[str, ...] = CURRENCIES[:max(1, count)]
+    if 'EUR' not in currencies:
+        currencies = currencies[:-1] + ('EUR',)
+    return currencies
+
+
+def _error(status: int, message: str) -> dict:
+    """Build an API error body.
+
+    Arguments:
+        status {int} -- HTTP status
+        message {str} -- Error message
+
+    Returns:
+        dict -- Body
+    """
+    return {
+        'error': True,
+        'status': status,
+        'message': message,
+        'description': message.replace('_', ' '),
+    }
+
+
+def _handler(server: FakeServer) -> type:
+    """Create the request handler class of a server.
+
+    Arguments:
+        server {FakeServer} -- The server
+
+    Returns:
+        type -- Request handler class
+    """
+
+    class Handler(BaseHTTPRequestHandler):  # noqa: WPS431
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:  # noqa: N802
+            status, headers, body = server.respond(self.path, self.headers)
+            content: bytes = b''
+            if status != 304:  # noqa: WPS432
+                content = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            for name, header_value in headers.items():
+                self.send_header(name, header_value)
+            self.end_headers()
+            self.wfile.write(content)
+            server.stats.count(status, len(content))
+
+        def log_message(self, *args: object) -> None:
+            """Do not log requests."""
+
+    return Handler
+
+
+def main() -> None:
+    """Run the server until interrupted."""
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=DEFAULT_LATENCY_MS)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--currencies', type=int, default=len(CURRENCIES))
+    parser.add_argument('--time-series', action='store_true')
+    parser.add_argument(
+        '--latest-period',
+        type=int,
+        default=DEFAULT_LATEST_PERIOD,
+    )
+    parser.add_argument('--requests-quota', type=int, default=0)
+    args: Namespace = parser.parse_args()
+
+    server: FakeServer = FakeServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        currencies=args.currencies,
+        time_series=args.time_series,
+        latest_period=args.latest_period,
+        requests_quota=args.requests_quota,
+    )
+    print(f'Serving on {server.url}')  # noqa: WPS421
+    server.serve_forever()
+    print(server.stats.as_dict())  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    main()
@@ -12,13 +12,18 @@ setup(
     py_modules=['tap_open_exchange'],
     install_requires=[
         'httpx[http2]~=0.16.1',
+        'importlib-metadata; python_version < "3.8"',
         'python-dateutil~=2.8.1',
+        'simplejson==3.11.1',
         'singer-python~=5.10.0',
-        'requests~=2.27.1',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
     entry_points="""
         [console_scripts]
         tap-open-exchange=tap_open_exchange:main
+        tap-open-exchange-shard=tap_open_exchange.shard:main
     """,
     packages=find_packages(),
     package_data={
@@ -0,0 +1,280 @@
+"""Rolling aggregates of exchange rates per period."""
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+from datetime import date, timedelta
+from typing import (
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from tap_open_exchange.planner import DayRanges
+
+# Periods that are aggregated
+PERIODS: Tuple[str, ...] = ('week', 'month')
+
+# Positions in the accumulator of a currency
+SUM, COUNT, MINIMUM, MAXIMUM, LAST = range(5)
+
+# Bytes of the digest of an emitted period, stored as hex in the state
+DIGEST_SIZE: int = 8
+
+
+class RollingAggregates(object):
+    """Accumulators of the daily rates per period and currency.
+
+    The accumulators are kept in a dict of the state, so a run only adds its
+    new days instead of aggregating the whole history again, e.g.
+
+        {
+            'days': [['2021-01-01', '2021-02-03']],
+            'periods': {
+                'month:2021-02-01': {
+                    'last_date': '2021-02-03',
+                    'rates': {'USD': [3.63, 3, 1.2, 1.22, 1.2]},
+                    'emitted': '3f2a9c0d1e4b5a67',
+                },
+            },
+        }
+
+    The accumulator of a currency holds the sum, count, minimum, maximum and
+    last rate. Days that were aggregated before are not added again, so
+    fetching a day twice does not change the aggregates. A period is only
+    emitted when every day from its start till its last day is aggregated,
+    and only when its digest differs from the one it was last emitted with.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        periods: Sequence[str] = PERIODS,
+    ) -> None:
+        """Initialize aggregates.
+
+        Arguments:
+            state {dict} -- State of the aggregates, changed in place
+
+        Keyword Arguments:
+            periods {Sequence[str]} -- Periods to aggregate
+                (default: {('week', 'month')})
+        """
+        self.days: DayRanges = DayRanges(state.setdefault('days', []))
+        self.periods: Dict[str, dict] = state.setdefault('periods', {})
+        self.period_names: Tuple[str, ...] = tuple(periods)
+        self._changed: Set[str] = set()
+
+    def add(self, day: str, rates: Mapping[str, Optional[float]]) -> None:
+        """Add the rates of a day to the periods it belongs to.
+
+        Arguments:
+            day {str} -- Day e.g. 2021-01-01
+            rates {Mapping[str, Optional[float]]} -- Rate per currency
+        """
+        known: bool = day in self.days
+        for period in self.period_names:
+            key: str = _period_key(period, day)
+            self._changed.add(key)
+            if known:
+                continue
+
+            aggregate: dict = self.periods.setdefault(
+                key,
+                {'last_date': day, 'rates': {}},
+            )
+            latest: bool = day >= aggregate['last_date']
+            if latest:
+                aggregate['last_date'] = day
+
+            accumulators: dict = aggregate['rates']
+            for currency, rate in rates.items():
+                if rate is None:
+                    continue
+                accumulator: Optional[list] = accumulators.get(currency)
+                if accumulator is None:
+                    accumulators[currency] = [rate, 1, rate, rate, rate]
+                    continue
+                accumulator[SUM] += rate
+                accumulator[COUNT] += 1
+                accumulator[MINIMUM] = min(accumulator[MINIMUM], rate)
+                accumulator[MAXIMUM] = max(accumulator[MAXIMUM], rate)
+                if latest:
+                    accumulator[LAST] = rate
+
+        if not known:
+            self.days.add(day)
+
+    def first_day(self, day: str) -> str:
+        """Return the first day of the periods a day belongs to.
+
+        The days of its periods before a day are aggregated as well, so no
+        period is emitted from part of its days.
+
+        Arguments:
+            day {str} -- Day e.g. 2021-01-15
+
+        Returns:
+            str -- e.g. 2021-01-01
+        """
+        return min(
+            (
+                _period_key(period, day).split(':', 1)[1]
+                for period in self.period_names
+            ),
+            default=day[:10],
+        )
+
+    def touch(self, since: str) -> None:
+        """Mark the periods with a day since a date as changed.
+
+        Arguments:
+            since {str} -- Day e.g. 2021-01-01
+        """
+        self._changed.update(
+            key for key, aggregate in self.periods.items()
+            if aggregate['last_date'] >= since
+        )
+
+    def prune(self, before: str) -> None:
+        """Drop the periods that do not change anymore.
+
+        No day of a complete period whose last day is before a date is added
+        anymore, and a period that starts before the first aggregated day is
+        never complete.
+
+        Arguments:
+            before {str} -- Day e.g. 2021-01-01
+        """
+        first: str = self.days.first() or ''
+        for key in list(self.periods):
+            period, start = key.split(':', 1)
+            if start < first:
+                del self.periods[key]  # noqa: WPS420
+                continue
+            if self.periods[key]['last_date'] >= before:
+                continue
+            if next(self.days.missing(start, _period_end(period, start)), ''):
+                continue
+            del self.periods[key]  # noqa: WPS420
+
+    def changed(self, base: str) -> Generator[dict, None, None]:
+        """Yield the records of the periods that changed since the last call.
+
+        A period that was emitted with the same digest before is left out.
+        The digest of a period is stored once its records are emitted, i.e.
+        when the record after them is asked for, so a run that stops before
+        emits the period again.
+
+        Arguments:
+            base {str} -- Base currency of the rates e.g. EUR
+
+        Yields:
+            Generator[dict] -- A record per period and currency, in order of
+                the last day of the period, without the periods that miss
+                days
+        """
+        keys: List[str] = sorted(
+            (
+                key for key in self._changed
+                if key in self.periods and not self._partial(key)
+            ),
+            key=lambda key: (self.periods[key]['last_date'], key),
+        )
+        self._changed.clear()
+
+        for key in keys:
+            period, start = key.split(':', 1)
+            aggregate: dict = self.periods[key]
+            digest: str = _digest(aggregate)
+            if aggregate.get('emitted') == digest:
+                continue
+
+            for currency, accumulator in sorted(aggregate['rates'].items()):
+                yield {
+                    'date': aggregate['last_date'],
+                    'period': period,
+                    'period_start': start,
+                    'period_end': _period_end(period, start),
+                    'base': base,
+                    'currency': currency,
+                    'days': accumulator[COUNT],
+                    'average': accumulator[SUM] / accumulator[COUNT],
+                    'minimum': accumulator[MINIMUM],
+                    'maximum': accumulator[MAXIMUM],
+                    'last': accumulator[LAST],
+                }
+            aggregate['emitted'] = digest
+
+    def _partial(self, key: str) -> bool:
+        """Whether days before the last day of a period are missing.
+
+        Arguments:
+            key {str} -- Key of the period e.g. month:2021-01-01
+
+        Returns:
+            bool -- True when the period misses days
+        """
+        start: str = key.split(':', 1)[1]
+        last_date: str = self.periods[key]['last_date']
+        return bool(next(self.days.missing(start, last_date), ''))
+
+
+def _digest(aggregate: dict) -> str:
+    """Return the digest of the last day and accumulators of a period.
+
+    Arguments:
+        aggregate {dict} -- Aggregate of a period
+
+    Returns:
+        str -- Hex digest e.g. 3f2a9c0d1e4b5a67
+    """
+    return hashlib.blake2b(
+        json.dumps(
+            [aggregate['last_date'], aggregate['rates']],
+            sort_keys=True,
+            separators=(',', ':'),
+        ).encode(),
+        digest_size=DIGEST_SIZE,
+    ).hexdigest()
+
+
+def _period_key(period: str, day: str) -> str:
+    """Return the key of the period of a day.
+
+    Arguments:
+        period {str} -- week or month
+        day {str} -- Day e.g. 2021-01-07
+
+    Returns:
+        str -- e.g. week:2021-01-04 or month:2021-01-01
+    """
+    parsed: date = date.fromisoformat(day[:10])
+    if period == 'week':
+        start: date = parsed - timedelta(days=parsed.weekday())
+    else:
+        start = parsed.replace(day=1)
+    return f'{period}:{start.isoformat()}'
+
+
+def _period_end(period: str, start: str) -> str:
+    """Return the last day of a period.
+
+    Arguments:
+        period {str} -- week or month
+        start {str} -- First day of the period e.g. 2021-01-01
+
+    Returns:
+        str -- e.g. 2021-01-31
+    """
+    first: date = date.fromisoformat(start)
+    if period == 'week':
+        return (first + timedelta(days=6)).isoformat()
+    next_month: date = (first.replace(day=28) + timedelta(days=4)).replace(
+        day=1,
+    )
+    return (next_month - timedelta(days=1)).isoformat()
@@ -0,0 +1,268 @@
+"""Memory-mapped archive of daily exchange rates."""
+# -*- coding: utf-8 -*-
+import json
+import math
+import mmap
+import os
+import sys
+from array import array
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from tap_open_exchange.streams import STREAMS
+
+# Rows are days counted from the first day Open Exchange Rates has rates for
+ORIGIN: int = date(1999, 1, 1).toordinal()
+
+# Rows added at once when the archive grows
+GROW_ROWS: int = 366
+
+TIMESTAMP_FORMAT: str = '%Y-%m-%dT%H:%M:%S.%f'
+
+NAN_BYTES: bytes = array('d', [math.nan]).tobytes()
+
+
+class RateArchive(object):  # noqa: WPS214, WPS230
+    """Dates x currencies matrix of exchange rates of one base.
+
+    The rates are stored as a float64 matrix in <base>.f64, one row per day
+    and one column per key of the exchange rate mapping, the timestamp column
+    holds seconds since the epoch. Missing values and days are NaN. The
+    columns and the number of rows are kept in <base>.index.json.
+
+    The matrix is memory-mapped, reading a range of days returns a zero-copy
+    view on the file.
+    """
+
+    def __init__(self, directory: str, base: str = 'EUR') -> None:
+        """Open or create the archive.
+
+        Arguments:
+            directory {str} -- Directory of the archive
+
+        Keyword Arguments:
+            base {str} -- Base currency of the rates (default: {'EUR'})
+
+        Raises:
+            ValueError: When the archive was written on another platform
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.base: str = base
+        self.data_path: str = os.path.join(directory, f'{base}.f64')
+        self.index_path: str = os.path.join(directory, f'{base}.index.json')
+
+        index: dict = self._load_index()
+        if index.get('byteorder', sys.byteorder) != sys.byteorder:
+            raise ValueError(
+                f'Archive {self.data_path} has another byte order',
+            )
+
+        self.columns: Tuple[str, ...] = tuple(index['columns'])
+        self.column_index: Dict[str, int] = {
+            column: position for position, column in enumerate(self.columns)
+        }
+        self.rows: int = index.get('rows', 0)
+
+        self._file = open(self.data_path, 'a+b')  # noqa: WPS515
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._map()
+
+    def append(self, record: dict) -> None:
+        """Write a cleaned record to the row of its day.
+
+        Arguments:
+            record {dict} -- Cleaned exchange rate record
+        """
+        row: int = _row(record['timestamp'][:10])
+        if row < 0:
+            return
+        if row >= self.capacity:
+            self._grow(row + 1)
+
+        values: array = array('d', [math.nan]) * len(self.columns)
+        for column, position in self.column_index.items():
+            value = record.get(column)
+            if column == 'timestamp':
+                value = _epoch(value)
+            if value is not None:
+                values[position] = value
+
+        width: int = len(self.columns)
+        self._view[row * width:(row + 1) * width] = values  # type: ignore
+        self.rows = max(self.rows, row + 1)
+
+    def read(self, start_day: str, end_day: str) -> memoryview:
+        """Return the rows of a range of days as a zero-copy view.
+
+        The view must be released before the archive grows or closes.
+
+        Arguments:
+            start_day {str} -- First day e.g. 2020-01-01
+            end_day {str} -- Last day e.g. 2020-01-31
+
+        Returns:
+            memoryview -- Flat float64 view of the rows, row by row, empty
+                when the archive has no data
+        """
+        if self._view is None:
+            return memoryview(array('d'))
+
+        width: int = len(self.columns)
+        start: int = min(max(_row(start_day), 0), self.rows)
+        end: int = min(max(_row(end_day) + 1, start), self.rows)
+        return self._view[start * width:end * width]  # type: ignore
+
+    def day(self, date_day: str) -> Optional[dict]:
+        """Return the record of a day.
+
+        Arguments:
+            date_day {str} -- Day e.g. 2020-01-01
+
+        Returns:
+            Optional[dict] -- Record as cleaned or None when not archived
+        """
+        values: memoryview = self.read(date_day, date_day)
+        if not values or math.isnan(values[0]):
+            return None
+
+        record: dict = {
+            column: None if math.isnan(value) else value
+            for column, value in zip(self.columns, values)
+        }
+        record['timestamp'] = datetime.fromtimestamp(
+            record['timestamp'],
+            tz=timezone.utc,
+        ).strftime(TIMESTAMP_FORMAT)
+        record['base'] = self.base
+        return record
+
+    def days(self) -> List[str]:
+        """Return the archived days.
+
+        Returns:
+            List[str] -- Days e.g. ['2020-01-01', '2020-01-02']
+        """
+        if self._view is None:
+            return []
+
+        width: int = len(self.columns)
+        return [
+            date.fromordinal(ORIGIN + row).isoformat()
+            for row in range(self.rows)
+            if not math.isnan(self._view[row * width])  # type: ignore
+        ]
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of rows the data file has room for.
+
+        Returns:
+            int -- Rows
+        """
+        if self._view is None:
+            return 0
+        return len(self._view) // len(self.columns)
+
+    def flush(self) -> None:
+        """Write the matrix and the index to disk."""
+        if self._mmap is not None:
+            self._mmap.flush()
+
+        temporary: str = f'{self.index_path}.tmp'
+        with open(temporary, 'w') as index_file:
+            json.dump(
+                {
+                    'base': self.base,
+                    'byteorder': sys.byteorder,
+                    'columns': self.columns,
+                    'rows': self.rows,
+                },
+                index_file,
+            )
+        os.replace(temporary, self.index_path)
+
+    def close(self) -> None:
+        """Flush and close the archive."""
+        self.flush()
+        self._unmap()
+        self._file.close()
+
+    def _load_index(self) -> dict:
+        """Load the index or create one for a new archive.
+
+        Returns:
+            dict -- The index
+        """
+        try:
+            with open(self.index_path) as index_file:
+                return json.load(index_file)
+        except FileNotFoundError:
+            return {
+                'columns': [
+                    column
+                    for column in STREAMS['exchange_rate_EUR']['mapping']
+                    if column != 'base'
+                ],
+            }
+
+    def _map(self) -> None:
+        """Memory-map the data file."""
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._view = memoryview(self._mmap).cast('d')
+
+    def _unmap(self) -> None:
+        """Release the memory map."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _grow(self, rows: int) -> None:
+        """Extend the data file with rows of NaN.
+
+        Arguments:
+            rows {int} -- Minimum number of rows
+        """
+        capacity: int = self.capacity
+        new_capacity: int = max(rows, capacity + GROW_ROWS)
+        self._unmap()
+
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(
+            NAN_BYTES * ((new_capacity - capacity) * len(self.columns)),
+        )
+        self._file.flush()
+        self._map()
+
+
+def _row(date_day: str) -> int:
+    """Return the row of a day.
+
+    Arguments:
+        date_day {str} -- Day e.g. 2020-01-01
+
+    Returns:
+        int -- Row
+    """
+    return date.fromisoformat(date_day).toordinal() - ORIGIN
+
+
+def _epoch(timestamp: Optional[str]) -> Optional[float]:
+    """Convert a record timestamp to seconds since the epoch.
+
+    Arguments:
+        timestamp {Optional[str]} -- e.g. 2020-01-01T23:59:59.000000
+
+    Returns:
+        Optional[float] -- Seconds since the epoch
+    """
+    if not timestamp:
+        return None
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(
+        tzinfo=timezone.utc,
+    ).timestamp()
@@ -0,0 +1,219 @@
+"""On-disk cache of raw API responses."""
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import singer
+
+from tap_open_exchange.fetcher import CacheKey
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Days after which the rates of a day are considered final
+DEFAULT_SETTLE_DAYS: int = 1
+
+# Length of the hex digest on the first line of a cache file
+DIGEST_SIZE: int = 64
+
+# Suffix of the temporary file of a write in progress
+TEMPORARY_SUFFIX: str = '.tmp'
+
+# Seconds after which a temporary file is left over from an interrupted write
+TEMPORARY_MAX_AGE: int = 3600
+
+
+class ResponseCache(object):
+    """Cache raw responses of days whose rates do not change anymore.
+
+    Every response is stored in its own file, named after its key, e.g.
+    historical/EUR/2020-01-01.json. The first line of the file holds the
+    SHA-256 digest of the response, a file that does not match its digest is
+    discarded. Files are evicted by age and by total size, least recently
+    used first.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_age_days: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        settle_days: int = DEFAULT_SETTLE_DAYS,
+    ) -> None:
+        """Initialize cache.
+
+        Arguments:
+            directory {str} -- Directory of the cache
+
+        Keyword Arguments:
+            max_age_days {Optional[float]} -- Evict files older than this
+            max_bytes {Optional[int]} -- Evict files above this total size
+            settle_days {int} -- Days before the rates of a day are cached
+        """
+        self.directory: str = directory
+        self.max_age_days: Optional[float] = max_age_days
+        self.max_bytes: Optional[int] = max_bytes
+        self.settle_days: int = settle_days
+        self.hits: int = 0
+        self.misses: int = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """Return the cached response.
+
+        Arguments:
+            key {CacheKey} -- Key of the response
+
+        Returns:
+            Optional[bytes] -- The raw response or None when not cached
+        """
+        path: str = self.path(key)
+        try:
+            with open(path, 'rb') as cache_file:
+                digest: bytes = cache_file.read(DIGEST_SIZE + 1)[:DIGEST_SIZE]
+                content: bytes = cache_file.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        if hashlib.sha256(content).hexdigest().encode() != digest:
+            LOGGER.warning(f'Discarding corrupt cache file {path}')
+            _remove(path)
+            self.misses += 1
+            return None
+
+        # Mark the file as recently used for the eviction
+        os.utime(path)
+        self.hits += 1
+        return content
+
+    def contains(self, key: CacheKey) -> bool:
+        """Whether a response is cached, without reading it.
+
+        Arguments:
+            key {CacheKey} -- Key of the response
+
+        Returns:
+            bool -- True when the cache has a file for the key
+        """
+        return os.path.isfile(self.path(key))
+
+    def put(self, key: CacheKey, content: bytes) -> None:
+        """Cache a response when the rates of its days are final.
+
+        Arguments:
+            key {CacheKey} -- Key of the response
+            content {bytes} -- The raw response
+        """
+        if not self.cacheable(key):
+            return
+
+        path: str = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partial file
+        temporary: str = f'{path}.{os.getpid()}{TEMPORARY_SUFFIX}'
+        with open(temporary, 'wb') as cache_file:
+            cache_file.write(hashlib.sha256(content).hexdigest().encode())
+            cache_file.write(b'\n')
+            cache_file.write(content)
+        os.replace(temporary, path)
+
+    def cacheable(self, key: CacheKey) -> bool:
+        """Whether the rates of every day of the key are final.
+
+        Arguments:
+            key {CacheKey} -- Key of the response
+
+        Returns:
+            bool -- True when the response can be cached
+        """
+        settled: date = datetime.now(timezone.utc).date() - timedelta(
+            days=self.settle_days,
+        )
+        return date.fromisoformat(key.last_day) < settled
+
+    def path(self, key: CacheKey) -> str:
+        """Return the path of the cache file of a key.
+
+        Arguments:
+            key {CacheKey} -- Key of the response
+
+        Returns:
+            str -- Path e.g. <directory>/historical/EUR/2020-01-01.json
+        """
+        filename: str = key.date
+        if key.symbols:
+            symbols: str = hashlib.sha1(  # noqa: S303
+                key.symbols.encode(),
+            ).hexdigest()[:12]  # noqa: WPS432
+            filename = f'{filename}.{symbols}'
+        return os.path.join(
+            self.directory,
+            key.endpoint,
+            key.base,
+            f'{filename}.json',
+        )
+
+    def evict(self) -> int:
+        """Evict files by age and total size.
+
+        Temporary files are not cache entries. Those left over from an
+        interrupted write are removed, those of a write in progress kept.
+
+        Returns:
+            int -- Number of evicted files
+        """
+        files: List[Tuple[float, int, str]] = []
+        stale: float = time.time() - TEMPORARY_MAX_AGE
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path: str = os.path.join(root, filename)
+                try:
+                    stat: os.stat_result = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                if filename.endswith(TEMPORARY_SUFFIX):
+                    if stat.st_mtime < stale:
+                        _remove(path)
+                    continue
+
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        # Least recently used first
+        files.sort()
+        evicted: int = 0
+
+        if self.max_age_days is not None:
+            oldest: float = time.time() - self.max_age_days * 86400
+            while files and files[0][0] < oldest:
+                _remove(files.pop(0)[2])
+                evicted += 1
+
+        if self.max_bytes is not None:
+            total: int = sum(size for _, size, _ in files)
+            while files and total > self.max_bytes:
+                _, size, path = files.pop(0)  # noqa: WPS440
+                _remove(path)
+                total -= size
+                evicted += 1
+
+        if evicted:
+            LOGGER.info(f'Evicted {evicted} files from the response cache')
+        return evicted
+
+
+def _remove(path: str) -> None:
+    """Remove a file that may already be gone.
+
+    Arguments:
+        path {str} -- Path of the file
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
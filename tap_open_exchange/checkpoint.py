@@ -0,0 +1,90 @@
+"""State checkpoints."""
+# -*- coding: utf-8 -*-
+import time
+from typing import Optional
+
+import singer
+
+from tap_open_exchange import tools
+
+DEFAULT_EVERY_RECORDS: int = 1000
+DEFAULT_EVERY_SECONDS: float = 60.0
+
+
+class Checkpointer(object):
+    """Decide when the state is written.
+
+    The state is written after every_records bookmarked records, after
+    every_seconds since the last write, or, with month_boundary, when the
+    bookmark enters a new month. flush() always writes pending changes and is
+    called when a stream ends or the sync stops.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        every_records: Optional[int] = DEFAULT_EVERY_RECORDS,
+        every_seconds: Optional[float] = DEFAULT_EVERY_SECONDS,
+        month_boundary: bool = False,
+    ) -> None:
+        """Initialize checkpointer.
+
+        Arguments:
+            state {dict} -- Tap state
+
+        Keyword Arguments:
+            every_records {Optional[int]} -- Records between writes
+            every_seconds {Optional[float]} -- Seconds between writes
+            month_boundary {bool} -- Write when a month is complete
+        """
+        self.state: dict = state
+        self.every_records: Optional[int] = every_records
+        self.every_seconds: Optional[float] = every_seconds
+        self.month_boundary: bool = month_boundary
+        self.writes: int = 0
+        self._pending: int = 0
+        self._last_write: float = time.monotonic()
+        self._last_month: Optional[str] = None
+
+    def update(self, bookmark: str) -> None:
+        """Register a bookmark update and write the state when it is due.
+
+        Arguments:
+            bookmark {str} -- The new bookmark e.g. 2020-01-02
+        """
+        self._pending += 1
+
+        # The bookmark is the next day to sync, a new month means the
+        # previous month is complete
+        month: str = bookmark[:7]
+        new_month: bool = (
+            self.month_boundary
+            and self._last_month is not None
+            and month != self._last_month
+        )
+        self._last_month = month
+
+        if (
+            new_month
+            or (self.every_records and self._pending >= self.every_records)
+            or (
+                self.every_seconds is not None
+                and time.monotonic() - self._last_write >= self.every_seconds
+            )
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the state if it has pending changes."""
+        if not self._pending:
+            return
+
+        # Clear currently syncing
+        tools.clear_currently_syncing(self.state)
+
+        # Write the bootmark
+        singer.write_state(self.state)
+
+        self.writes += 1
+        self._pending = 0
+        self._last_write = time.monotonic()
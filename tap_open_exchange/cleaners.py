@@ -2,11 +2,35 @@
 # -*- coding: utf-8 -*-
 
 import collections
-from types import MappingProxyType
+from functools import partial
+from itertools import repeat
 from tap_open_exchange.streams import STREAMS
-from typing import Any, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from datetime import datetime, timezone
 
+# Keys of a response outside of its rates
+RESPONSE_KEYS: frozenset = frozenset(('timestamp', 'base'))
+
+CLEANER_TEMPLATE: str = """
+def clean(date_day, response_data):
+    rate = (response_data.get('rates') or {{}}).get
+    return {{
+        {fields}
+    }}
+"""
+
+
 class ConvertionError(ValueError):
     """Failed to convert value."""
 
@@ -90,198 +114,182 @@ def clean_row(row: dict, mapping: dict) -> dict:
     return cleaned
 
 
-def clean_exchange_rate_EUR(
-    date_day: str,
-    response_data: dict,
-) -> dict:
-    """Clean exchange rate data with base USD.
+def compile_plan(
+    stream_name: str,
+) -> List[Tuple[str, str, bool, Optional[Callable]]]:
+    """Compile how every key of a stream is cleaned from the STREAMS mapping.
+
+    The compiled cleaners share this plan, so the cleaning rules of a stream
+    are read from its mapping in one place.
 
     Arguments:
-        response_data {dict} -- input response_data
+        stream_name {str} -- Name of the stream
 
     Returns:
-        dict -- cleaned response_data
+        List[Tuple[str, str, bool, Optional[Callable]]] -- Per key, the name
+            of the cleaned key, the key in the response, whether it is read
+            from the response instead of its rates, and the converter, None
+            when the value is used as is
+    """
+    mapping: dict = STREAMS[stream_name]['mapping']
+    plan: List[Tuple[str, str, bool, Optional[Callable]]] = []
+
+    key: str
+    key_mapping: dict
+
+    for key, key_mapping in mapping.items():
+        converter: Optional[Callable] = None
+        if key_mapping.get('type') or key_mapping.get('null', True):
+            converter = partial(
+                to_type_or_null,
+                data_type=key_mapping.get('type'),
+                nullable=key_mapping.get('null', True),
+            )
+        plan.append((
+            key_mapping.get('map') or key,
+            key,
+            key in RESPONSE_KEYS,
+            converter,
+        ))
+
+    return plan
+
+
+def compile_batch_cleaner(
+    stream_name: str,
+) -> Callable[[Sequence[Tuple[str, dict]]], Dict[str, list]]:
+    """Compile the batch cleaner of a stream from the mapping in STREAMS.
+
+    A batch cleaner cleans the responses of many days at once, column by
+    column. Every column is extracted from all responses in one pass and
+    converted once with to_type_or_null when its mapping has a type or is
+    nullable. The rows are materialized from the columns by iter_rows.
+
+    Arguments:
+        stream_name {str} -- Name of the stream
+
+    Returns:
+        Callable[[Sequence[Tuple[str, dict]]], Dict[str, list]] -- Cleaner of
+            days and their responses, returning the cleaned columns
+    """
+    plan: List[Tuple[str, str, bool, Optional[Callable]]] = compile_plan(
+        stream_name,
+    )
+
+    def clean_batch(  # noqa: WPS430
+        batch: Sequence[Tuple[str, dict]],
+    ) -> Dict[str, list]:
+        responses: List[dict] = [response_data for _, response_data in batch]
+        rates: List[dict] = [
+            response_data.get('rates') or {} for response_data in responses
+        ]
+        columns: Dict[str, list] = {}
+
+        for name, source_key, in_response, column_converter in plan:
+            column: list = list(map(
+                dict.get,
+                responses if in_response else rates,
+                repeat(source_key),
+            ))
+            if column_converter is not None:
+                column = list(map(column_converter, column))
+            columns[name] = column
+
+        return columns
+
+    return clean_batch
+
+
+def compile_cleaner(stream_name: str) -> Callable[[str, dict], dict]:
+    """Compile the cleaner of a stream from the mapping in STREAMS.
+
+    The plan of the stream is turned into the source of a function that
+    builds the cleaned dictionary in one expression, e.g.:
+
+        def clean(date_day, response_data):
+            rate = (response_data.get('rates') or {}).get
+            return {'timestamp': response_data.get('timestamp'), ...}
+
+    Keys in RESPONSE_KEYS are read from the response, all other keys from its
+    rates. Values only go through their converter when the plan has one.
+
+    Arguments:
+        stream_name {str} -- Name of the stream
+
+    Returns:
+        Callable[[str, dict], dict] -- Cleaner of a day and its response
+    """
+    namespace: dict = {}
+    fields: List[str] = []
+
+    for name, source_key, in_response, converter in compile_plan(stream_name):
+        source: str = f'rate({source_key!r})'
+        if in_response:
+            source = f'response_data.get({source_key!r})'
+
+        if converter is not None:
+            converter_name: str = f'convert_{len(namespace)}'
+            namespace[converter_name] = converter
+            source = f'{converter_name}({source})'
+
+        fields.append(f'{name!r}: {source},')
+
+    code: str = CLEANER_TEMPLATE.format(fields='\n        '.join(fields))
+    exec(  # noqa: S102, WPS421
+        compile(code, f'<cleaner {stream_name}>', 'exec'),
+        namespace,
+    )
+    return namespace['clean']
+
+
+def iter_rows(columns: Dict[str, list]) -> Generator[dict, None, None]:
+    """Materialize the rows of cleaned columns.
+
+    Arguments:
+        columns {Dict[str, list]} -- Cleaned columns of a batch
+
+    Yields:
+        Generator[dict] -- Cleaned rows
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['exchange_rate_EUR'].get(
-        'mapping',
+    names: Tuple[str, ...] = tuple(columns)
+    for values in zip(*columns.values()):
+        yield dict(zip(names, values))
+
+
+def iter_long_rows(
+    columns: Dict[str, list],
+) -> Generator[dict, None, None]:
+    """Materialize the cleaned columns of a batch in long format.
+
+    Every row of the batch becomes a row per currency with a rate, currencies
+    without a rate are left out.
+
+    Arguments:
+        columns {Dict[str, list]} -- Cleaned columns of a batch
+
+    Yields:
+        Generator[dict] -- Rows with date, timestamp, base, currency and rate
+    """
+    currencies: Tuple[str, ...] = tuple(
+        name for name in columns if name not in RESPONSE_KEYS
     )
 
-    # Create new cleaned Dict
-    cleaned_data: dict = {
-        'timestamp': response_data.get('timestamp'),
-        'base': response_data.get('base'),
-        'AED': response_data.get('rates').get('AED'),
-        'AFN': response_data.get('rates').get('AFN'),
-        'ALL': response_data.get('rates').get('ALL'),
-        'AMD': response_data.get('rates').get('AMD'),
-        'ANG': response_data.get('rates').get('ANG'),
-        'AOA': response_data.get('rates').get('AOA'),
-        'ARS': response_data.get('rates').get('ARS'),
-        'AUD': response_data.get('rates').get('AUD'),
-        'AWG': response_data.get('rates').get('AWG'),
-        'AZN': response_data.get('rates').get('AZN'),
-        'BAM': response_data.get('rates').get('BAM'),
-        'BBD': response_data.get('rates').get('BBD'),
-        'BDT': response_data.get('rates').get('BDT'),
-        'BGN': response_data.get('rates').get('BGN'),
-        'BHD': response_data.get('rates').get('BHD'),
-        'BIF': response_data.get('rates').get('BIF'),
-        'BMD': response_data.get('rates').get('BMD'),
-        'BND': response_data.get('rates').get('BND'),
-        'BOB': response_data.get('rates').get('BOB'),
-        'BRL': response_data.get('rates').get('BRL'),
-        'BSD': response_data.get('rates').get('BSD'),
-        'BTN': response_data.get('rates').get('BTN'),
-        'BWP': response_data.get('rates').get('BWP'),
-        'BYN': response_data.get('rates').get('BYN'),
-        'BZD': response_data.get('rates').get('BZD'),
-        'CAD': response_data.get('rates').get('CAD'),
-        'CDF': response_data.get('rates').get('CDF'),
-        'CHF': response_data.get('rates').get('CHF'),
-        'CLF': response_data.get('rates').get('CLF'),
-        'CLP': response_data.get('rates').get('CLP'),
-        'CNH': response_data.get('rates').get('CNH'),
-        'CNY': response_data.get('rates').get('CNY'),
-        'COP': response_data.get('rates').get('COP'),
-        'CRC': response_data.get('rates').get('CRC'),
-        'CUC': response_data.get('rates').get('CUC'),
-        'CUP': response_data.get('rates').get('CUP'),
-        'CVE': response_data.get('rates').get('CVE'),
-        'CZK': response_data.get('rates').get('CZK'),
-        'DJF': response_data.get('rates').get('DJF'),
-        'DKK': response_data.get('rates').get('DKK'),
-        'DOP': response_data.get('rates').get('DOP'),
-        'DZD': response_data.get('rates').get('DZD'),
-        'EGP': response_data.get('rates').get('EGP'),
-        'ERN': response_data.get('rates').get('ERN'),
-        'ETB': response_data.get('rates').get('ETB'),
-        'EUR': response_data.get('rates').get('EUR'),
-        'FJD': response_data.get('rates').get('FJD'),
-        'FKP': response_data.get('rates').get('FKP'),
-        'GBP': response_data.get('rates').get('GBP'),
-        'GEL': response_data.get('rates').get('GEL'),
-        'GGP': response_data.get('rates').get('GGP'),
-        'GHS': response_data.get('rates').get('GHS'),
-        'GIP': response_data.get('rates').get('GIP'),
-        'GMD': response_data.get('rates').get('GMD'),
-        'GNF': response_data.get('rates').get('GNF'),
-        'GTQ': response_data.get('rates').get('GTQ'),
-        'GYD': response_data.get('rates').get('GYD'),
-        'HKD': response_data.get('rates').get('HKD'),
-        'HNL': response_data.get('rates').get('HNL'),
-        'HRK': response_data.get('rates').get('HRK'),
-        'HTG': response_data.get('rates').get('HTG'),
-        'HUF': response_data.get('rates').get('HUF'),
-        'IDR': response_data.get('rates').get('IDR'),
-        'ILS': response_data.get('rates').get('ILS'),
-        'IMP': response_data.get('rates').get('IMP'),
-        'INR': response_data.get('rates').get('INR'),
-        'IQD': response_data.get('rates').get('IQD'),
-        'IRR': response_data.get('rates').get('IRR'),
-        'ISK': response_data.get('rates').get('ISK'),
-        'JEP': response_data.get('rates').get('JEP'),
-        'JMD': response_data.get('rates').get('JMD'),
-        'JOD': response_data.get('rates').get('JOD'),
-        'JPY': response_data.get('rates').get('JPY'),
-        'KES': response_data.get('rates').get('KES'),
-        'KGS': response_data.get('rates').get('KGS'),
-        'KHR': response_data.get('rates').get('KHR'),
-        'KMF': response_data.get('rates').get('KMF'),
-        'KPW': response_data.get('rates').get('KPW'),
-        'KRW': response_data.get('rates').get('KRW'),
-        'KWD': response_data.get('rates').get('KWD'),
-        'KYD': response_data.get('rates').get('KYD'),
-        'KZT': response_data.get('rates').get('KZT'),
-        'LAK': response_data.get('rates').get('LAK'),
-        'LBP': response_data.get('rates').get('LBP'),
-        'LKR': response_data.get('rates').get('LKR'),
-        'LRD': response_data.get('rates').get('LRD'),
-        'LSL': response_data.get('rates').get('LSL'),
-        'LYD': response_data.get('rates').get('LYD'),
-        'MAD': response_data.get('rates').get('MAD'),
-        'MDL': response_data.get('rates').get('MDL'),
-        'MGA': response_data.get('rates').get('MGA'),
-        'MKD': response_data.get('rates').get('MKD'),
-        'MMK': response_data.get('rates').get('MMK'),
-        'MNT': response_data.get('rates').get('MNT'),
-        'MOP': response_data.get('rates').get('MOP'),
-        'MRU': response_data.get('rates').get('MRU'),
-        'MUR': response_data.get('rates').get('MUR'),
-        'MVR': response_data.get('rates').get('MVR'),
-        'MWK': response_data.get('rates').get('MWK'),
-        'MXN': response_data.get('rates').get('MXN'),
-        'MYR': response_data.get('rates').get('MYR'),
-        'MZN': response_data.get('rates').get('MZN'),
-        'NAD': response_data.get('rates').get('NAD'),
-        'NGN': response_data.get('rates').get('NGN'),
-        'NIO': response_data.get('rates').get('NIO'),
-        'NOK': response_data.get('rates').get('NOK'),
-        'NPR': response_data.get('rates').get('NPR'),
-        'NZD': response_data.get('rates').get('NZD'),
-        'OMR': response_data.get('rates').get('OMR'),
-        'PAB': response_data.get('rates').get('PAB'),
-        'PEN': response_data.get('rates').get('PEN'),
-        'PGK': response_data.get('rates').get('PGK'),
-        'PHP': response_data.get('rates').get('PHP'),
-        'PKR': response_data.get('rates').get('PKR'),
-        'PLN': response_data.get('rates').get('PLN'),
-        'PYG': response_data.get('rates').get('PYG'),
-        'QAR': response_data.get('rates').get('QAR'),
-        'RON': response_data.get('rates').get('RON'),
-        'RSD': response_data.get('rates').get('RSD'),
-        'RUB': response_data.get('rates').get('RUB'),
-        'RWF': response_data.get('rates').get('RWF'),
-        'SAR': response_data.get('rates').get('SAR'),
-        'SBD': response_data.get('rates').get('SBD'),
-        'SCR': response_data.get('rates').get('SCR'),
-        'SDG': response_data.get('rates').get('SDG'),
-        'SEK': response_data.get('rates').get('SEK'),
-        'SGD': response_data.get('rates').get('SGD'),
-        'SHP': response_data.get('rates').get('SHP'),
-        'SLL': response_data.get('rates').get('SLL'),
-        'SOS': response_data.get('rates').get('SOS'),
-        'SRD': response_data.get('rates').get('SRD'),
-        'SSP': response_data.get('rates').get('SSP'),
-        'STD': response_data.get('rates').get('STD'),
-        'STN': response_data.get('rates').get('STN'),
-        'SVC': response_data.get('rates').get('SVC'),
-        'SYP': response_data.get('rates').get('SYP'),
-        'SZL': response_data.get('rates').get('SZL'),
-        'THB': response_data.get('rates').get('THB'),
-        'TJS': response_data.get('rates').get('TJS'),
-        'TMT': response_data.get('rates').get('TMT'),
-        'TND': response_data.get('rates').get('TND'),
-        'TOP': response_data.get('rates').get('TOP'),
-        'TRY': response_data.get('rates').get('TRY'),
-        'TTD': response_data.get('rates').get('TTD'),
-        'TWD': response_data.get('rates').get('TWD'),
-        'TZS': response_data.get('rates').get('TZS'),
-        'UAH': response_data.get('rates').get('UAH'),
-        'UGX': response_data.get('rates').get('UGX'),
-        'USD': response_data.get('rates').get('USD'),
-        'UYU': response_data.get('rates').get('UYU'),
-        'UZS': response_data.get('rates').get('UZS'),
-        'VES': response_data.get('rates').get('VES'),
-        'VND': response_data.get('rates').get('VND'),
-        'VUV': response_data.get('rates').get('VUV'),
-        'WST': response_data.get('rates').get('WST'),
-        'XAF': response_data.get('rates').get('XAF'),
-        'XAG': response_data.get('rates').get('XAG'),
-        'XAU': response_data.get('rates').get('XAU'),
-        'XCD': response_data.get('rates').get('XCD'),
-        'XDR': response_data.get('rates').get('XDR'),
-        'XOF': response_data.get('rates').get('XOF'),
-        'XPD': response_data.get('rates').get('XPD'),
-        'XPF': response_data.get('rates').get('XPF'),
-        'XPT': response_data.get('rates').get('XPT'),
-        'YER': response_data.get('rates').get('YER'),
-        'ZAR': response_data.get('rates').get('ZAR'),
-        'ZMW': response_data.get('rates').get('ZMW'),
-        'ZWL': response_data.get('rates').get('ZWL'),
-    }
-
-    return clean_row(cleaned_data, mapping)
+    for timestamp, base, rates in zip(
+        columns['timestamp'],
+        columns['base'],
+        zip(*(columns[currency] for currency in currencies)),
+    ):
+        date_day: str = timestamp[:10]
+        for currency, rate in zip(currencies, rates):
+            if rate is not None:
+                yield {
+                    'date': date_day,
+                    'timestamp': timestamp,
+                    'base': base,
+                    'currency': currency,
+                    'rate': rate,
+                }
+
 
 def flatten(d, parent_key='', sep='_'):
     items = []
@@ -293,7 +301,65 @@ def flatten(d, parent_key='', sep='_'):
             items.append((new_key, v))
     return dict(items)
 
+
+class CompiledCleaners(Mapping):
+    """Cleaners of the streams with a mapping, compiled on first use.
+
+    Only the cleaners of the synced streams are compiled, not every cleaner
+    at import.
+    """
+
+    def __init__(self, compiler: Callable[[str], Callable]) -> None:
+        """Initialize cleaners.
+
+        Arguments:
+            compiler {Callable[[str], Callable]} -- Compiles the cleaner of a
+                stream
+        """
+        self._compiler: Callable[[str], Callable] = compiler
+        self._streams: Tuple[str, ...] = tuple(
+            stream_name for stream_name, stream_meta in STREAMS.items()
+            if 'mapping' in stream_meta
+        )
+        self._cleaners: Dict[str, Callable] = {}
+
+    def __getitem__(self, stream_name: str) -> Callable:
+        """Return the cleaner of a stream, compile it on first use.
+
+        Arguments:
+            stream_name {str} -- Name of the stream
+
+        Raises:
+            KeyError: When the stream has no mapping
+
+        Returns:
+            Callable -- The cleaner
+        """
+        if stream_name not in self._cleaners:
+            if stream_name not in self._streams:
+                raise KeyError(stream_name)
+            self._cleaners[stream_name] = self._compiler(stream_name)
+        return self._cleaners[stream_name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the streams.
+
+        Returns:
+            Iterator[str] -- Names of the streams
+        """
+        return iter(self._streams)
+
+    def __len__(self) -> int:
+        """Count the streams.
+
+        Returns:
+            int -- Number of streams
+        """
+        return len(self._streams)
+
+
+# Collect all batch cleaners
+BATCH_CLEANERS: CompiledCleaners = CompiledCleaners(compile_batch_cleaner)
+
 # Collect all cleaners
-CLEANERS: MappingProxyType = MappingProxyType({
-    'exchange_rate_EUR': clean_exchange_rate_EUR,
-})
\ No newline at end of file
+CLEANERS: CompiledCleaners = CompiledCleaners(compile_cleaner)
@@ -0,0 +1,190 @@
+"""Share the responses of a run between streams."""
+# -*- coding: utf-8 -*-
+import logging
+from collections import deque
+from datetime import date
+from typing import Deque, Dict, Generator, Iterable, Optional, Tuple
+
+import singer
+
+from tap_open_exchange.fetcher import CacheKey, Fetcher, FetchRequest
+from tap_open_exchange.metrics import RunMetrics
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Days of decoded responses kept for other streams, about 17 MB
+DEFAULT_COALESCE_DAYS: int = 1000
+
+
+class FetchCoordinator(object):
+    """Fetch identical requests of a run once.
+
+    Streams are synced one after the other and several of them fetch the
+    same days, e.g. exchange_rate_EUR and exchange_rate_bases both fetch the
+    EUR rates of every day. The decoded responses are kept by their cache
+    key, i.e. endpoint, date, base and symbols, and later requests with the
+    same key get the same response without a request or decode.
+
+    Responses are kept until they hold max_days days, later responses are
+    not kept. Streams fetch their days in order, so the next stream gets the
+    first days of the run instead of none. Kept responses are shared, so
+    consumers must not change them.
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        max_days: int = DEFAULT_COALESCE_DAYS,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        """Initialize coordinator.
+
+        Arguments:
+            fetcher {Fetcher} -- Fetcher of the requests that are not kept
+
+        Keyword Arguments:
+            max_days {int} -- Days of responses to keep, 0 keeps none
+                (default: {1000})
+            metrics {Optional[RunMetrics]} -- Run metrics (default: {None})
+        """
+        self.fetcher: Fetcher = fetcher
+        self.max_days: int = max(0, int(max_days))
+        self.metrics: RunMetrics = metrics or RunMetrics()
+        self.hits: int = 0
+        self._days: int = 0
+
+        # Response per key, and whether it was fetched bypassing the cache
+        self._responses: Dict[CacheKey, Tuple[dict, bool]] = {}
+
+    def contains(self, request: FetchRequest) -> bool:
+        """Whether a request is served from the kept responses.
+
+        Arguments:
+            request {FetchRequest} -- The request
+
+        Returns:
+            bool -- True when the response of the request is kept
+        """
+        return self._get(request) is not None
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Fetch the requests and yield the decoded responses in order.
+
+        Kept responses are yielded in between the responses of the fetcher,
+        in the order of the requests.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to fetch
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        # Requests in order, with their kept response or None when fetched
+        pending: Deque[Tuple[FetchRequest, Optional[dict]]] = deque()
+
+        def misses() -> Generator[FetchRequest, None, None]:  # noqa: WPS430
+            for request in requests:
+                response_data: Optional[dict] = self._get(request)
+                pending.append((request, response_data))
+                if response_data is None:
+                    yield request
+
+        for fetched, response_data in self.fetcher.fetch(misses()):
+            # Requests before the fetched one are kept or were skipped by
+            # the fetcher, e.g. days without local data in a replay
+            while pending:
+                request, kept = pending.popleft()
+                if request is fetched:
+                    break
+                if kept is not None:
+                    yield self._hit(request, kept)
+
+            self._keep(fetched, response_data)
+            yield fetched, response_data
+
+        while pending:
+            request, kept = pending.popleft()
+            if kept is not None:
+                yield self._hit(request, kept)
+
+    def close(self) -> None:
+        """Drop the kept responses."""
+        if self.hits:
+            LOGGER.info(f'Coalesced {self.hits} requests between streams')
+        self._responses.clear()
+        self._days = 0
+
+    def _get(self, request: FetchRequest) -> Optional[dict]:
+        """Return the kept response of a request.
+
+        A request that bypasses the cache only gets a response that bypassed
+        it as well.
+
+        Arguments:
+            request {FetchRequest} -- The request
+
+        Returns:
+            Optional[dict] -- The response or None when it is not kept
+        """
+        if request.cache_key is None:
+            return None
+        kept: Optional[Tuple[dict, bool]] = self._responses.get(
+            request.cache_key,
+        )
+        if kept is None or (request.refresh and not kept[1]):
+            return None
+        return kept[0]
+
+    def _hit(
+        self,
+        request: FetchRequest,
+        response_data: dict,
+    ) -> Tuple[FetchRequest, dict]:
+        """Count a request served from the kept responses.
+
+        Arguments:
+            request {FetchRequest} -- The request
+            response_data {dict} -- Its kept response
+
+        Returns:
+            Tuple[FetchRequest, dict] -- Request and its response
+        """
+        self.hits += 1
+        self.metrics.count('requests_coalesced')
+        return request, response_data
+
+    def _keep(self, request: FetchRequest, response_data: dict) -> None:
+        """Keep a fetched response for later requests.
+
+        Arguments:
+            request {FetchRequest} -- The request
+            response_data {dict} -- Its decoded response
+        """
+        key: Optional[CacheKey] = request.cache_key
+        if key is None:
+            return
+
+        days: int = _days(key)
+        if key not in self._responses and self._days + days > self.max_days:
+            return
+        if key not in self._responses:
+            self._days += days
+        self._responses[key] = (response_data, request.refresh)
+
+
+def _days(key: CacheKey) -> int:
+    """Return the number of days of a key.
+
+    Arguments:
+        key {CacheKey} -- Key of a response
+
+    Returns:
+        int -- e.g. 31 for 2020-01-01..2020-01-31
+    """
+    if '..' not in key.date:
+        return 1
+    first, last = key.date.split('..', 1)
+    return (date.fromisoformat(last) - date.fromisoformat(first)).days + 1
@@ -1,14 +1,104 @@
 """Discover."""
 # -*- coding: utf-8 -*-
+import hashlib
+import logging
+import marshal
+import os
+import sys
+from typing import Dict, Optional, Tuple
+
+import singer
 from singer import metadata
 from singer.catalog import Catalog, CatalogEntry
-from tap_open_exchange.schema import load_schemas
+from tap_open_exchange.schema import get_abs_path, load_schemas
 from tap_open_exchange.streams import STREAMS
 
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Directory of the cached catalogs
+CATALOG_CACHE_DIR: str = os.path.join(
+    os.environ.get('XDG_CACHE_HOME')
+    or os.path.join(os.path.expanduser('~'), '.cache'),
+    'tap-open-exchange',
+)
+
 
-def discover() -> Catalog:  # noqa: WPS210
+def discover(
+    version: Optional[str] = None,
+    cache_dir: Optional[str] = CATALOG_CACHE_DIR,
+) -> Catalog:
     """Load the Stream catalog.
 
+    Keyword Arguments:
+        version {Optional[str]} -- Package version, the catalog is cached per
+            version when given (default: {None})
+        cache_dir {Optional[str]} -- Directory of the cached catalog, None
+            does not cache it (default: {CATALOG_CACHE_DIR})
+
+    Returns:
+        Catalog -- The catalog
+    """
+    return load_catalog(version, cache_dir)[0]
+
+
+def load_catalog(
+    version: Optional[str] = None,
+    cache_dir: Optional[str] = CATALOG_CACHE_DIR,
+) -> Tuple[Catalog, Dict[str, str]]:
+    """Load the Stream catalog and the SCHEMA message of every stream.
+
+    The catalog only changes with the package, so with a version it is
+    compiled once and cached as a marshalled artifact in the cache directory.
+    When the directory cannot be written, the catalog is compiled in memory.
+
+    Keyword Arguments:
+        version {Optional[str]} -- Package version, the catalog is cached per
+            version when given (default: {None})
+        cache_dir {Optional[str]} -- Directory of the cached catalog, None
+            does not cache it (default: {CATALOG_CACHE_DIR})
+
+    Returns:
+        Tuple[Catalog, Dict[str, str]] -- The catalog and SCHEMA messages
+    """
+    path: Optional[str] = (
+        _catalog_cache_path(version, cache_dir)
+        if version and cache_dir else None
+    )
+
+    if path is not None:
+        try:
+            with open(path, 'rb') as catalog_file:
+                catalog_dict, messages = marshal.load(catalog_file)
+            return Catalog.from_dict(catalog_dict), messages
+        except (OSError, EOFError, ValueError, TypeError):
+            LOGGER.debug(f'No cached catalog at {path}')
+
+    catalog: Catalog = compile_catalog()
+    messages = {
+        stream.tap_stream_id: schema_message(stream)
+        for stream in catalog.streams
+    }
+
+    if path is not None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # Write to a temporary file first so readers never see a
+            # partial file
+            temporary: str = f'{path}.{os.getpid()}.tmp'
+            with open(temporary, 'wb') as catalog_file:
+                marshal.dump((catalog.to_dict(), messages), catalog_file)
+            os.replace(temporary, path)
+            _remove_stale_catalogs(path)
+        except OSError as err:
+            LOGGER.debug(f'Could not cache the catalog: {err}')
+
+    return catalog, messages
+
+
+def compile_catalog() -> Catalog:  # noqa: WPS210
+    """Compile the Stream catalog from the schemas.
+
     Returns:
         Catalog -- The catalog
     """
@@ -51,4 +141,77 @@ def discover() -> Catalog:  # noqa: WPS210
                 ),
             ),
         )
-    return Catalog(streams)
\ No newline at end of file
+    return Catalog(streams)
+
+
+def schema_message(stream: CatalogEntry) -> str:
+    """Format the SCHEMA message of a stream like singer.write_schema.
+
+    Arguments:
+        stream {CatalogEntry} -- Stream catalog
+
+    Returns:
+        str -- The message
+    """
+    key_properties = stream.key_properties
+    if isinstance(key_properties, str):
+        key_properties = [key_properties]
+
+    return singer.format_message(singer.SchemaMessage(
+        stream=stream.tap_stream_id,
+        schema=stream.schema.to_dict(),
+        key_properties=key_properties,
+    ))
+
+
+def _catalog_cache_path(version: str, cache_dir: str) -> str:
+    """Path of the cached catalog of a package version.
+
+    A digest of the sources that shape the catalog is part of the name, so
+    editable installs do not use a stale catalog.
+
+    Arguments:
+        version {str} -- Package version
+        cache_dir {str} -- Directory of the cached catalog
+
+    Returns:
+        str -- Path of the cached catalog
+    """
+    schemas: str = get_abs_path('schemas')
+    sources: list = [
+        get_abs_path(module)
+        for module in ('streams.py', 'schema.py', 'discover.py')
+    ] + sorted(
+        os.path.join(schemas, filename) for filename in os.listdir(schemas)
+    )
+
+    digest = hashlib.blake2b(digest_size=8)
+    for source in sources:
+        with open(source, 'rb') as source_file:
+            digest.update(source_file.read())
+
+    return os.path.join(
+        cache_dir,
+        f'catalog-{version}-{sys.implementation.cache_tag}-'
+        f'{digest.hexdigest()}.marshal',
+    )
+
+
+def _remove_stale_catalogs(path: str) -> None:
+    """Remove the cached catalogs other than the current one.
+
+    Arguments:
+        path {str} -- Path of the current cached catalog
+    """
+    directory: str = os.path.dirname(path)
+    for filename in os.listdir(directory):
+        stale: str = os.path.join(directory, filename)
+        if (
+            filename.startswith('catalog-')
+            and filename.endswith('.marshal')
+            and stale != path
+        ):
+            try:
+                os.remove(stale)
+            except OSError as err:
+                LOGGER.debug(f'Could not remove {stale}: {err}')
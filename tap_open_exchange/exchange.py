@@ -2,17 +2,70 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone, date
-from types import MappingProxyType
-from typing import Generator, Optional, Callable, List
+from itertools import groupby, islice
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-import requests
 import singer
-from dateutil.parser import isoparse
-from dateutil.rrule import DAILY, rrule
 
-from tap_open_exchange.cleaners import CLEANERS
+from tap_open_exchange.aggregates import RollingAggregates
+from tap_open_exchange.cleaners import (
+    BATCH_CLEANERS,
+    RESPONSE_KEYS,
+    iter_long_rows,
+    iter_rows,
+)
+from tap_open_exchange.coordinator import (
+    DEFAULT_COALESCE_DAYS,
+    FetchCoordinator,
+)
+from tap_open_exchange.rebase import rebase
+from tap_open_exchange.fetcher import (
+    DEFAULT_CONCURRENCY,
+    CacheKey,
+    Fetcher,
+    FetchRequest,
+    Validators,
+)
+from tap_open_exchange.metrics import RunMetrics
+from tap_open_exchange.planner import (
+    ORDERS,
+    DayRanges,
+    load_manifest,
+    plan_days,
+    schedule_days,
+)
+from tap_open_exchange.quota import (
+    DEFAULT_INCREMENTAL_DAYS,
+    DEFAULT_RESERVE_PER_DAY,
+    RequestBudget,
+    parse_usage,
+)
+from tap_open_exchange.revisions import RevisionIndex
+from tap_open_exchange.transport import ApiError, Transport
 
+if TYPE_CHECKING:
+    from tap_open_exchange.archive import RateArchive  # noqa: F401
+    from tap_open_exchange.cache import ResponseCache  # noqa: F401
+
+
+LOGGER: logging.RootLogger = singer.get_logger()
 
 API_SCHEME: str = 'https://'
 API_BASE_URL: str = 'openexchangerates.org/'
@@ -21,6 +74,31 @@ API_DATE: str = ':date:'
 API_RESPONSE_TYPE: str = '.json'
 API_KEY_VAR: str = '?app_id='
 API_XCHANGE_VAR: str = '&base='
+API_TIME_SERIES: str = 'api/time-series'
+API_LATEST: str = 'api/latest'
+API_USAGE: str = 'api/usage'
+
+# Seconds between polls of the latest rates
+LATEST_INTERVAL: float = 60.0
+
+# Maximum number of days per time-series request
+TIME_SERIES_MAX_DAYS: int = 31
+
+# Error messages of plans without access to the time-series endpoint
+TIME_SERIES_UNAVAILABLE: frozenset = frozenset((
+    'not_allowed',
+    'access_restricted',
+))
+
+# Bases of the exchange_rate_bases stream
+DEFAULT_BASES: Tuple[str, ...] = ('EUR', 'USD', 'GBP')
+
+# Days cleaned at once
+BATCH_DAYS: int = 31
+
+# Seconds from the start of a day to its last second
+END_OF_DAY: int = 86399
+
 
 class OpenExchange(object):  # noqa: WPS230
     """OpenExchange API Client."""
@@ -28,15 +106,141 @@ class OpenExchange(object):  # noqa: WPS230
     def __init__(
         self,
         api_key: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        transport: Optional[Transport] = None,
+        time_series: bool = False,
+        time_series_days: int = TIME_SERIES_MAX_DAYS,
+        bases: Sequence[str] = DEFAULT_BASES,
+        cache: Optional['ResponseCache'] = None,
+        archive: Optional['RateArchive'] = None,
+        fetcher: Optional[Fetcher] = None,
+        base_url: Optional[str] = None,
+        metrics: Optional[RunMetrics] = None,
+        end_date: Optional[str] = None,
+        latest_interval: float = LATEST_INTERVAL,
+        latest_duration: float = 0,
+        fill_gaps: bool = False,
+        manifests: Optional[Mapping[str, str]] = None,
+        lookback_days: int = 0,
+        order: str = 'oldest',
+        priority: Sequence[Union[str, list]] = (),
+        quota_state: Optional[dict] = None,
+        quota_reserve_per_day: int = DEFAULT_RESERVE_PER_DAY,
+        quota_burst: Optional[int] = None,
+        incremental_days: int = DEFAULT_INCREMENTAL_DAYS,
+        coalesce_days: int = DEFAULT_COALESCE_DAYS,
     ) -> None:
         """Initialize client.
 
         Arguments:
             api_key {str} -- OpenExchange API key
+
+        Keyword Arguments:
+            concurrency {int} -- Maximum requests in flight (default: {8})
+            transport {Optional[Transport]} -- Shared HTTP transport
+            time_series {bool} -- Fetch ranges of days (default: {False})
+            time_series_days {int} -- Days per range request (default: {31})
+            bases {Sequence[str]} -- Bases of the exchange_rate_bases stream
+            cache {Optional[ResponseCache]} -- Cache of historical responses
+            archive {Optional[RateArchive]} -- Archive of the EUR rates
+            fetcher {Optional[Fetcher]} -- Fetcher to use instead of the API
+            base_url {Optional[str]} -- URL of the API, e.g. of a stand-in
+                server (default: {https://openexchangerates.org/})
+            metrics {Optional[RunMetrics]} -- Run metrics (default: {None})
+            end_date {Optional[str]} -- Last day to sync, e.g. of a shard
+                (default: {yesterday})
+            latest_interval {float} -- Seconds between polls of the latest
+                rates (default: {60})
+            latest_duration {float} -- Seconds to keep polling the latest
+                rates, 0 polls once (default: {0})
+            fill_gaps {bool} -- Only fetch the days that are not completed
+                in the state of a stream (default: {False})
+            manifests {Optional[Mapping[str, str]]} -- Path of a manifest of
+                the days a target loaded, per stream (default: {None})
+            lookback_days {int} -- Days before the bookmark that are fetched
+                again, only revised days are emitted (default: {0})
+            order {str} -- Fetch the days oldest or newest first, any other
+                order than oldest fills gaps (default: {'oldest'})
+            priority {Sequence[Union[str, list]]} -- Days and [first, last]
+                ranges to fetch first, priority fills gaps (default: {()})
+            quota_state {Optional[dict]} -- State of the request budget of
+                backfills, without it requests are not budgeted, a budget
+                fills gaps (default: {None})
+            quota_reserve_per_day {int} -- Requests reserved for the daily
+                syncs per remaining day of the quota period (default: {10})
+            quota_burst {Optional[int]} -- Maximum requests a backfill can
+                save up (default: {None})
+            incremental_days {int} -- Days up to the last day that belong to
+                the daily sync and are not budgeted (default: {7})
+            coalesce_days {int} -- Days of responses shared between the
+                streams of a run, 0 shares none (default: {1000})
+
+        Raises:
+            ValueError: When the order is unknown
         """
+        if order not in ORDERS:
+            raise ValueError(
+                f'Unknown order {order}, expected one of {ORDERS}',
+            )
+
         self.api_key: str = api_key
+        self.end_date: Optional[date] = (
+            date.fromisoformat(end_date[:10]) if end_date else None
+        )
+        self.base_url: str = (
+            f'{base_url.rstrip("/")}/' if base_url
+            else f'{API_SCHEME}{API_BASE_URL}'
+        )
+        self.time_series: bool = time_series
+        self.time_series_days: int = max(
+            1,
+            min(int(time_series_days), TIME_SERIES_MAX_DAYS),
+        )
+        self.bases: Tuple[str, ...] = tuple(bases)
         self.logger: logging.Logger = singer.get_logger()
-    
+        self.transport: Transport = transport or Transport()
+        self.metrics: RunMetrics = metrics or RunMetrics()
+        self.fetcher: Fetcher = fetcher or Fetcher(
+            self.transport,
+            concurrency,
+            cache,
+            self.metrics,
+        )
+        self.coordinator: FetchCoordinator = FetchCoordinator(
+            self.fetcher,
+            coalesce_days,
+            self.metrics,
+        )
+        self.archive: Optional['RateArchive'] = archive
+        self.latest_interval: float = max(0.0, float(latest_interval))
+        self.latest_duration: float = max(0.0, float(latest_duration))
+        self.order: str = order
+        self.priority: Tuple[Union[str, list], ...] = tuple(priority)
+
+        # Days that are completed out of order or deferred by the request
+        # budget are tracked like gaps
+        self.fill_gaps: bool = (
+            fill_gaps
+            or order != 'oldest'
+            or bool(self.priority)
+            or quota_state is not None
+        )
+        self.manifests: Mapping[str, str] = manifests or {}
+        self.lookback_days: int = max(0, int(lookback_days))
+        self.quota_state: Optional[dict] = quota_state
+        self.quota_reserve_per_day: int = max(0, int(quota_reserve_per_day))
+        self.quota_burst: Optional[int] = quota_burst
+        self.incremental_days: int = max(1, int(incremental_days))
+        self._budget: Optional[RequestBudget] = None
+
+    def close(self) -> None:
+        """Close the connection to the API."""
+        self.coordinator.close()
+        self.fetcher.close()
+        self.logger.info(f'Transport stats: {self.transport.stats.as_dict()}')
+        if self.archive is not None:
+            self.archive.close()
+
     def exchange_rate_EUR(  # noqa: WPS210, WPS213
         self,
         **kwargs: dict,
@@ -60,47 +264,714 @@ class OpenExchange(object):  # noqa: WPS230
             raise ValueError('The parameter start_date is required.')
 
         # Get the Cleaner
-        cleaner: Callable = CLEANERS.get('exchange_rate_EUR', {})
+        cleaner: Callable = BATCH_CLEANERS['exchange_rate_EUR']
+
+        revisions: Optional[RevisionIndex] = kwargs.get(  # type: ignore
+            'revisions',
+        )
+        lookback: AbstractSet[str] = self._lookback_days(
+            start_date_input,
+            revisions,
+        )
+        days: List[str] = self._days(
+            'exchange_rate_EUR',
+            start_date_input,
+            kwargs.get('completed'),
+            lookback,
+        )
 
-        for date_day in self._start_days_till_yesterday(start_date_input):
+        for batch in _batches(
+            self._responses(days, base_var, lookback),
+            BATCH_DAYS,
+        ):
+            for record in self._revised(
+                self._clean(cleaner, batch, iter_rows),
+                revisions,
+                lookback,
+            ):
 
-            # Replace placeholder in reports path
-            from_to_date: str = API_DATE.replace(
-                ':date:',
-                date_day,
+                if self.archive is not None:
+                    self.archive.append(record)
+
+                # Yield Cleaned results
+                yield record
+
+    def exchange_rate_bases(
+        self,
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """OpenExchangeRate, every configured base currency.
+
+        The rates are fetched once per day with EUR as base, the rates of
+        every configured base are derived from them.
+
+        Yields:
+            Generator[dict] -- Yields daily exchange rates per base
+        """
+        self.logger.info(
+            f'Stream exchange rates from bases {", ".join(self.bases)}',
+        )
+
+        yield from self._rebased_records(
+            'exchange_rate_bases',
+            iter_rows,
+            **kwargs,
+        )
+
+    def exchange_rate_long(
+        self,
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """OpenExchangeRate, a record per day, base and currency.
+
+        The same rates as exchange_rate_bases in long format, for narrow fact
+        tables that do not change when a currency is added.
+
+        Yields:
+            Generator[dict] -- Yields a record per day, base and currency
+        """
+        self.logger.info(
+            'Stream exchange rates in long format from bases '
+            f'{", ".join(self.bases)}',
+        )
+
+        yield from self._rebased_records(
+            'exchange_rate_long',
+            iter_long_rows,
+            **kwargs,
+        )
+
+    def exchange_rate_aggregates(  # noqa: WPS210
+        self,
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """OpenExchangeRate, rolling aggregates of the EUR rates per period.
+
+        The average, minimum, maximum and last rate per week and month are
+        kept up to date in the state of the stream. Only the days that were
+        not aggregated yet are fetched, and only the periods they change are
+        emitted. The periods that reach the bookmark are checked again, so a
+        run that was interrupted while emitting them is completed. The first
+        run also fetches the days of its first periods before the bookmark.
+
+        Raises:
+            ValueError: When the parameter start_date is missing
+
+        Yields:
+            Generator[dict] -- Yields a record per period and currency
+        """
+        self.logger.info('Stream rolling aggregates of exchange rates')
+
+        base_var = 'EUR'
+
+        # Validate the start_date value exists
+        start_date_input: str = str(kwargs.get('start_date', ''))
+
+        if not start_date_input:
+            raise ValueError('The parameter start_date is required.')
+
+        aggregates: RollingAggregates = kwargs.get(  # type: ignore
+            'aggregates',
+        )
+        bookmark: str = start_date_input[:10]
+        aggregates.prune(bookmark)
+        aggregates.touch(bookmark)
+
+        # Get the Cleaner
+        cleaner: Callable = BATCH_CLEANERS['exchange_rate_EUR']
+
+        # Gaps, e.g. deferred by the request budget, are aggregated later.
+        # The periods of the bookmark are aggregated from their first day
+        days: List[str] = plan_days(
+            aggregates.first_day(bookmark),
+            self.last_day().isoformat(),
+            aggregates.days,
+        )
+        self.logger.info(f'Planned {len(days)} days to aggregate')
+
+        for batch in _batches(self._responses(days, base_var), BATCH_DAYS):
+            for record in self._clean(cleaner, batch, iter_rows):
+                aggregates.add(_record_day(record), {
+                    currency: rate
+                    for currency, rate in record.items()
+                    if currency not in RESPONSE_KEYS
+                })
+            yield from aggregates.changed(base_var)
+
+        # Periods that reach the bookmark when there were no new days
+        yield from aggregates.changed(base_var)
+
+        # Every period is emitted, complete periods are not needed anymore
+        aggregates.prune((self.last_day() + timedelta(days=1)).isoformat())
+
+    def exchange_rate_latest(
+        self,
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """OpenExchangeRate, latest EUR rates polled during the day.
+
+        The latest rates are polled with conditional requests. Snapshots that
+        did not change are neither decoded nor cleaned, only snapshots with a
+        provider timestamp after the last one are emitted. The time of the
+        poll of an emitted snapshot is passed to the extracted callback, the
+        waiting callback is called before every wait for the next poll.
+
+        Yields:
+            Generator[dict] -- Yields changed snapshots of the latest rates
+        """
+        self.logger.info('Stream latest exchange rates from base EUR')
+
+        base_var = 'EUR'
+
+        # Provider timestamp of the last emitted snapshot
+        last_timestamp: str = str(kwargs.get('timestamp', ''))
+
+        # Sets the extraction time of the records of a poll
+        extracted: Optional[Callable[[datetime], None]] = (
+            kwargs.get('extracted')  # type: ignore
+        )
+
+        # Flushes the records of a poll before the wait for the next one
+        waiting: Optional[Callable[[], None]] = (
+            kwargs.get('waiting')  # type: ignore
+        )
+
+        # Get the Cleaner
+        cleaner: Callable = BATCH_CLEANERS['exchange_rate_latest']
+
+        request: FetchRequest = FetchRequest(
+            'latest',
+            f'{self.base_url}{API_LATEST}{API_RESPONSE_TYPE}',
+            {'app_id': self.api_key, 'base': base_var},
+        )
+        validators: Validators = Validators()
+        deadline: float = time.monotonic() + self.latest_duration
+
+        while True:  # noqa: WPS457
+            response_data, validators = self.fetcher.poll(request, validators)
+            polled: datetime = datetime.now(timezone.utc)
+
+            if response_data is not None:
+                timestamp: str = _format_timestamp(
+                    response_data.get('timestamp'),
+                )
+                if timestamp > last_timestamp:
+                    self.logger.info(f'Latest exchange rates of {timestamp}')
+                    if extracted is not None:
+                        extracted(polled)
+                    response_data['timestamp'] = timestamp
+                    yield from self._clean(
+                        cleaner,
+                        [(timestamp[:10], response_data)],
+                        iter_rows,
+                    )
+                    last_timestamp = timestamp
+
+            if time.monotonic() + self.latest_interval > deadline:
+                return
+
+            # Records of this poll reach the target before the wait
+            if waiting is not None:
+                waiting()
+            time.sleep(self.latest_interval)
+
+    def _clean(
+        self,
+        cleaner: Callable[[Sequence[Tuple[str, dict]]], Dict[str, list]],
+        batch: Sequence[Tuple[str, dict]],
+        rows: Callable[[Dict[str, list]], Iterable[dict]],
+    ) -> List[dict]:
+        """Clean a batch and materialize its rows, as the clean phase.
+
+        Arguments:
+            cleaner {Callable} -- Batch cleaner
+            batch {Sequence[Tuple[str, dict]]} -- Days and their responses
+            rows {Callable} -- Materializes the rows of the cleaned columns
+
+        Returns:
+            List[dict] -- Cleaned rows
+        """
+        with self.metrics.timer('clean'):
+            cleaned: List[dict] = list(rows(cleaner(batch)))
+        self.metrics.count('records_cleaned', len(cleaned))
+        return cleaned
+
+    def _rebased_records(
+        self,
+        stream_name: str,
+        rows: Callable[[Dict[str, list]], Iterable[dict]],
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """Yield the cleaned records of every configured base.
+
+        The rates are fetched once per day with EUR as base, the rates of
+        every configured base are derived from them.
+
+        Arguments:
+            stream_name {str} -- Name of the stream
+            rows {Callable} -- Materializes the rows of the cleaned columns
+
+        Raises:
+            ValueError: When the parameter start_date is missing
+
+        Yields:
+            Generator[dict] -- Cleaned records
+        """
+        base_var = 'EUR'
+
+        # Validate the start_date value exists
+        start_date_input: str = str(kwargs.get('start_date', ''))
+
+        if not start_date_input:
+            raise ValueError('The parameter start_date is required.')
+
+        # Get the Cleaner
+        cleaner: Callable = BATCH_CLEANERS['exchange_rate_bases']
+
+        revisions: Optional[RevisionIndex] = kwargs.get(  # type: ignore
+            'revisions',
+        )
+        lookback: AbstractSet[str] = self._lookback_days(
+            start_date_input,
+            revisions,
+        )
+        days: List[str] = self._days(
+            stream_name,
+            start_date_input,
+            kwargs.get('completed'),
+            lookback,
+        )
+
+        for batch in _batches(
+            self._responses(days, base_var, lookback),
+            BATCH_DAYS,
+        ):
+            rebased: List[Tuple[str, dict]] = [
+                (date_day, {
+                    'timestamp': response_data.get('timestamp'),
+                    'base': base,
+                    'rates': rates,
+                })
+                for date_day, response_data in batch
+                for base, rates in rebase(
+                    response_data.get('rates') or {},
+                    base_var,
+                    self.bases,
+                )
+            ]
+            yield from self._revised(
+                self._clean(cleaner, rebased, rows),
+                revisions,
+                lookback,
             )
 
+    def _revised(
+        self,
+        records: List[dict],
+        revisions: Optional[RevisionIndex],
+        lookback: AbstractSet[str],
+    ) -> Generator[dict, None, None]:
+        """Filter the records of the lookback days that were not revised.
+
+        The records of a lookback day are only kept when their digest differs
+        from the one in the revision index. The digest of a day is stored
+        once its records are emitted, i.e. when the next record is asked for.
+
+        Arguments:
+            records {List[dict]} -- Cleaned records, in order of day
+            revisions {Optional[RevisionIndex]} -- Revision index
+            lookback {AbstractSet[str]} -- Days that were fetched again
+
+        Yields:
+            Generator[dict] -- The records of new and revised days
+        """
+        if revisions is None:
+            yield from records
+            return
+
+        for date_day, day_records in groupby(records, key=_record_day):
+            day_list: List[dict] = list(day_records)
+            if not revisions.changed(date_day, day_list):
+                if date_day in lookback:
+                    continue
+            elif date_day in lookback:
+                self.logger.info(f'Revised exchange rates of {date_day}')
+            yield from day_list
+            revisions.commit(date_day)
+
+    def _lookback_days(
+        self,
+        start_date_input: str,
+        revisions: Optional[RevisionIndex],
+    ) -> AbstractSet[str]:
+        """Return the days before the start date that are fetched again.
+
+        Arguments:
+            start_date_input {str} -- Start date e.g. 2020-01-08
+            revisions {Optional[RevisionIndex]} -- Revision index of the
+                stream, there is no lookback without one or before the
+                first days are indexed
+
+        Returns:
+            AbstractSet[str] -- Days e.g. {'2020-01-01', ..., '2020-01-07'}
+        """
+        if not self.lookback_days or revisions is None or not (
+            revisions.digests
+        ):
+            return frozenset()
+
+        start: int = date.fromisoformat(start_date_input[:10]).toordinal()
+        end: int = min(start, self.last_day().toordinal() + 1)
+        return frozenset(
+            date.fromordinal(ordinal).isoformat()
+            for ordinal in range(start - self.lookback_days, end)
+        )
+
+    def _days(
+        self,
+        stream_name: str,
+        start_date_input: str,
+        completed: Optional[list] = None,
+        lookback: AbstractSet[str] = frozenset(),
+    ) -> List[str]:
+        """Plan the days to fetch for a stream.
+
+        Every day from the start date till the last day, or with fill_gaps,
+        only the days missing from the completed days of the stream and from
+        its manifest, in the scheduled order. Lookback days are fetched as
+        well.
+
+        Arguments:
+            stream_name {str} -- Name of the stream
+            start_date_input {str} -- Start date e.g. 2020-01-01
+
+        Keyword Arguments:
+            completed {Optional[list]} -- Completed days of the stream in its
+                state, as [first, last] pairs (default: {None})
+            lookback {AbstractSet[str]} -- Days that are fetched again
+
+        Returns:
+            List[str] -- Days e.g. ['2020-01-01', '2020-01-02']
+        """
+        if not self.fill_gaps:
+            days: List[str] = list(
+                self._start_days_till_yesterday(start_date_input),
+            )
+            return sorted(lookback.union(days)) if lookback else days
+
+        manifest: Optional[DayRanges] = None
+        if self.manifests.get(stream_name):
+            manifest = load_manifest(self.manifests[stream_name])
+
+        days = plan_days(
+            start_date_input,
+            self.last_day().isoformat(),
+            DayRanges(completed or []),
+            manifest,
+        )
+        self.logger.info(f'Planned {len(days)} missing days of {stream_name}')
+        if lookback:
+            days = sorted(lookback.union(days))
+
+        return schedule_days(
+            days,
+            self.order,
+            self.priority,
+            self.time_series_days,
+        )
+
+    def _responses(
+        self,
+        days: List[str],
+        base_var: str,
+        refresh: AbstractSet[str] = frozenset(),
+    ) -> Generator[Tuple[str, dict], None, None]:
+        """Yield the response of every day.
+
+        Arguments:
+            days {List[str]} -- Days e.g. ['2020-01-01', '2020-01-02']
+            base_var {str} -- Base currency e.g. EUR
+
+        Keyword Arguments:
+            refresh {AbstractSet[str]} -- Days that are not served from the
+                response cache, e.g. to detect revisions
+
+        Yields:
+            Generator[Tuple[str, dict]] -- Day and its response
+        """
+        for date_day, response_data in self._daily_rates(
+            days,
+            base_var,
+            refresh,
+        ):
+
             self.logger.info(
                 f'Retreiving exchange rates from {date_day}'
             )
 
-            # Build URL
-            url: str = (
-                f'{API_SCHEME}{API_BASE_URL}{API_TYPE}{from_to_date}'
-                f'{API_RESPONSE_TYPE}{API_KEY_VAR}{self.api_key}{API_XCHANGE_VAR}{base_var}'
+            # Responses are shared between streams, so they are not changed
+            yield date_day, {
+                **response_data,
+                'timestamp': _format_timestamp(response_data.get('timestamp')),
+            }
+
+    def _daily_rates(
+        self,
+        days: List[str],
+        base_var: str,
+        refresh: AbstractSet[str] = frozenset(),
+    ) -> Generator[Tuple[str, dict], None, None]:
+        """Yield the raw rates of every day in the order of the days.
+
+        Days are fetched in ranges from the time-series endpoint. When the
+        plan does not allow the endpoint, every day is fetched from the
+        historical endpoint instead.
+
+        Arguments:
+            days {List[str]} -- Days e.g. ['2020-01-01', '2020-01-02']
+            base_var {str} -- Base currency e.g. EUR
+
+        Keyword Arguments:
+            refresh {AbstractSet[str]} -- Days that are not served from the
+                response cache
+
+        Raises:
+            ApiError: When the API responds with an error
+
+        Yields:
+            Generator[Tuple[str, dict]] -- Day and its raw rates
+        """
+        # Days yielded, fallback requests continue with the others
+        yielded: Set[str] = set()
+
+        if self.time_series:
+            requests: Iterable[FetchRequest] = self._budgeted(
+                self._time_series_request(
+                    window,
+                    base_var,
+                    not refresh.isdisjoint(window),
+                )
+                for window in _windows(days, self.time_series_days)
+            )
+            try:
+                for request, response_data in self.coordinator.fetch(
+                    requests,
+                ):
+                    for date_day, day_data in _split_time_series(
+                        request,
+                        response_data,
+                    ):
+                        yielded.add(date_day)
+                        yield date_day, day_data
+                return
+            except ApiError as err:
+                if (
+                    err.status != 403  # noqa: WPS432
+                    or err.message not in TIME_SERIES_UNAVAILABLE
+                ):
+                    raise
+                self.logger.warning(
+                    f'Time-series endpoint not available ({err.message}), '
+                    'falling back to one request per day',
+                )
+                self.time_series = False
+
+        # Every day is fetched concurrently, responses arrive in date order
+        requests = self._budgeted(
+            self._historical_request(date_day, base_var, date_day in refresh)
+            for date_day in days
+            if date_day not in yielded
+        )
+        for request, response_data in self.coordinator.fetch(requests):
+            yield request.key, response_data
+
+    def _budgeted(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[FetchRequest, None, None]:
+        """Defer the backfill requests that do not fit in the request budget.
+
+        Requests of the incremental days and requests the response cache
+        serves are always sent. The days of deferred requests are missing
+        from the completed days of the stream, so a later run fetches them.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to budget
+
+        Yields:
+            Generator[FetchRequest] -- Requests to send
+        """
+        if self.quota_state is None:
+            yield from requests
+            return
+
+        budget: Optional[RequestBudget] = self._request_budget()
+        incremental: str = (
+            self.last_day() - timedelta(days=self.incremental_days - 1)
+        ).isoformat()
+        deferred: int = 0
+
+        for request in requests:
+            if (
+                budget is None
+                or self._cached(request)
+                or _request_last_day(request) >= incremental
+                or budget.take()
+            ):
+                yield request
+            else:
+                deferred += 1
+
+        if deferred:
+            self.logger.warning(
+                f'Deferred {deferred} backfill requests, the request budget '
+                'is spent',
+            )
+
+    def _request_budget(self) -> Optional[RequestBudget]:
+        """Return the request budget, read from the usage of the API key.
+
+        The usage is read once per run. When it cannot be read, nothing is
+        left for backfills.
+
+        Returns:
+            Optional[RequestBudget] -- The budget, None when the quota is
+                unlimited
+        """
+        if self._budget is not None or self.quota_state is None:
+            return self._budget
+
+        request: FetchRequest = FetchRequest(
+            'usage',
+            f'{self.base_url}{API_USAGE}{API_RESPONSE_TYPE}',
+            {'app_id': self.api_key},
+        )
+        try:
+            _, response_data = next(iter(self.fetcher.fetch([request])))
+        except ApiError as err:
+            self.logger.warning(
+                f'Usage not available ({err.message}), deferring backfill '
+                'requests',
             )
+            response_data = {'data': {'usage': {'requests_remaining': 0}}}
+
+        remaining, days_remaining = parse_usage(response_data)
+        if remaining < 0:
+            self.logger.info('Request quota is unlimited')
+            self.quota_state = None
+            return None
+
+        self._budget = RequestBudget(
+            self.quota_state,
+            remaining,
+            days_remaining,
+            self.quota_reserve_per_day * max(1, days_remaining),
+            self.quota_burst,
+        )
+        return self._budget
+
+    def _cached(self, request: FetchRequest) -> bool:
+        """Whether a request is served without sending it.
+
+        Arguments:
+            request {FetchRequest} -- The request
+
+        Returns:
+            bool -- True when an earlier stream fetched the response, or it
+                is cached and not refreshed
+        """
+        if self.coordinator.contains(request):
+            return True
+
+        cache: Optional['ResponseCache'] = self.fetcher.cache
+        return bool(
+            cache is not None
+            and request.cache_key is not None
+            and not request.refresh
+            and cache.contains(request.cache_key),
+        )
+
+    def _historical_request(
+        self,
+        date_day: str,
+        base_var: str,
+        refresh: bool = False,
+    ) -> FetchRequest:
+        """Build the request for the historical rates of a day.
+
+        Arguments:
+            date_day {str} -- Day e.g. 2020-01-01
+            base_var {str} -- Base currency e.g. EUR
+
+        Keyword Arguments:
+            refresh {bool} -- Do not serve from the cache (default: {False})
 
-            response = requests.get(url)
+        Returns:
+            FetchRequest -- The request
+        """
+        # Replace placeholder in reports path
+        from_to_date: str = API_DATE.replace(
+            ':date:',
+            date_day,
+        )
 
-            # Create dictionary from response
-            response_data: dict = response.json()
+        # Build URL
+        url: str = (
+            f'{self.base_url}{API_TYPE}{from_to_date}'
+            f'{API_RESPONSE_TYPE}{API_KEY_VAR}{self.api_key}{API_XCHANGE_VAR}{base_var}'
+        )
 
-            date_converted = datetime.fromtimestamp(response_data.get('timestamp'), tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')
+        return FetchRequest(
+            date_day,
+            url,
+            cache_key=CacheKey('historical', date_day, base_var),
+            refresh=refresh,
+        )
 
-            response_data.update({'timestamp': date_converted})
+    def _time_series_request(
+        self,
+        window: List[str],
+        base_var: str,
+        refresh: bool = False,
+    ) -> FetchRequest:
+        """Build the request for the rates of a range of days.
 
-            # Yield Cleaned results
-            yield cleaner(date_day, response_data)
+        Arguments:
+            window {List[str]} -- Consecutive days
+            base_var {str} -- Base currency e.g. EUR
+
+        Keyword Arguments:
+            refresh {bool} -- Do not serve from the cache (default: {False})
+
+        Returns:
+            FetchRequest -- The request
+        """
+        url: str = (
+            f'{self.base_url}{API_TIME_SERIES}{API_RESPONSE_TYPE}'
+        )
+
+        return FetchRequest(
+            window[0],
+            url,
+            {
+                'app_id': self.api_key,
+                'start': window[0],
+                'end': window[-1],
+                'base': base_var,
+            },
+            CacheKey('time-series', f'{window[0]}..{window[-1]}', base_var),
+            refresh,
+        )
 
     def _start_days_till_yesterday(
         self,
         start_date: str,
     ) -> Generator:
-        """Yield YYYY/MM/DD for every day until now.
+        """Yield YYYY/MM/DD for every day until the last day to sync.
         Arguments:
             start_date {str} -- Start date e.g. 2020-01-01
         Yields:
-            Generator -- Every day until now.
+            Generator -- Every day until the last day to sync.
         """
         # Parse input date
         year: int = int(start_date.split('-')[0])
@@ -110,15 +981,158 @@ class OpenExchange(object):  # noqa: WPS230
         # Setup start period
         period: date = date(year, month, day)
 
+        # Yield dates in YYYY-MM-DD format
+        yield from (
+            date.fromordinal(ordinal).isoformat()
+            for ordinal in range(
+                period.toordinal(),
+                self.last_day().toordinal() + 1,
+            )
+        )
+
+    def last_day(self) -> date:
+        """Return the last day to sync.
+
+        Returns:
+            date -- Yesterday, or the end date when it is earlier
+        """
         # Calculate yesterday's date
-        yesterday = datetime.utcnow() - timedelta(days=1)
+        yesterday: date = datetime.now(timezone.utc).date() - timedelta(days=1)
+
+        if self.end_date is not None and self.end_date < yesterday:
+            return self.end_date
+        return yesterday
+
+
+def _format_timestamp(timestamp: Optional[int]) -> str:
+    """Format the Unix timestamp of a response.
+
+    Arguments:
+        timestamp {Optional[int]} -- Unix timestamp, e.g. 1609545599
+
+    Returns:
+        str -- e.g. 2021-01-01T23:59:59.000000
+    """
+    return datetime.fromtimestamp(
+        timestamp,  # type: ignore
+        tz=timezone.utc,
+    ).strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+def _request_last_day(request: FetchRequest) -> str:
+    """Return the last day a request fetches.
+
+    Arguments:
+        request {FetchRequest} -- Historical or time-series request
+
+    Returns:
+        str -- e.g. 2021-01-31
+    """
+    if request.cache_key is not None:
+        return request.cache_key.last_day
+    return request.key
+
+
+def _record_day(record: dict) -> str:
+    """Return the day of a cleaned record.
+
+    Arguments:
+        record {dict} -- Cleaned record
+
+    Returns:
+        str -- e.g. 2021-01-01
+    """
+    return record['timestamp'][:10]
+
+
+def _windows(
+    days: List[str],
+    max_days: int,
+) -> Generator[List[str], None, None]:
+    """Split days in windows of consecutive days.
+
+    Arguments:
+        days {List[str]} -- Ascending days e.g. ['2020-01-01', '2020-01-02']
+        max_days {int} -- Maximum days per window
 
-        # Setup itterator
-        dates: rrule = rrule(
-            freq=DAILY,
-            dtstart=period,
-            until=yesterday,
+    Yields:
+        Generator[List[str]] -- Window of consecutive days
+    """
+    window: List[str] = []
+    previous: int = 0
+
+    for date_day in days:
+        ordinal: int = date.fromisoformat(date_day).toordinal()
+
+        # Start a new window after a gap or when the window is full
+        if window and (ordinal != previous + 1 or len(window) >= max_days):
+            yield window
+            window = []
+
+        window.append(date_day)
+        previous = ordinal
+
+    if window:
+        yield window
+
+
+def _split_time_series(
+    request: FetchRequest,
+    response_data: dict,
+) -> Generator[Tuple[str, dict], None, None]:
+    """Split a time-series response into historical responses per day.
+
+    The time-series endpoint has no timestamp per day, the last second of the
+    day is used instead.
+
+    Arguments:
+        request {FetchRequest} -- The time-series request
+        response_data {dict} -- The time-series response
+
+    Yields:
+        Generator[Tuple[str, dict]] -- Day and its raw rates
+    """
+    rates: dict = response_data.get('rates') or {}
+    start: date = date.fromisoformat(request.params['start'])  # type: ignore
+    end: date = date.fromisoformat(request.params['end'])  # type: ignore
+
+    for ordinal in range(start.toordinal(), end.toordinal() + 1):
+        date_day: str = date.fromordinal(ordinal).isoformat()
+        day_rates: Optional[dict] = rates.get(date_day)
+
+        if day_rates is None:
+            LOGGER.warning(f'No exchange rates for {date_day} in time-series')
+            continue
+
+        midnight: datetime = datetime.combine(
+            date.fromordinal(ordinal),
+            datetime.min.time(),
+            tzinfo=timezone.utc,
         )
 
-        # Yield dates in YYYY-MM-DD format
-        yield from (date_day.strftime('%Y-%m-%d') for date_day in dates)
\ No newline at end of file
+        yield date_day, {
+            'timestamp': int(midnight.timestamp()) + END_OF_DAY,
+            'base': response_data.get('base'),
+            'rates': day_rates,
+        }
+
+
+def _batches(
+    items: Iterable[Tuple[str, dict]],
+    size: int,
+) -> Generator[List[Tuple[str, dict]], None, None]:
+    """Group items in lists of at most size items.
+
+    Arguments:
+        items {Iterable[Tuple[str, dict]]} -- Days and their responses
+        size {int} -- Maximum items per list
+
+    Yields:
+        Generator[List[Tuple[str, dict]]] -- Batch of items
+    """
+    iterator: Iterator[Tuple[str, dict]] = iter(items)
+    while True:  # noqa: WPS457
+        batch: List[Tuple[str, dict]] = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,308 @@
+"""Concurrent fetch engine."""
+# -*- coding: utf-8 -*-
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Generator,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import singer
+
+from tap_open_exchange.metrics import RunMetrics
+from tap_open_exchange.transport import Transport
+
+if TYPE_CHECKING:
+    from tap_open_exchange.cache import ResponseCache  # noqa: F401
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+DEFAULT_CONCURRENCY: int = 8
+
+# Number of requests scheduled ahead per unit of concurrency
+PREFETCH_FACTOR: int = 2
+
+
+class CacheKey(NamedTuple):
+    """Identity of the response of a request.
+
+    It keys the response cache, the responses shared between streams and
+    replayed responses. The date is a day e.g. 2020-01-01 or a range e.g.
+    2020-01-01..2020-01-31.
+    """
+
+    endpoint: str
+    date: str
+    base: str
+    symbols: Optional[str] = None
+
+    @property
+    def last_day(self) -> str:
+        """Return the last day of the date.
+
+        Returns:
+            str -- Last day e.g. 2020-01-31
+        """
+        return self.date.rsplit('..', 1)[-1]
+
+
+class FetchRequest(NamedTuple):
+    """A single API request.
+
+    The key identifies the request for the caller, e.g. the day it fetches.
+    Requests with a cache key are served from the response cache if possible,
+    unless they refresh the cached response.
+    """
+
+    key: str
+    url: str
+    params: Optional[dict] = None
+    cache_key: Optional[CacheKey] = None
+    refresh: bool = False
+
+
+class Validators(NamedTuple):
+    """What is known about the last response of a polled request.
+
+    The ETag and Last-Modified headers make the next request conditional, the
+    digest of the payload detects unchanged responses of servers without
+    them.
+    """
+
+    etag: str = ''
+    last_modified: str = ''
+    digest: str = ''
+
+
+class Fetcher(object):
+    """Fetch API requests concurrently over one multiplexed connection.
+
+    Requests are sent through the transport, over a single HTTP/2 connection
+    with at most `concurrency` requests in flight. Responses are yielded in
+    the order the requests were given, so the caller can consume them as a
+    plain iterator.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        cache: Optional['ResponseCache'] = None,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        """Initialize fetcher.
+
+        Arguments:
+            transport {Transport} -- Transport to send requests with
+
+        Keyword Arguments:
+            concurrency {int} -- Maximum requests in flight (default: {8})
+            cache {Optional[ResponseCache]} -- Response cache (default: {None})
+            metrics {Optional[RunMetrics]} -- Run metrics (default: {None})
+        """
+        self.transport: Transport = transport
+        self.cache: Optional['ResponseCache'] = cache
+        self.metrics: RunMetrics = metrics or RunMetrics()
+        self.concurrency: int = max(1, int(concurrency))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Fetch the requests and yield the decoded responses in order.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to fetch
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        loop: asyncio.AbstractEventLoop = self._open()
+        window: int = self.concurrency * PREFETCH_FACTOR
+        pending: Deque[Tuple[FetchRequest, asyncio.Task]] = deque()
+
+        try:
+            for request in requests:
+                pending.append(
+                    (request, loop.create_task(self._get(request))),
+                )
+
+                # Keep a sliding window of scheduled requests, the event loop
+                # only runs while we wait on the oldest one
+                if len(pending) >= window:
+                    yield self._resolve(loop, pending.popleft())
+
+            while pending:
+                yield self._resolve(loop, pending.popleft())
+        finally:
+            # Cancel requests that are still in flight when the consumer
+            # stops early or a request failed
+            tasks: list = [task for _, task in pending]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True),
+                )
+
+    def poll(
+        self,
+        request: FetchRequest,
+        validators: Validators = Validators(),
+    ) -> Tuple[Optional[dict], Validators]:
+        """Send a conditional request for a response that changes over time.
+
+        Arguments:
+            request {FetchRequest} -- The request, it is never cached
+
+        Keyword Arguments:
+            validators {Validators} -- Validators of the last response
+
+        Returns:
+            Tuple[Optional[dict], Validators] -- The decoded response, or None
+                when it did not change, and its validators
+        """
+        return self._open().run_until_complete(
+            self._poll(request, validators),
+        )
+
+    def close(self) -> None:
+        """Close the connection and the event loop."""
+        if self.cache is not None:
+            LOGGER.info(
+                f'Response cache: {self.cache.hits} hits, '
+                f'{self.cache.misses} misses',
+            )
+            self.cache.evict()
+        if self._loop is None:
+            return
+        self._loop.run_until_complete(self.transport.aclose())
+        self._loop.close()
+        self._loop = None
+        self._semaphore = None
+
+    def _open(self) -> asyncio.AbstractEventLoop:
+        """Create the event loop and client on first use.
+
+        Returns:
+            asyncio.AbstractEventLoop -- The event loop of the fetcher
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._create_pool())
+        return self._loop
+
+    async def _create_pool(self) -> None:
+        """Create the semaphore and connection pool inside the loop."""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        await self.transport.open(self.concurrency)
+
+    async def _get(self, request: FetchRequest) -> dict:
+        """Send a request or read its response from the cache.
+
+        Arguments:
+            request {FetchRequest} -- The request
+
+        Returns:
+            dict -- The decoded response
+        """
+        cache: Optional['ResponseCache'] = None
+        if request.cache_key is not None:
+            cache = self.cache
+
+        content: Optional[bytes] = None
+        if cache is not None and not request.refresh:
+            content = cache.get(request.cache_key)  # type: ignore
+
+        if content is None:
+            async with self._semaphore:  # type: ignore
+                start: float = time.perf_counter()
+                content = await self.transport.get(request.url, request.params)
+                self.metrics.add('http_request', time.perf_counter() - start)
+            self.metrics.count('http_request_count')
+            self.metrics.count('bytes_received', len(content))
+            if cache is not None:
+                cache.put(request.cache_key, content)  # type: ignore
+
+        with self.metrics.timer('decode'):
+            return json.loads(content)
+
+    async def _poll(
+        self,
+        request: FetchRequest,
+        validators: Validators,
+    ) -> Tuple[Optional[dict], Validators]:
+        """Send a conditional request.
+
+        Arguments:
+            request {FetchRequest} -- The request
+            validators {Validators} -- Validators of the last response
+
+        Returns:
+            Tuple[Optional[dict], Validators] -- The decoded response, or None
+                when it did not change, and its validators
+        """
+        headers: dict = {}
+        if validators.etag:
+            headers['If-None-Match'] = validators.etag
+        if validators.last_modified:
+            headers['If-Modified-Since'] = validators.last_modified
+
+        async with self._semaphore:  # type: ignore
+            start: float = time.perf_counter()
+            response = await self.transport.get_response(
+                request.url,
+                request.params,
+                headers,
+            )
+            self.metrics.add('http_request', time.perf_counter() - start)
+        self.metrics.count('http_request_count')
+
+        # 304 Not Modified
+        if response.status_code == 304:  # noqa: WPS432
+            self.metrics.count('responses_unchanged')
+            return None, validators
+
+        content: bytes = response.content
+        self.metrics.count('bytes_received', len(content))
+        polled: Validators = Validators(
+            response.headers.get('ETag', ''),
+            response.headers.get('Last-Modified', ''),
+            hashlib.sha256(content).hexdigest(),
+        )
+
+        # Unchanged payload without validators, skip the decode
+        if polled.digest == validators.digest:
+            self.metrics.count('responses_unchanged')
+            return None, polled
+
+        with self.metrics.timer('decode'):
+            return json.loads(content), polled
+
+    def _resolve(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        scheduled: Tuple[FetchRequest, asyncio.Task],
+    ) -> Tuple[FetchRequest, dict]:
+        """Run the event loop until the scheduled request is done.
+
+        Arguments:
+            loop {asyncio.AbstractEventLoop} -- Event loop
+            scheduled {Tuple[FetchRequest, asyncio.Task]} -- Request and task
+
+        Returns:
+            Tuple[FetchRequest, dict] -- Request and its response
+        """
+        request, task = scheduled
+        return request, loop.run_until_complete(task)
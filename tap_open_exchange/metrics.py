@@ -0,0 +1,167 @@
+"""Per-phase run metrics."""
+# -*- coding: utf-8 -*-
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator, Tuple
+
+import singer
+from singer import metrics
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+DEFAULT_LOG_INTERVAL: float = metrics.DEFAULT_LOG_INTERVAL
+
+# Phases of a run, each is emitted as a <phase>_duration timer
+PHASES: Tuple[str, ...] = (
+    'http_request',
+    'decode',
+    'clean',
+    'serialize',
+    'write',
+)
+
+# Counters of a run
+COUNTERS: Tuple[str, ...] = (
+    'http_request_count',
+    'bytes_received',
+    'responses_unchanged',
+    'requests_coalesced',
+    'records_cleaned',
+    metrics.Metric.record_count,
+)
+
+
+class RunMetrics(object):
+    """Time the phases of a run and count what passes through them.
+
+    The seconds per phase and the counters since the last emit are logged as
+    Singer METRIC messages every log_interval seconds. summary() logs the
+    totals of the run. HTTP requests overlap, so their seconds can add up to
+    more than the wall time.
+    """
+
+    def __init__(
+        self,
+        log_interval: float = DEFAULT_LOG_INTERVAL,
+    ) -> None:
+        """Initialize metrics.
+
+        Keyword Arguments:
+            log_interval {float} -- Seconds between emits (default: {60})
+        """
+        self.log_interval: float = log_interval
+        self.seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.total_seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.total_counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._last_emit: float = time.monotonic()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase.
+
+        Arguments:
+            phase {str} -- One of PHASES
+            seconds {float} -- Seconds spent in the phase
+        """
+        self.seconds[phase] += seconds
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter.
+
+        Arguments:
+            counter {str} -- One of COUNTERS
+
+        Keyword Arguments:
+            amount {int} -- Increment (default: {1})
+        """
+        self.counts[counter] += amount
+
+    @contextmanager
+    def timer(self, phase: str) -> Generator[None, None, None]:
+        """Time the block as a phase.
+
+        Arguments:
+            phase {str} -- One of PHASES
+
+        Yields:
+            Generator[None] -- The timed block
+        """
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[phase] += time.perf_counter() - start
+
+    def tick(self) -> None:
+        """Emit the metrics when the log interval has passed."""
+        if time.monotonic() - self._last_emit >= self.log_interval:
+            self.emit()
+
+    def emit(self) -> None:
+        """Emit and reset the metrics since the last emit."""
+        for phase, seconds in self.seconds.items():
+            if seconds:
+                _log('timer', f'{phase}_duration', round(seconds, 6), phase)
+            self.total_seconds[phase] += seconds
+            self.seconds[phase] = 0.0
+
+        for counter, amount in self.counts.items():
+            if amount:
+                _log('counter', counter, amount)
+            self.total_counts[counter] += amount
+            self.counts[counter] = 0
+
+        self._last_emit = time.monotonic()
+
+    def summary(self) -> None:
+        """Emit the pending metrics and the totals of the run."""
+        self.emit()
+
+        for phase, seconds in self.total_seconds.items():
+            _log(
+                'timer',
+                f'{phase}_duration',
+                round(seconds, 6),
+                phase,
+                summary=True,
+            )
+        for counter, amount in self.total_counts.items():
+            _log('counter', counter, amount, summary=True)
+
+        LOGGER.info('Run metrics: {0}'.format(', '.join([
+            f'{phase} {seconds:.3f}s'
+            for phase, seconds in self.total_seconds.items()
+        ] + [
+            f'{counter} {amount}'
+            for counter, amount in self.total_counts.items()
+        ])))
+
+
+def _log(
+    metric_type: str,
+    metric: str,
+    metric_value: float,
+    phase: str = '',
+    summary: bool = False,
+) -> None:
+    """Log a Singer METRIC message.
+
+    Arguments:
+        metric_type {str} -- timer or counter
+        metric {str} -- Metric name
+        metric_value {float} -- Value
+
+    Keyword Arguments:
+        phase {str} -- Phase of a timer (default: {''})
+        summary {bool} -- Whether the value is a run total (default: {False})
+    """
+    tags: dict = {}
+    if phase:
+        tags['phase'] = phase
+    if summary:
+        tags['summary'] = True
+    metrics.log(
+        LOGGER,
+        metrics.Point(metric_type, metric, metric_value, tags),
+    )
@@ -0,0 +1,396 @@
+"""Plan the days to fetch."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+from bisect import bisect_right
+from datetime import date
+from typing import (
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import singer
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Orders of the days to fetch
+ORDERS: Tuple[str, ...] = ('oldest', 'newest')
+
+# Days per block of consecutive days, the size of a time-series request
+DEFAULT_BLOCK_DAYS: int = 31
+
+
+class DayRanges(object):
+    """Sorted, disjoint ranges of days.
+
+    The ranges are stored as [first, last] pairs of ISO dates in a plain
+    list, e.g. the completed days of a stream in its state:
+
+        [['2020-01-01', '2020-03-31'], ['2020-04-02', '2020-04-30']]
+
+    Adjacent and overlapping ranges are merged, so a run of consecutive days
+    is a single pair however long it is.
+    """
+
+    def __init__(self, ranges: Optional[list] = None) -> None:
+        """Initialize ranges.
+
+        Keyword Arguments:
+            ranges {Optional[list]} -- [first, last] pairs, changed in place
+                (default: {None})
+        """
+        self.ranges: list = ranges if ranges is not None else []
+        self._ordinals: List[List[int]] = [
+            [_ordinal(first), _ordinal(last)] for first, last in self.ranges
+        ]
+
+    @classmethod
+    def parse(cls, days: Iterable[Union[str, list]]) -> 'DayRanges':
+        """Parse a list of days and [first, last] pairs, in any order.
+
+        Arguments:
+            days {Iterable[Union[str, list]]} -- Days and ranges of days
+
+        Returns:
+            DayRanges -- The ranges
+        """
+        ranges: DayRanges = cls()
+        for day in days:
+            if isinstance(day, str):
+                ranges.add(day)
+            else:
+                ranges.add_range(day[0], day[1])
+        return ranges
+
+    def first(self) -> Optional[str]:
+        """Return the first day.
+
+        Returns:
+            Optional[str] -- First day or None when there are no ranges
+        """
+        return self.ranges[0][0] if self.ranges else None
+
+    def last(self) -> Optional[str]:
+        """Return the last day.
+
+        Returns:
+            Optional[str] -- Last day or None when there are no ranges
+        """
+        return self.ranges[-1][1] if self.ranges else None
+
+    def add(self, day: str) -> None:
+        """Add a day.
+
+        Arguments:
+            day {str} -- Day, e.g. 2020-01-01
+        """
+        ordinal: int = _ordinal(day)
+
+        # Most days extend the last range
+        if self._ordinals and self._ordinals[-1][1] + 1 == ordinal:
+            self._ordinals[-1][1] = ordinal
+            self.ranges[-1][1] = day[:10]
+            return
+
+        self.add_range(day, day)
+
+    def add_range(self, first: str, last: str) -> None:
+        """Add the days of a range.
+
+        Arguments:
+            first {str} -- First day, e.g. 2020-01-01
+            last {str} -- Last day, e.g. 2020-01-31
+        """
+        start: int = _ordinal(first)
+        end: int = _ordinal(last)
+        if end < start:
+            return
+
+        # Ranges that overlap or touch the new range are merged into it
+        low: int = bisect_right(
+            [range_end + 1 for _, range_end in self._ordinals],
+            start - 1,
+        )
+        high: int = low
+        while high < len(self._ordinals) and (
+            self._ordinals[high][0] <= end + 1
+        ):
+            start = min(start, self._ordinals[high][0])
+            end = max(end, self._ordinals[high][1])
+            high += 1
+
+        self._ordinals[low:high] = [[start, end]]
+        self.ranges[low:high] = [[
+            date.fromordinal(start).isoformat(),
+            date.fromordinal(end).isoformat(),
+        ]]
+
+    def missing(
+        self,
+        first: str,
+        last: str,
+    ) -> Generator[str, None, None]:
+        """Yield the days from first till last that are not in the ranges.
+
+        Arguments:
+            first {str} -- First day, e.g. 2020-01-01
+            last {str} -- Last day, e.g. 2020-12-31
+
+        Yields:
+            Generator[str] -- Missing days in ascending order
+        """
+        ordinal: int = _ordinal(first)
+        end: int = _ordinal(last)
+
+        for range_start, range_end in self._ordinals:
+            if range_end < ordinal:
+                continue
+            if range_start > end:
+                break
+            for gap in range(ordinal, min(range_start, end + 1)):
+                yield date.fromordinal(gap).isoformat()
+            ordinal = max(ordinal, range_end + 1)
+
+        for rest in range(ordinal, end + 1):
+            yield date.fromordinal(rest).isoformat()
+
+    def run_end(self, day: str) -> Optional[str]:
+        """Return the last day of the range that holds or precedes a day.
+
+        Arguments:
+            day {str} -- Day, e.g. 2020-01-01
+
+        Returns:
+            Optional[str] -- Last day of the range that holds the day or ends
+                the day before it, None when there is no such range
+        """
+        ordinal: int = _ordinal(day)
+        index: int = bisect_right(
+            [range_start for range_start, _ in self._ordinals],
+            ordinal,
+        ) - 1
+        if index < 0 or self._ordinals[index][1] + 1 < ordinal:
+            return None
+        return self.ranges[index][1]
+
+    def __contains__(self, day: object) -> bool:
+        """Check whether a day is in the ranges.
+
+        Arguments:
+            day {object} -- Day, e.g. 2020-01-01
+
+        Returns:
+            bool -- Whether the day is in a range
+        """
+        if not isinstance(day, str):
+            return False
+        ordinal: int = _ordinal(day)
+        index: int = bisect_right(
+            [range_start for range_start, _ in self._ordinals],
+            ordinal,
+        ) - 1
+        return index >= 0 and ordinal <= self._ordinals[index][1]
+
+
+class DayTracker(object):
+    """Record the completed days of a stream while its records are synced.
+
+    Records arrive grouped by day, so a day is complete when the first
+    record of a later day arrives or the stream ends.
+    """
+
+    def __init__(self, ranges: DayRanges) -> None:
+        """Initialize tracker.
+
+        Arguments:
+            ranges {DayRanges} -- Completed days, changed in place
+        """
+        self.ranges: DayRanges = ranges
+        self._day: str = ''
+
+    def track(self, bookmark_value: Optional[str]) -> str:
+        """Track the day of a record.
+
+        Arguments:
+            bookmark_value {Optional[str]} -- e.g. 2020-01-01T23:59:59
+
+        Returns:
+            str -- The completed day, empty when no day was completed
+        """
+        if not bookmark_value:
+            return ''
+
+        day: str = bookmark_value[:10]
+        if day == self._day:
+            return ''
+
+        completed: str = self._day
+        self._day = day
+        if completed:
+            self.ranges.add(completed)
+        return completed
+
+    def finish(self) -> str:
+        """Complete the day of the last record.
+
+        Returns:
+            str -- The completed day, empty when there were no records
+        """
+        completed: str = self._day
+        if completed:
+            self.ranges.add(completed)
+            self._day = ''
+        return completed
+
+
+def plan_days(
+    start_date: str,
+    last_day: str,
+    completed: DayRanges,
+    manifest: Optional[DayRanges] = None,
+) -> List[str]:
+    """Plan the days that are missing.
+
+    The days from the first completed day, or the start date when it is
+    earlier, till the last day are checked. A manifest holds the days a
+    target loaded when it was written, so days until its last day are only
+    done when they are in the manifest, e.g. after the target lost them.
+    Later days are done when they are completed.
+
+    Arguments:
+        start_date {str} -- Bookmark of the stream, e.g. 2020-01-01
+        last_day {str} -- Last day to sync, e.g. yesterday
+        completed {DayRanges} -- Completed days of the stream
+
+    Keyword Arguments:
+        manifest {Optional[DayRanges]} -- Days loaded by the target
+            (default: {None})
+
+    Returns:
+        List[str] -- Missing days in ascending order
+    """
+    first: str = min(
+        start_date[:10],
+        completed.first() or start_date[:10],
+        (manifest and manifest.first()) or start_date[:10],
+    )
+
+    done: DayRanges = completed
+    if manifest is not None and manifest.ranges:
+        manifest_last: str = manifest.last()  # type: ignore
+        done = DayRanges([list(day_range) for day_range in manifest.ranges])
+        for range_first, range_last in completed.ranges:
+            if range_last > manifest_last:
+                done.add_range(max(range_first, manifest_last), range_last)
+
+    return list(done.missing(first, last_day))
+
+
+def schedule_days(  # noqa: WPS210
+    days: Sequence[str],
+    order: str = 'oldest',
+    priority: Sequence[Union[str, list]] = (),
+    block_days: int = DEFAULT_BLOCK_DAYS,
+) -> List[str]:
+    """Order the days to fetch.
+
+    The days are split in blocks of at most block_days consecutive days,
+    which stay in ascending order, so a block is still fetched with a single
+    time-series request. The blocks in the priority ranges come first, in
+    the order of the ranges, followed by the other blocks. Blocks of the same
+    rank are ordered oldest or newest first.
+
+    Arguments:
+        days {Sequence[str]} -- Ascending days e.g. ['2020-01-01', ...]
+
+    Keyword Arguments:
+        order {str} -- oldest or newest first (default: {'oldest'})
+        priority {Sequence[Union[str, list]]} -- Days and [first, last]
+            ranges to fetch first, most important first (default: {()})
+        block_days {int} -- Maximum days per block (default: {31})
+
+    Raises:
+        ValueError: When the order is unknown
+
+    Returns:
+        List[str] -- The days in the order to fetch them
+    """
+    if order not in ORDERS:
+        raise ValueError(f'Unknown order {order}, expected one of {ORDERS}')
+
+    ranges: List[Tuple[int, int]] = [
+        (_ordinal(day), _ordinal(day)) if isinstance(day, str)
+        else (_ordinal(day[0]), _ordinal(day[1]))
+        for day in priority
+    ]
+
+    # Runs of consecutive days with the same rank
+    runs: List[Tuple[int, List[int]]] = []
+    for ordinal in sorted(map(_ordinal, days)):
+        rank: int = next(
+            (
+                index for index, (first, last) in enumerate(ranges)
+                if first <= ordinal <= last
+            ),
+            len(ranges),
+        )
+        if runs and runs[-1][0] == rank and runs[-1][1][-1] + 1 == ordinal:
+            runs[-1][1].append(ordinal)
+        else:
+            runs.append((rank, [ordinal]))
+
+    # Newest first blocks are cut from the end of a run, so the most recent
+    # block is full
+    newest: bool = order == 'newest'
+    blocks: List[Tuple[int, int, List[int]]] = []
+    for rank, run in runs:
+        size: int = max(1, block_days)
+        starts: Iterable[int] = range(0, len(run), size)
+        if newest:
+            starts = range(len(run) - size, -size, -size)
+        for start in starts:
+            block: List[int] = run[max(0, start):start + size]
+            blocks.append((rank, -block[0] if newest else block[0], block))
+
+    blocks.sort(key=lambda ranked: ranked[:2])
+    return [
+        date.fromordinal(ordinal).isoformat()
+        for _, _, block in blocks
+        for ordinal in block
+    ]
+
+
+def load_manifest(path: str) -> DayRanges:
+    """Load a manifest of the days a target loaded.
+
+    Arguments:
+        path {str} -- JSON file with a list of days and [first, last] pairs,
+            e.g. ["2020-01-01", ["2020-01-03", "2020-12-31"]]
+
+    Returns:
+        DayRanges -- The loaded days
+    """
+    with open(path) as manifest_file:
+        manifest: DayRanges = DayRanges.parse(json.load(manifest_file))
+    LOGGER.info(
+        f'Manifest {path}: {len(manifest.ranges)} ranges from '
+        f'{manifest.first()} till {manifest.last()}',
+    )
+    return manifest
+
+
+def _ordinal(day: str) -> int:
+    """Return the ordinal of a day.
+
+    Arguments:
+        day {str} -- Day, e.g. 2020-01-01 or 2020-01-01T00:00:00
+
+    Returns:
+        int -- Proleptic Gregorian ordinal
+    """
+    return date.fromisoformat(day[:10]).toordinal()
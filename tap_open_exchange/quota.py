@@ -0,0 +1,111 @@
+"""Request quota budgeting."""
+# -*- coding: utf-8 -*-
+import logging
+import time
+from typing import Optional, Tuple
+
+import singer
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Requests reserved per remaining day of the quota period for daily syncs
+DEFAULT_RESERVE_PER_DAY: int = 10
+
+# Days before the last day to sync that belong to the daily sync
+DEFAULT_INCREMENTAL_DAYS: int = 7
+
+SECONDS_PER_DAY: int = 86400
+
+
+class RequestBudget(object):
+    """Token bucket of the requests a backfill may send.
+
+    The requests that remain in the quota period, minus a reserve for the
+    daily syncs, are spread over the remaining days of the period. The bucket
+    refills at that rate and holds at most burst tokens, or everything that
+    is available. Its tokens are kept in a dict of the state, so the budget
+    carries over between runs.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        state: dict,
+        remaining: int,
+        days_remaining: int,
+        reserve: int,
+        burst: Optional[int] = None,
+    ) -> None:
+        """Initialize budget.
+
+        Arguments:
+            state {dict} -- State of the budget, changed in place
+            remaining {int} -- Requests remaining in the quota period
+            days_remaining {int} -- Days remaining in the quota period
+            reserve {int} -- Requests reserved for the daily syncs
+
+        Keyword Arguments:
+            burst {Optional[int]} -- Maximum tokens (default: {available})
+        """
+        available: int = max(0, remaining - reserve)
+        self.rate: float = available / max(1, days_remaining)
+        self.capacity: float = float(
+            min(burst, available) if burst else available,
+        )
+        self.state: dict = state
+
+        now: float = time.time()
+        tokens: Optional[float] = state.get('tokens')
+        if tokens is None:
+            tokens = self.capacity
+        else:
+            elapsed: float = max(0.0, now - state.get('updated', now))
+            tokens += elapsed / SECONDS_PER_DAY * self.rate
+
+        # Never more than is left in the quota after the reserve
+        self.tokens: float = min(tokens, self.capacity)
+        self.spent: int = 0
+        self._save(now)
+
+        LOGGER.info(
+            f'Request budget: {int(self.tokens)} of {remaining} remaining '
+            f'requests, {reserve} reserved for daily syncs',
+        )
+
+    def take(self) -> bool:
+        """Take a token for a request.
+
+        Returns:
+            bool -- Whether the request fits in the budget
+        """
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        self.spent += 1
+        self._save(time.time())
+        return True
+
+    def _save(self, now: float) -> None:
+        """Write the tokens to the state.
+
+        Arguments:
+            now {float} -- Unix time of the tokens
+        """
+        self.state['tokens'] = round(self.tokens, 3)
+        self.state['updated'] = round(now, 3)
+
+
+def parse_usage(response_data: dict) -> Tuple[int, int]:
+    """Read the remaining requests and days from a usage.json response.
+
+    Arguments:
+        response_data {dict} -- Response of usage.json
+
+    Returns:
+        Tuple[int, int] -- Remaining requests, -1 when unlimited, and
+            remaining days of the quota period
+    """
+    usage: dict = (response_data.get('data') or {}).get('usage') or {}
+    return (
+        int(usage.get('requests_remaining', -1)),
+        int(usage.get('days_remaining', 0)),
+    )
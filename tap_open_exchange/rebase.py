@@ -0,0 +1,49 @@
+"""Derive exchange rates of other base currencies."""
+# -*- coding: utf-8 -*-
+import logging
+from typing import Generator, List, Optional, Sequence, Tuple
+
+import singer
+
+from tap_open_exchange.streams import CURRENCIES
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+
+def rebase(
+    rates: dict,
+    fetched_base: str,
+    bases: Sequence[str],
+) -> Generator[Tuple[str, dict], None, None]:
+    """Derive the rates of every base from the rates of one fetched base.
+
+    The rates are gathered once in a vector ordered by CURRENCIES. The rates
+    of another base are the vector divided by the rate of that base, e.g.
+    USD/GBP = (USD/EUR) / (GBP/EUR).
+
+    Arguments:
+        rates {dict} -- Rates of the fetched base
+        fetched_base {str} -- Base of the rates e.g. EUR
+        bases {Sequence[str]} -- Bases to derive e.g. ['EUR', 'USD']
+
+    Yields:
+        Generator[Tuple[str, dict]] -- Base and its rates
+    """
+    vector: List[Optional[float]] = [
+        rates.get(currency) for currency in CURRENCIES
+    ]
+
+    for base in bases:
+        if base == fetched_base:
+            yield base, dict(zip(CURRENCIES, vector))
+            continue
+
+        pivot: Optional[float] = rates.get(base)
+        if not pivot:
+            LOGGER.warning(f'No {base} rate to derive the {base} base from')
+            continue
+
+        yield base, dict(zip(
+            CURRENCIES,
+            [None if rate is None else rate / pivot for rate in vector],
+        ))
@@ -0,0 +1,242 @@
+"""Offline replay of local exchange rates."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+from datetime import date, datetime, timezone
+from typing import Dict, Generator, Iterable, Optional, Tuple
+
+import singer
+
+from tap_open_exchange.archive import RateArchive
+from tap_open_exchange.cache import ResponseCache
+from tap_open_exchange.fetcher import CacheKey, FetchRequest, Validators
+from tap_open_exchange.streams import CURRENCIES
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+
+class ReplayFetcher(object):
+    """Serve historical requests from local data instead of the network.
+
+    Used in place of the Fetcher, so the normal sync path runs unchanged.
+    Only per-day historical requests are supported, days without local data
+    are skipped.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize fetcher.
+
+        Arguments:
+            path {str} -- Directory of raw responses or of a rate archive
+        """
+        self.path: str = path
+        self._archives: Dict[str, Optional[RateArchive]] = {}
+        self._cache: ResponseCache = ResponseCache(path, settle_days=0)
+        self._windows: Dict[str, Dict[str, str]] = {}
+        self._window: Tuple[str, dict] = ('', {})
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Yield the local response of every request.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to replay
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        for request in requests:
+            key: Optional[CacheKey] = request.cache_key
+            response_data: Optional[dict] = None
+            if key is not None and key.endpoint == 'historical':
+                response_data = self.day(key.base, key.date)
+
+            if response_data is None:
+                LOGGER.warning(f'No local exchange rates for {request.key}')
+                continue
+
+            yield request, response_data
+
+    def day(self, base: str, date_day: str) -> Optional[dict]:
+        """Return the raw historical response of a day.
+
+        Arguments:
+            base {str} -- Base currency e.g. EUR
+            date_day {str} -- Day e.g. 2020-01-01
+
+        Returns:
+            Optional[dict] -- The response or None when there is no local data
+        """
+        archive: Optional[RateArchive] = self._archive(base)
+        if archive is not None:
+            return _archived_response(archive, date_day)
+
+        # A response cache directory
+        content: Optional[bytes] = self._cache.get(
+            CacheKey('historical', date_day, base),
+        )
+        if content is not None:
+            return json.loads(content)
+
+        # A plain directory of responses e.g. 2020-01-01.json
+        for path in (
+            os.path.join(self.path, base, f'{date_day}.json'),
+            os.path.join(self.path, f'{date_day}.json'),
+        ):
+            if os.path.isfile(path):
+                with open(path, 'rb') as response_file:
+                    return json.load(response_file)
+
+        return self._time_series_day(base, date_day)
+
+    def poll(
+        self,
+        request: FetchRequest,
+        validators: Validators = Validators(),
+    ) -> Tuple[Optional[dict], Validators]:
+        """Latest rates are not replayed.
+
+        Arguments:
+            request {FetchRequest} -- The polled request
+
+        Keyword Arguments:
+            validators {Validators} -- Validators of the last response
+
+        Returns:
+            Tuple[Optional[dict], Validators] -- No response
+        """
+        LOGGER.warning(f'No local exchange rates for {request.key}')
+        return None, validators
+
+    def close(self) -> None:
+        """Close the archives."""
+        for archive in self._archives.values():
+            if archive is not None:
+                archive.close()
+
+    def _archive(self, base: str) -> Optional[RateArchive]:
+        """Open the rate archive of a base if the path holds one.
+
+        Arguments:
+            base {str} -- Base currency e.g. EUR
+
+        Returns:
+            Optional[RateArchive] -- The archive or None
+        """
+        if base not in self._archives:
+            index: str = os.path.join(self.path, f'{base}.index.json')
+            self._archives[base] = (
+                RateArchive(self.path, base) if os.path.isfile(index) else None
+            )
+        return self._archives[base]
+
+    def _time_series_day(self, base: str, date_day: str) -> Optional[dict]:
+        """Return a day from a cached time-series response.
+
+        Arguments:
+            base {str} -- Base currency e.g. EUR
+            date_day {str} -- Day e.g. 2020-01-01
+
+        Returns:
+            Optional[dict] -- The response or None when there is no local data
+        """
+        path: Optional[str] = self._window_paths(base).get(date_day)
+        if path is None:
+            return None
+
+        # Consecutive days are mostly in the same window, keep the last one
+        if self._window[0] != path:
+            key: CacheKey = CacheKey(
+                'time-series',
+                os.path.basename(path)[:-len('.json')],
+                base,
+            )
+            content: Optional[bytes] = self._cache.get(key)
+            self._window = (path, json.loads(content) if content else {})
+
+        rates: Optional[dict] = (self._window[1].get('rates') or {}).get(
+            date_day,
+        )
+        if rates is None:
+            return None
+
+        # Time-series responses have no timestamp, use the end of the day
+        end_of_day: datetime = datetime.combine(
+            date.fromisoformat(date_day),
+            datetime.max.time(),
+            tzinfo=timezone.utc,
+        )
+        return {
+            'timestamp': int(end_of_day.timestamp()),
+            'base': base,
+            'rates': rates,
+        }
+
+    def _window_paths(self, base: str) -> Dict[str, str]:
+        """Map every day to its cached time-series response.
+
+        Arguments:
+            base {str} -- Base currency e.g. EUR
+
+        Returns:
+            Dict[str, str] -- Day and path of the response
+        """
+        if base in self._windows:
+            return self._windows[base]
+
+        paths: Dict[str, str] = {}
+        directory: str = os.path.join(self.path, 'time-series', base)
+        filenames: list = (
+            os.listdir(directory) if os.path.isdir(directory) else []
+        )
+        for filename in filenames:
+            start, _, end = filename[:-len('.json')].partition('..')
+            if not end:
+                continue
+            for ordinal in range(
+                date.fromisoformat(start).toordinal(),
+                date.fromisoformat(end).toordinal() + 1,
+            ):
+                paths[date.fromordinal(ordinal).isoformat()] = os.path.join(
+                    directory,
+                    filename,
+                )
+
+        self._windows[base] = paths
+        return paths
+
+
+def _archived_response(
+    archive: RateArchive,
+    date_day: str,
+) -> Optional[dict]:
+    """Rebuild the raw historical response of a day from an archive.
+
+    Arguments:
+        archive {RateArchive} -- The archive
+        date_day {str} -- Day e.g. 2020-01-01
+
+    Returns:
+        Optional[dict] -- The response or None when the day is not archived
+    """
+    record: Optional[dict] = archive.day(date_day)
+    if record is None:
+        return None
+
+    timestamp: datetime = datetime.strptime(
+        record['timestamp'],
+        '%Y-%m-%dT%H:%M:%S.%f',
+    ).replace(tzinfo=timezone.utc)
+
+    return {
+        'timestamp': int(timestamp.timestamp()),
+        'base': archive.base,
+        'rates': {
+            currency: record[currency]
+            for currency in CURRENCIES
+            if record.get(currency) is not None
+        },
+    }
@@ -0,0 +1,82 @@
+"""Detect revised exchange rates."""
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+from datetime import date, timedelta
+from typing import Dict, Optional, Sequence
+
+# Bytes of the digest of a day, stored as hex in the state
+DIGEST_SIZE: int = 8
+
+
+class RevisionIndex(object):
+    """Digests of the cleaned records of the most recent days of a stream.
+
+    The digests are kept in a dict of the state, e.g.
+    {'2021-01-01': '3f2a9c0d1e4b5a67'}. Only the days that can be fetched
+    again by the lookback are kept, so the index stays small however long the
+    stream is. The digest of a day is only stored when its records were
+    emitted, so a run that stops before it emits a revised day again.
+    """
+
+    def __init__(self, digests: dict, lookback_days: int) -> None:
+        """Initialize index.
+
+        Arguments:
+            digests {dict} -- Digest per day, changed in place
+            lookback_days {int} -- Days that are fetched again
+        """
+        self.digests: dict = digests
+        self.lookback: timedelta = timedelta(days=lookback_days)
+        self._pending: Dict[str, str] = {}
+
+    def changed(self, day: str, records: Sequence[dict]) -> bool:
+        """Compare the digest of the records of a day with the stored one.
+
+        The digest of a changed day is stored by commit, once its records
+        are emitted.
+
+        Arguments:
+            day {str} -- Day, e.g. 2021-01-01
+            records {Sequence[dict]} -- Cleaned records of the day
+
+        Returns:
+            bool -- Whether the records differ from the stored ones, a day
+                without digest has changed
+        """
+        digest: str = hashlib.blake2b(
+            json.dumps(records, separators=(',', ':')).encode(),
+            digest_size=DIGEST_SIZE,
+        ).hexdigest()
+
+        if self.digests.get(day) == digest:
+            return False
+
+        self._pending[day] = digest
+        return True
+
+    def commit(self, day: str) -> None:
+        """Store the digest of a changed day whose records were emitted.
+
+        Arguments:
+            day {str} -- Day, e.g. 2021-01-01
+        """
+        digest: Optional[str] = self._pending.pop(day, None)
+        if digest is None:
+            return
+
+        self.digests[day] = digest
+        self._prune()
+
+    def _prune(self) -> None:
+        """Drop the days that are out of the lookback of the latest day."""
+        days: list = sorted(self.digests)
+
+        # The lookback ends at the latest day, it holds lookback_days days
+        oldest: str = (
+            date.fromisoformat(days[-1]) - self.lookback + timedelta(days=1)
+        ).isoformat()
+        for stored in days:
+            if stored >= oldest:
+                break
+            del self.digests[stored]  # noqa: WPS420
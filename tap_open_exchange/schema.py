@@ -5,6 +5,8 @@ import os
 
 from singer.schema import Schema
 
+from tap_open_exchange.streams import CURRENCIES, STREAMS
+
 
 def get_abs_path(path: str) -> str:
     """Help function to get the absolute path.
@@ -21,13 +23,46 @@ def get_abs_path(path: str) -> str:
     )
 
 
+def rate_schema(selected: bool = False) -> dict:
+    """Generate the schema of a stream with a column per currency.
+
+    Arguments:
+        selected {bool} -- Whether the stream is selected by default
+
+    Returns:
+        dict -- The schema
+    """
+    properties: dict = {
+        'timestamp': {'type': 'string'},
+        'base': {'type': 'string'},
+    }
+    properties.update({
+        currency: {'type': ['null', 'number']} for currency in CURRENCIES
+    })
+    return {
+        'selected': selected,
+        'type': ['null', 'object'],
+        'additionalProperties': False,
+        'properties': properties,
+    }
+
+
 def load_schemas() -> dict:
-    """Load schemas from schemas folder.
+    """Load schemas.
+
+    The schemas of streams with a mapping in STREAMS are generated from the
+    currencies, the others are loaded from the schemas folder.
 
     Returns:
         dict -- Scemas
     """
-    schemas: dict = {}
+    schemas: dict = {
+        stream_name: Schema.from_dict(
+            rate_schema(stream_meta.get('selected', False)),
+        )
+        for stream_name, stream_meta in STREAMS.items()
+        if 'mapping' in stream_meta
+    }
 
     # For every file in the schemas directory
     for filename in os.listdir(get_abs_path('schemas')):
@@ -37,4 +72,4 @@ def load_schemas() -> dict:
         # Open and load the schema
         with open(f'{abs_path}/{filename}') as schema_file:
             schemas[file_raw] = Schema.from_dict(json.load(schema_file))
-    return schemas
\ No newline at end of file
+    return schemas
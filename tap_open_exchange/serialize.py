@@ -0,0 +1,193 @@
+"""Fast RECORD message serialization."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, TextIO, Tuple
+
+import singer
+from simplejson.encoder import encode_basestring_ascii
+from singer import utils
+from singer.metrics import Metric
+
+from tap_open_exchange.metrics import RunMetrics
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# singer: singer.write_record, flushes stdout after every record
+# template: precompiled per-stream envelope, byte-compatible with singer
+# orjson: orjson encoder, compact JSON, requires the orjson package
+SERIALIZERS: Tuple[str, ...] = ('singer', 'template', 'orjson')
+DEFAULT_SERIALIZER: str = 'template'
+
+# Same separators, escaping and float formatting as simplejson in singer
+RECORD_ENCODER: json.JSONEncoder = json.JSONEncoder()
+
+
+class RecordWriter(object):  # noqa: WPS230
+    """Write the RECORD messages of one stream.
+
+    The template serializer encodes the message envelope of the stream once,
+    only the record itself is encoded per message, by the C encoder of the
+    json module. Its output is byte-compatible with singer, records it cannot
+    encode, e.g. with Decimal values, are formatted by singer, as are the
+    records orjson cannot encode, e.g. with integers beyond 64 bits.
+    Messages are written to stdout without a flush per record, the output is
+    flushed with every STATE message.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        serializer: str = DEFAULT_SERIALIZER,
+        output: Optional[TextIO] = None,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        """Initialize writer.
+
+        Arguments:
+            stream_name {str} -- Name of the stream
+
+        Keyword Arguments:
+            serializer {str} -- One of SERIALIZERS (default: {'template'})
+            output {Optional[TextIO]} -- Output (default: {sys.stdout})
+            metrics {Optional[RunMetrics]} -- Run metrics (default: {None})
+
+        Raises:
+            ValueError: When the serializer is unknown
+        """
+        if serializer not in SERIALIZERS:
+            raise ValueError(f'Unknown serializer {serializer}')
+
+        self.stream_name: str = stream_name
+        self.serializer: str = serializer
+        self.output: TextIO = output or sys.stdout
+        self.metrics: Optional[RunMetrics] = metrics
+
+        self._prefix: str = (
+            '{"type": "RECORD", "stream": '
+            f'{encode_basestring_ascii(stream_name)}, "record": '
+        )
+        self._time_extracted: Tuple[Optional[datetime], str] = (None, '')
+        self._dumps: Optional[Callable[[Any], bytes]] = None
+
+        if serializer == 'orjson':
+            self._dumps = _orjson_dumps()
+            if self._dumps is None:
+                LOGGER.warning('orjson is not installed, using templates')
+                self.serializer = 'template'
+
+    def write(self, record: dict, time_extracted: datetime) -> None:
+        """Write a RECORD message.
+
+        Arguments:
+            record {dict} -- Record
+            time_extracted {datetime} -- Time of extraction, timezone aware
+        """
+        if self.metrics is None:
+            self._write(record, time_extracted)
+            return
+
+        start: float = time.perf_counter()
+        formatted: float = self._write(record, time_extracted)
+        end: float = time.perf_counter()
+
+        self.metrics.add('serialize', formatted - start)
+        self.metrics.add('write', end - formatted)
+        self.metrics.count(Metric.record_count)
+
+    def flush(self) -> None:
+        """Flush the written messages, e.g. before the stream waits."""
+        self.output.flush()
+
+    def _write(self, record: dict, time_extracted: datetime) -> float:
+        """Format and write a RECORD message.
+
+        Arguments:
+            record {dict} -- Record
+            time_extracted {datetime} -- Time of extraction, timezone aware
+
+        Returns:
+            float -- perf_counter() when the message was formatted
+        """
+        if self.serializer == 'singer':
+            # Same as singer.write_record, which flushes every record
+            message: str = singer.format_message(singer.RecordMessage(
+                self.stream_name,
+                record,
+                time_extracted=time_extracted,
+            ))
+            formatted: float = time.perf_counter()
+            self.output.write(f'{message}\n')
+            self.output.flush()
+            return formatted
+
+        message = self.format(record, time_extracted)
+        formatted = time.perf_counter()
+
+        # A single write, so a stop signal never leaves half a line
+        self.output.write(f'{message}\n')
+        return formatted
+
+    def format(self, record: dict, time_extracted: datetime) -> str:
+        """Format a RECORD message.
+
+        Arguments:
+            record {dict} -- Record
+            time_extracted {datetime} -- Time of extraction, timezone aware
+
+        Returns:
+            str -- The message
+        """
+        extracted: str = self._format_time(time_extracted)
+
+        try:
+            if self._dumps is not None:
+                return self._dumps({
+                    'type': 'RECORD',
+                    'stream': self.stream_name,
+                    'record': record,
+                    'time_extracted': extracted,
+                }).decode()
+
+            encoded: str = RECORD_ENCODER.encode(record)
+        except TypeError:
+            # e.g. Decimal values, or integers orjson cannot encode
+            return singer.format_message(singer.RecordMessage(
+                self.stream_name,
+                record,
+                time_extracted=time_extracted,
+            ))
+
+        return f'{self._prefix}{encoded}, "time_extracted": "{extracted}"}}'
+
+    def _format_time(self, time_extracted: datetime) -> str:
+        """Format the time of extraction like singer does.
+
+        Arguments:
+            time_extracted {datetime} -- Time of extraction, timezone aware
+
+        Returns:
+            str -- e.g. 2020-01-01T00:00:00.000000Z
+        """
+        if self._time_extracted[0] != time_extracted:
+            self._time_extracted = (
+                time_extracted,
+                utils.strftime(time_extracted.astimezone(timezone.utc)),
+            )
+        return self._time_extracted[1]
+
+
+def _orjson_dumps() -> Optional[Callable[[Any], bytes]]:
+    """Return orjson.dumps when orjson is installed.
+
+    Returns:
+        Optional[Callable[[Any], bytes]] -- orjson.dumps or None
+    """
+    try:
+        import orjson  # noqa: WPS433
+    except ImportError:
+        return None
+    return orjson.dumps
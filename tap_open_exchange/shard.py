@@ -0,0 +1,232 @@
+"""Shard backfills."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import singer
+
+from tap_open_exchange.planner import DayRanges
+from tap_open_exchange.streams import STREAMS
+from tap_open_exchange.tools import compile_create_bookmark
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Files of a shard directory
+SHARD_CONFIG: str = 'config.json'
+SHARD_STATE: str = 'state.json'
+
+
+def plan_shards(
+    start_date: str,
+    shards: int,
+    end_date: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """Split the days of a backfill into contiguous windows.
+
+    Arguments:
+        start_date {str} -- First day, e.g. 2000-01-01
+        shards {int} -- Number of windows
+
+    Keyword Arguments:
+        end_date {Optional[str]} -- Last day (default: {yesterday})
+
+    Raises:
+        ValueError: When there are no days or no shards
+
+    Returns:
+        List[Tuple[str, str]] -- First and last day of every window, at most
+            one window per day
+    """
+    first: date = date.fromisoformat(start_date[:10])
+    last: date = datetime.now(timezone.utc).date() - timedelta(days=1)
+    if end_date:
+        last = min(last, date.fromisoformat(end_date[:10]))
+
+    days: int = last.toordinal() - first.toordinal() + 1
+    if days < 1 or shards < 1:
+        raise ValueError(
+            f'Cannot split {days} days from {start_date} into {shards} shards',
+        )
+
+    # Spread the remainder over the first windows
+    size, remainder = divmod(days, min(shards, days))
+    windows: List[Tuple[str, str]] = []
+    start: date = first
+    for shard in range(min(shards, days)):
+        end: date = start + timedelta(days=size - 1 + (shard < remainder))
+        windows.append((start.isoformat(), end.isoformat()))
+        start = end + timedelta(days=1)
+    return windows
+
+
+def write_plan(config: dict, shards: int, directory: str) -> List[str]:
+    """Write a config per shard.
+
+    Every shard gets a directory shard-<n> with a copy of the config limited
+    to its window by start_date and end_date.
+
+    Arguments:
+        config {dict} -- Tap config
+        shards {int} -- Number of shards
+        directory {str} -- Directory of the shards
+
+    Returns:
+        List[str] -- Paths of the shard configs
+    """
+    windows: List[Tuple[str, str]] = plan_shards(
+        config['start_date'],
+        shards,
+        config.get('end_date'),
+    )
+
+    paths: List[str] = []
+    for shard, (start_date, end_date) in enumerate(windows):
+        shard_dir: str = os.path.join(directory, f'shard-{shard:03d}')
+        os.makedirs(shard_dir, exist_ok=True)
+
+        path: str = os.path.join(shard_dir, SHARD_CONFIG)
+        with open(path, 'w') as config_file:
+            json.dump(
+                {**config, 'start_date': start_date, 'end_date': end_date},
+                config_file,
+                indent=2,
+            )
+        paths.append(path)
+
+        LOGGER.info(f'Shard {shard}: {start_date} till {end_date}')
+    return paths
+
+
+def merge_states(directory: str) -> dict:  # noqa: WPS210
+    """Merge the states of the shards into the state of a single sync.
+
+    The completed days of all shards are merged per stream. A shard that
+    tracks its completed days, e.g. with fill_gaps or a request budget,
+    contributes those days. Any other shard syncs its days in order, so its
+    days from its start date till the day before its bookmark are complete.
+    The merged bookmark follows the run of completed days from the first
+    start date, so no day before it is missing. The merged completed days are
+    kept, so a sync with fill_gaps fetches the gaps after it. A shard without
+    a state has not started.
+
+    Arguments:
+        directory {str} -- Directory of the shards
+
+    Returns:
+        dict -- The merged state
+    """
+    shards: List[Tuple[dict, dict]] = []
+    for shard_dir in sorted(os.listdir(directory)):
+        config_path: str = os.path.join(directory, shard_dir, SHARD_CONFIG)
+        if not os.path.isfile(config_path):
+            continue
+        shards.append((
+            _read_json(config_path),
+            _read_json(os.path.join(directory, shard_dir, SHARD_STATE)),
+        ))
+    shards.sort(key=lambda shard: shard[0]['start_date'])
+
+    # Only streams with a daily bookmark are backfilled by day
+    streams: List[str] = sorted({
+        stream
+        for _, state in shards
+        for stream in state.get('bookmarks', {})
+        if 'bookmark_days' in STREAMS.get(stream, {})
+    })
+
+    bookmarks: Dict[str, dict] = {}
+    for stream in streams:
+        completed: DayRanges = DayRanges()
+
+        for config, state in shards:
+            stream_state: dict = state.get('bookmarks', {}).get(stream, {})
+            if 'completed' in stream_state:
+                for first, last in stream_state['completed']:
+                    completed.add_range(first, last)
+                continue
+
+            bookmark: str = str(stream_state.get('start_date') or '')[:10]
+            if bookmark:
+                completed.add_range(
+                    config['start_date'][:10],
+                    (
+                        date.fromisoformat(bookmark) - timedelta(days=1)
+                    ).isoformat(),
+                )
+
+        start_date: str = shards[0][0]['start_date'][:10]
+        run_end: Optional[str] = completed.run_end(start_date)
+        merged: str = (
+            compile_create_bookmark(stream)(run_end) if run_end
+            else None
+        ) or start_date
+
+        end_date: str = shards[-1][0]['end_date'][:10]
+        if merged <= end_date:
+            LOGGER.warning(
+                f'Stream {stream} is complete until {merged}, '
+                f'{len(completed.ranges)} ranges of completed days',
+            )
+
+        bookmarks[stream] = {
+            'start_date': merged,
+            'completed': completed.ranges,
+        }
+
+    return {'bookmarks': bookmarks}
+
+
+def _read_json(path: str) -> dict:
+    """Read a JSON file.
+
+    Arguments:
+        path {str} -- Path of the file
+
+    Returns:
+        dict -- The content, or an empty dict when the file does not exist
+    """
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except FileNotFoundError:
+        return {}
+
+
+def main() -> None:
+    """Plan shards or merge their states."""
+    parser: ArgumentParser = ArgumentParser(
+        description='Shard a backfill of tap-open-exchange',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan: ArgumentParser = commands.add_parser(
+        'plan',
+        help='Write a config per shard',
+    )
+    plan.add_argument('-c', '--config', required=True, help='Tap config')
+    plan.add_argument('--shards', type=int, required=True)
+    plan.add_argument('--dir', required=True, help='Directory of the shards')
+
+    merge: ArgumentParser = commands.add_parser(
+        'merge',
+        help='Merge the states of the shards and write it to stdout',
+    )
+    merge.add_argument('--dir', required=True, help='Directory of the shards')
+
+    args: Namespace = parser.parse_args()
+
+    if args.command == 'plan':
+        write_plan(_read_json(args.config), args.shards, args.dir)
+        return
+
+    json.dump(merge_states(args.dir), sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
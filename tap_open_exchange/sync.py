@@ -1,14 +1,23 @@
 """Sync data."""
 # -*- coding: utf-8 -*-
 import logging
-from datetime import datetime, timezone
-from typing import Callable, Optional
+import signal
+import sys
+from datetime import datetime, timedelta, timezone
+from types import FrameType
+from typing import Callable, Mapping, Optional
 
 import singer
 from singer.catalog import Catalog, CatalogEntry
 
 from tap_open_exchange import tools
+from tap_open_exchange.aggregates import RollingAggregates
+from tap_open_exchange.checkpoint import Checkpointer
 from tap_open_exchange.exchange import OpenExchange
+from tap_open_exchange.metrics import RunMetrics
+from tap_open_exchange.planner import DayRanges, DayTracker
+from tap_open_exchange.revisions import RevisionIndex
+from tap_open_exchange.serialize import DEFAULT_SERIALIZER, RecordWriter
 from tap_open_exchange.streams import STREAMS
 
 LOGGER: logging.RootLogger = singer.get_logger()
@@ -19,6 +28,9 @@ def sync(
     state: dict,
     catalog: Catalog,
     start_date: str,
+    checkpointer: Optional[Checkpointer] = None,
+    serializer: str = DEFAULT_SERIALIZER,
+    schema_messages: Optional[Mapping[str, str]] = None,
 ) -> None:
     """Sync data from tap source.
 
@@ -27,6 +39,54 @@ def sync(
         state {dict} -- Tap state
         catalog {Catalog} -- Stream catalog
         start_date {str} -- Start date
+
+    Keyword Arguments:
+        checkpointer {Optional[Checkpointer]} -- Decides when state is written
+        serializer {str} -- Serializer of RECORD messages (default: {template})
+        schema_messages {Optional[Mapping[str, str]]} -- Precompiled SCHEMA
+            messages of the catalog per stream (default: {None})
+    """
+    if checkpointer is None:
+        checkpointer = Checkpointer(state)
+
+    # Write the pending state when the sync is terminated
+    signal.signal(signal.SIGTERM, _terminate)
+
+    try:
+        _sync_streams(
+            exchange,
+            state,
+            catalog,
+            start_date,
+            checkpointer,
+            serializer,
+            schema_messages or {},
+        )
+    finally:
+        checkpointer.flush()
+        sys.stdout.flush()
+        exchange.metrics.summary()
+
+
+def _sync_streams(
+    exchange: OpenExchange,
+    state: dict,
+    catalog: Catalog,
+    start_date: str,
+    checkpointer: Checkpointer,
+    serializer: str,
+    schema_messages: Mapping[str, str],
+) -> None:
+    """Sync every selected stream.
+
+    Arguments:
+        exchange {OpenExchange} -- OpenExchange Class
+        state {dict} -- Tap state
+        catalog {Catalog} -- Stream catalog
+        start_date {str} -- Start date
+        checkpointer {Checkpointer} -- Decides when state is written
+        serializer {str} -- Serializer of RECORD messages
+        schema_messages {Mapping[str, str]} -- Precompiled SCHEMA messages
     """
     # For every stream in the catalog
     LOGGER.info('Sync')
@@ -45,16 +105,23 @@ def sync(
         stream_state: dict = tools.get_stream_state(
             state,
             stream.tap_stream_id,
-        )
+        ) or {'start_date': start_date}
 
         LOGGER.debug(f'Stream state: {stream_state}')
 
         # Write the schema
-        singer.write_schema(
-            stream_name=stream.tap_stream_id,
-            schema=stream.schema.to_dict(),
-            key_properties=stream.key_properties,
+        schema_message: Optional[str] = schema_messages.get(
+            stream.tap_stream_id,
         )
+        if schema_message is None:
+            singer.write_schema(
+                stream_name=stream.tap_stream_id,
+                schema=stream.schema.to_dict(),
+                key_properties=stream.key_properties,
+            )
+        else:
+            sys.stdout.write(f'{schema_message}\n')
+            sys.stdout.flush()
 
         # Every stream has a corresponding method in the PayPal object e.g.:
         # The stream: paypal_transactions will call: paypal.paypal_transactions
@@ -64,45 +131,312 @@ def sync(
         # The state of the stream is used as kwargs for the method
         # E.g. if the state of the stream has a key 'start_date', it will be
         # used in the method as start_date='2021-01-01T00:00:00+0000'
-        for row in tap_data(**stream_state):
-            sync_record(stream, row, state)
+        context: StreamContext = StreamContext(
+            stream,
+            state,
+            checkpointer,
+            RecordWriter(
+                stream.tap_stream_id,
+                serializer,
+                metrics=exchange.metrics,
+            ),
+            exchange.metrics,
+            exchange.fill_gaps,
+            exchange.lookback_days,
+        )
+
+        # A stream that tracks its completed days moves its bookmark from
+        # where it starts
+        if context.tracker is not None:
+            context.bookmarks.setdefault(
+                context.bookmark_key,
+                str(stream_state.get(context.bookmark_key, start_date)),
+            )
+
+        # The revision index and rolling aggregates of the stream are passed
+        # along with its state
+        kwargs: dict = dict(stream_state)
+        if context.revisions is not None:
+            kwargs['revisions'] = context.revisions
+        if context.aggregates is not None:
+            kwargs['aggregates'] = context.aggregates
+
+        # A polled stream sets the extraction time of the records of a poll
+        # and flushes them before it waits for the next one
+        if STREAMS[stream.tap_stream_id].get('polled'):
+            kwargs['extracted'] = context.extracted
+            kwargs['waiting'] = context.writer.flush
+
+        for row in tap_data(**kwargs):
+            sync_record(context, row)
+
+        # The day of the last record is complete
+        if context.tracker is not None:
+            context.tracker.finish()
+            bookmark: str = _frontier(context) or context.bookmarks.get(
+                context.bookmark_key,
+                '',
+            )
+            context.bookmarks[context.bookmark_key] = bookmark
+            checkpointer.update(bookmark)
+
+        # The records of the last day are all written
+        if context.day_end is not None:
+            _advance(context, context.day_end.finish())
+
+        # With an end date, e.g. of a shard, every day up to the last day is
+        # complete, a stream with a daily bookmark resumes after it. Days a
+        # stream that tracks its completed days did not complete, e.g.
+        # deferred by the request budget, keep the bookmark before them
+        if (
+            exchange.end_date is not None
+            and 'bookmark_days' in STREAMS[stream.tap_stream_id]
+            and _complete_until(context, exchange.last_day().isoformat())
+        ):
+            next_day: str = (
+                exchange.last_day() + timedelta(days=1)
+            ).isoformat()
+            if context.bookmarks.get(context.bookmark_key, '') < next_day:
+                context.bookmarks[context.bookmark_key] = next_day
+                checkpointer.update(next_day)
+
+        # Write the state of the completed stream
+        checkpointer.flush()
+
+
+class StreamContext(object):  # noqa: WPS230
+    """Everything sync_record needs that does not change within a stream."""
+
+    def __init__(
+        self,
+        stream: CatalogEntry,
+        state: dict,
+        checkpointer: Checkpointer,
+        writer: RecordWriter,
+        metrics: RunMetrics,
+        fill_gaps: bool = False,
+        lookback_days: int = 0,
+    ) -> None:
+        """Compile the context of a stream.
+
+        Arguments:
+            stream {CatalogEntry} -- Stream catalog
+            state {dict} -- State
+            checkpointer {Checkpointer} -- Decides when state is written
+            writer {RecordWriter} -- Writer of the stream's records
+            metrics {RunMetrics} -- Run metrics
+
+        Keyword Arguments:
+            fill_gaps {bool} -- Track the completed days of a stream with a
+                daily bookmark (default: {False})
+            lookback_days {int} -- Keep the digests of the days of a stream
+                with a daily bookmark that are fetched again (default: {0})
+        """
+        self.stream: CatalogEntry = stream
+        self.checkpointer: Checkpointer = checkpointer
+        self.writer: RecordWriter = writer
+        self.metrics: RunMetrics = metrics
+
+        # Accessor of the bookmark value in a row
+        self.get_bookmark: Callable[[dict], Optional[str]] = (
+            tools.compile_bookmark_path(stream.replication_key)
+        )
+        self.create_bookmark: Callable[[Optional[str]], Optional[str]] = (
+            tools.compile_create_bookmark(stream.tap_stream_id)
+        )
+
+        # The bookmarks of the stream in the state
+        self.bookmark_key: str = STREAMS[stream.tap_stream_id]['bookmark']
+        self.bookmarks: dict = state.setdefault(
+            'bookmarks',
+            {},
+        ).setdefault(stream.tap_stream_id, {})
+
+        # The completed days of the stream in the state
+        self.tracker: Optional[DayTracker] = None
+        if fill_gaps and 'bookmark_days' in STREAMS[stream.tap_stream_id]:
+            self.tracker = DayTracker(
+                DayRanges(self.bookmarks.setdefault('completed', [])),
+            )
+
+        # A stream with many records per day moves its bookmark once the
+        # last record of a day is written
+        self.day_end: Optional[DayTracker] = None
+        if (
+            self.tracker is None
+            and STREAMS[stream.tap_stream_id].get('complete_days')
+        ):
+            self.day_end = DayTracker(DayRanges())
+
+        # The digests of the most recent days of the stream in the state
+        self.revisions: Optional[RevisionIndex] = None
+        if lookback_days and 'bookmark_days' in STREAMS[stream.tap_stream_id]:
+            self.revisions = RevisionIndex(
+                self.bookmarks.setdefault('hashes', {}),
+                lookback_days,
+            )
+
+        # The rolling aggregates of a stream with periods in the state
+        self.aggregates: Optional[RollingAggregates] = None
+        if 'periods' in STREAMS[stream.tap_stream_id]:
+            self.aggregates = RollingAggregates(
+                self.bookmarks.setdefault('aggregates', {}),
+                STREAMS[stream.tap_stream_id]['periods'],
+            )
+
+        self.time_extracted: datetime = datetime.now(timezone.utc)
+
+    def extracted(self, time_extracted: datetime) -> None:
+        """Set the extraction time of the next records, e.g. of a poll.
 
+        Arguments:
+            time_extracted {datetime} -- Time of extraction, timezone aware
+        """
+        self.time_extracted = time_extracted
 
-def sync_record(stream: CatalogEntry, row: dict, state: dict) -> None:
+
+def sync_record(context: StreamContext, row: dict) -> None:
     """Sync the record.
 
     Arguments:
-        stream {CatalogEntry} -- Stream catalog
+        context {StreamContext} -- Context of the stream
         row {dict} -- Record
-        state {dict} -- State
     """
-    # Retrieve the value of the bookmark
-    bookmark: Optional[str] = tools.retrieve_bookmark_with_path(
-        stream.replication_key,
-        row,
-    )
-
     # Create new bookmark
-    new_bookmark: str = tools.create_bookmark(stream.tap_stream_id, bookmark)
+    bookmark_value: Optional[str] = context.get_bookmark(row)
+    new_bookmark: Optional[str] = context.create_bookmark(bookmark_value)
 
     # Write a row to the stream
-    singer.write_record(
-        stream.tap_stream_id,
-        row,
-        time_extracted=datetime.now(timezone.utc),
-    )
+    context.writer.write(row, context.time_extracted)
+
+    if context.tracker is not None:
+        new_bookmark = _track_day(context, bookmark_value)
+    elif context.day_end is not None:
+        _advance(context, context.day_end.track(bookmark_value))
+        new_bookmark = None
+    elif (
+        context.revisions is not None
+        and new_bookmark
+        and new_bookmark < context.bookmarks.get(context.bookmark_key, '')
+    ):
+        # Revised days before the bookmark do not move it back
+        new_bookmark = None
 
     if new_bookmark:
         # Save the bookmark to the state
-        singer.write_bookmark(
-            state,
-            stream.tap_stream_id,
-            STREAMS[stream.tap_stream_id]['bookmark'],
-            new_bookmark,
+        context.bookmarks[context.bookmark_key] = new_bookmark
+
+        # Write the state when a checkpoint is due
+        context.checkpointer.update(new_bookmark)
+
+    # Emit the run metrics when they are due
+    context.metrics.tick()
+
+
+def _advance(context: StreamContext, completed: str) -> None:
+    """Move the bookmark past a day whose records are all written.
+
+    Revised days before the bookmark do not move it back.
+
+    Arguments:
+        context {StreamContext} -- Context of the stream
+        completed {str} -- Completed day, empty when no day was completed
+    """
+    new_bookmark: Optional[str] = context.create_bookmark(completed)
+    if new_bookmark and new_bookmark > context.bookmarks.get(
+        context.bookmark_key,
+        '',
+    ):
+        # Save the bookmark to the state
+        context.bookmarks[context.bookmark_key] = new_bookmark
+
+        # Write the state when a checkpoint is due
+        context.checkpointer.update(new_bookmark)
+
+
+def _track_day(
+    context: StreamContext,
+    bookmark_value: Optional[str],
+) -> Optional[str]:
+    """Track the completed days of a stream that fills gaps.
+
+    Days can be completed out of order, e.g. newest first. The bookmark only
+    moves over the run of completed days that follows it, so every day
+    before the bookmark stays complete. A completed day is a state change on
+    its own.
+
+    Arguments:
+        context {StreamContext} -- Context of the stream
+        bookmark_value {Optional[str]} -- Bookmark value of the record
+
+    Returns:
+        Optional[str] -- The new bookmark, None when it does not move forward
+    """
+    if not context.tracker.track(bookmark_value):  # type: ignore
+        return None
+
+    new_bookmark: Optional[str] = _frontier(context)
+    if new_bookmark is None:
+        # Write the state when a checkpoint is due
+        context.checkpointer.update(
+            context.bookmarks.get(context.bookmark_key, ''),
         )
+    return new_bookmark
+
+
+def _frontier(context: StreamContext) -> Optional[str]:
+    """Return the bookmark after the completed days that follow the bookmark.
+
+    Arguments:
+        context {StreamContext} -- Context of the stream
+
+    Returns:
+        Optional[str] -- The new bookmark, None when it does not move forward
+    """
+    bookmark: str = context.bookmarks.get(context.bookmark_key) or ''
+    if not bookmark:
+        return None
+
+    last_day: Optional[str] = context.tracker.ranges.run_end(  # type: ignore
+        bookmark,
+    )
+    new_bookmark: Optional[str] = context.create_bookmark(last_day)
+    if new_bookmark and new_bookmark > bookmark:
+        return new_bookmark
+    return None
+
 
-        # Clear currently syncing
-        tools.clear_currently_syncing(state)
+def _complete_until(context: StreamContext, last_day: str) -> bool:
+    """Whether every day from the bookmark till the last day is complete.
 
-        # Write the bootmark
-        singer.write_state(state)
\ No newline at end of file
+    Arguments:
+        context {StreamContext} -- Context of the stream
+        last_day {str} -- Last day to sync, e.g. 2020-12-31
+
+    Returns:
+        bool -- True when the stream does not track its completed days, or
+            the completed days run from the bookmark till the last day
+    """
+    if context.tracker is None:
+        return True
+
+    bookmark: str = context.bookmarks.get(context.bookmark_key) or ''
+    if not bookmark or bookmark[:10] > last_day:
+        return True
+
+    run_end: Optional[str] = context.tracker.ranges.run_end(bookmark)
+    return run_end is not None and run_end >= last_day
+
+
+def _terminate(signum: int, _frame: Optional[FrameType]) -> None:
+    """Stop the sync on a signal, so the pending state is written.
+
+    Arguments:
+        signum {int} -- Signal number
+        _frame {Optional[FrameType]} -- Current stack frame
+
+    Raises:
+        SystemExit: Always
+    """
+    LOGGER.warning(f'Received signal {signum}, stopping')
+    raise SystemExit(128 + signum)
\ No newline at end of file
@@ -1,52 +1,306 @@
 """OpenExchange tap."""
 # -*- coding: utf-8 -*-
 import logging
-from argparse import Namespace
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
-import pkg_resources
 from singer import get_logger, utils
 from singer.catalog import Catalog
 
-from tap_open_exchange.exchange import OpenExchange
-from tap_open_exchange.discover import discover
-from tap_open_exchange.sync import sync
+from tap_open_exchange.discover import (
+    CATALOG_CACHE_DIR,
+    discover,
+    load_catalog,
+)
+
+try:
+    from importlib.metadata import version  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    # Python 3.7 uses the backport
+    from importlib_metadata import version  # type: ignore  # noqa: WPS440
 
-VERSION: str = pkg_resources.get_distribution('tap-open-exchange').version
+if TYPE_CHECKING:
+    from tap_open_exchange.archive import RateArchive  # noqa: F401
+    from tap_open_exchange.cache import ResponseCache  # noqa: F401
+    from tap_open_exchange.replay import ReplayFetcher  # noqa: F401
+
+VERSION: str = version('tap-open-exchange')
 LOGGER: logging.RootLogger = get_logger()
 REQUIRED_CONFIG_KEYS: tuple = (
     'api_key',
     'start_date',
 )
 
+# Replay mode does not use the API
+REPLAY_REQUIRED_CONFIG_KEYS: tuple = (
+    'start_date',
+)
+
 
 @utils.handle_top_exception(LOGGER)
 def main() -> None:
     """Run tap."""
     # Parse command line arguments
-    args: Namespace = utils.parse_args(REQUIRED_CONFIG_KEYS)
+    replay: Optional[str] = parse_replay_arg()
+    args: Namespace = utils.parse_args(
+        REPLAY_REQUIRED_CONFIG_KEYS if replay else REQUIRED_CONFIG_KEYS,
+    )
 
     LOGGER.info(f'>>> Running tap-open-exchange v{VERSION}')
 
     # If discover flag was passed, run discovery mode and dump output to stdout
     if args.discover:
-        catalog: Catalog = discover()
+        catalog: Catalog = discover(
+            VERSION,
+            catalog_cache_dir(args.config),
+        )
         catalog.dump()
         return
 
     # Otherwise run in sync mode
+    run_sync(args, replay)
+
+
+def run_sync(  # noqa: WPS210
+    args: Namespace,
+    replay: Optional[str] = None,
+) -> None:
+    """Run the tap in sync mode.
+
+    The sync modules, e.g. the HTTP client, are only imported in sync mode,
+    so discovery starts fast.
+
+    Arguments:
+        args {Namespace} -- Parsed command line arguments
+
+    Keyword Arguments:
+        replay {Optional[str]} -- Directory to replay from (default: {None})
+    """
+    from tap_open_exchange.checkpoint import (  # noqa: WPS433
+        DEFAULT_EVERY_RECORDS,
+        DEFAULT_EVERY_SECONDS,
+        Checkpointer,
+    )
+    from tap_open_exchange.coordinator import (  # noqa: WPS433
+        DEFAULT_COALESCE_DAYS,
+    )
+    from tap_open_exchange.exchange import (  # noqa: WPS433
+        DEFAULT_BASES,
+        LATEST_INTERVAL,
+        TIME_SERIES_MAX_DAYS,
+        OpenExchange,
+    )
+    from tap_open_exchange.fetcher import DEFAULT_CONCURRENCY  # noqa: WPS433
+    from tap_open_exchange.metrics import (  # noqa: WPS433
+        DEFAULT_LOG_INTERVAL,
+        RunMetrics,
+    )
+    from tap_open_exchange.quota import (  # noqa: WPS433
+        DEFAULT_INCREMENTAL_DAYS,
+        DEFAULT_RESERVE_PER_DAY,
+    )
+    from tap_open_exchange.serialize import (  # noqa: WPS433
+        DEFAULT_SERIALIZER,
+    )
+    from tap_open_exchange.sync import sync  # noqa: WPS433
+    from tap_open_exchange.transport import (  # noqa: WPS433
+        DEFAULT_CONNECT_TIMEOUT,
+        DEFAULT_MAX_BACKOFF,
+        DEFAULT_MAX_RETRIES,
+        DEFAULT_READ_TIMEOUT,
+        Transport,
+    )
+
+    schema_messages: Dict[str, str] = {}
     if args.catalog:
         # Load command line catalog
-        catalog = args.catalog
+        catalog: Catalog = args.catalog
     else:
         # Load the catalog
-        catalog = discover()
+        catalog, schema_messages = load_catalog(
+            VERSION,
+            catalog_cache_dir(args.config),
+        )
+
+    if replay:
+        LOGGER.info(f'Replaying exchange rates from {replay}')
 
     # Initialize Open Exchange client
     exchange_rate_USD: OpenExchange = OpenExchange(
-        args.config['api_key'],
+        args.config.get('api_key', ''),
+        concurrency=args.config.get('concurrency', DEFAULT_CONCURRENCY),
+        transport=Transport(
+            connect_timeout=args.config.get(
+                'connect_timeout',
+                DEFAULT_CONNECT_TIMEOUT,
+            ),
+            read_timeout=args.config.get('read_timeout', DEFAULT_READ_TIMEOUT),
+            max_retries=args.config.get('max_retries', DEFAULT_MAX_RETRIES),
+            max_backoff=args.config.get('max_backoff', DEFAULT_MAX_BACKOFF),
+        ),
+        time_series=not replay and args.config.get('time_series', False),
+        time_series_days=args.config.get(
+            'time_series_days',
+            TIME_SERIES_MAX_DAYS,
+        ),
+        bases=parse_bases(args.config.get('bases', DEFAULT_BASES)),
+        cache=create_cache(args.config),
+        archive=create_archive(args.config),
+        fetcher=create_replay_fetcher(replay),
+        base_url=args.config.get('api_base_url'),
+        metrics=RunMetrics(
+            args.config.get('metrics_interval', DEFAULT_LOG_INTERVAL),
+        ),
+        end_date=args.config.get('end_date'),
+        latest_interval=args.config.get('latest_interval', LATEST_INTERVAL),
+        latest_duration=args.config.get('latest_duration', 0),
+        fill_gaps=args.config.get('fill_gaps', False),
+        manifests=args.config.get('manifests'),
+        lookback_days=args.config.get('lookback_days', 0),
+        order=args.config.get('order', 'oldest'),
+        priority=args.config.get('priority', ()),
+        quota_state=(
+            args.state.setdefault('quota', {})
+            if args.config.get('quota') and not replay else None
+        ),
+        quota_reserve_per_day=args.config.get(
+            'quota_reserve_per_day',
+            DEFAULT_RESERVE_PER_DAY,
+        ),
+        quota_burst=args.config.get('quota_burst'),
+        incremental_days=args.config.get(
+            'incremental_days',
+            DEFAULT_INCREMENTAL_DAYS,
+        ),
+        coalesce_days=args.config.get('coalesce_days', DEFAULT_COALESCE_DAYS),
+    )
+
+    try:
+        sync(
+            exchange_rate_USD,
+            args.state,
+            catalog,
+            args.config['start_date'],
+            Checkpointer(
+                args.state,
+                every_records=args.config.get(
+                    'state_every_records',
+                    DEFAULT_EVERY_RECORDS,
+                ),
+                every_seconds=args.config.get(
+                    'state_every_seconds',
+                    DEFAULT_EVERY_SECONDS,
+                ),
+                month_boundary=args.config.get('state_at_month_end', False),
+            ),
+            args.config.get('serializer', DEFAULT_SERIALIZER),
+            schema_messages,
+        )
+    finally:
+        exchange_rate_USD.close()
+
+
+def parse_replay_arg() -> Optional[str]:
+    """Parse and remove the --replay argument from the command line.
+
+    The other arguments are parsed by singer.
+
+    Returns:
+        Optional[str] -- Directory to replay from or None
+    """
+    parser: ArgumentParser = ArgumentParser(add_help=False)
+    parser.add_argument(
+        '--replay',
+        help='Replay from a directory of responses or a rate archive',
     )
+    known, remaining = parser.parse_known_args()
+    sys.argv[1:] = remaining
+    return known.replay
+
+
+def catalog_cache_dir(config: dict) -> Optional[str]:
+    """Return the directory of the cached catalog.
+
+    Arguments:
+        config {dict} -- Tap config
+
+    Returns:
+        Optional[str] -- The directory, None when the catalog is not cached
+    """
+    return config.get('catalog_cache_dir', CATALOG_CACHE_DIR) or None
+
+
+def create_cache(config: dict) -> Optional['ResponseCache']:
+    """Create the response cache when a cache directory is configured.
+
+    Arguments:
+        config {dict} -- Tap config
+
+    Returns:
+        Optional[ResponseCache] -- The cache or None
+    """
+    if not config.get('cache_dir'):
+        return None
+
+    from tap_open_exchange.cache import ResponseCache  # noqa: WPS433
+
+    max_mb: Optional[float] = config.get('cache_max_mb')
+    return ResponseCache(
+        config['cache_dir'],
+        max_age_days=config.get('cache_max_age_days'),
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+    )
+
+
+def create_archive(config: dict) -> Optional['RateArchive']:
+    """Create the rate archive when an archive directory is configured.
+
+    Arguments:
+        config {dict} -- Tap config
+
+    Returns:
+        Optional[RateArchive] -- The archive or None
+    """
+    if not config.get('archive_dir'):
+        return None
+
+    from tap_open_exchange.archive import RateArchive  # noqa: WPS433
+
+    return RateArchive(config['archive_dir'])
+
+
+def create_replay_fetcher(
+    replay: Optional[str],
+) -> Optional['ReplayFetcher']:
+    """Create the replay fetcher when replaying.
+
+    Arguments:
+        replay {Optional[str]} -- Directory to replay from
+
+    Returns:
+        Optional[ReplayFetcher] -- The fetcher or None
+    """
+    if not replay:
+        return None
+
+    from tap_open_exchange.replay import ReplayFetcher  # noqa: WPS433
+
+    return ReplayFetcher(replay)
+
+
+def parse_bases(bases: Union[str, Sequence[str]]) -> List[str]:
+    """Parse the configured bases.
+
+    Arguments:
+        bases {Union[str, Sequence[str]]} -- List or e.g. 'EUR,USD'
 
-    sync(exchange_rate_USD, args.state, catalog, args.config['start_date'])
+    Returns:
+        List[str] -- Base currencies
+    """
+    if isinstance(bases, str):
+        bases = bases.split(',')
+    return [base.strip().upper() for base in bases if base.strip()]
 
 
 if __name__ == '__main__':
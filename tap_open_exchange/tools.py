@@ -1,8 +1,11 @@
 """Tools."""
 # -*- coding: utf-8 -*-
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from functools import reduce
-from typing import Optional
+from operator import itemgetter
+from typing import Callable, List, Optional
+
+from tap_open_exchange.streams import STREAMS
 
 
 def clear_currently_syncing(state: dict) -> dict:
@@ -33,51 +36,74 @@ def get_stream_state(state: dict, tap_stream_id: str) -> dict:
     ).get(tap_stream_id)
 
 
-def retrieve_bookmark_with_path(path: str, row: dict) -> Optional[str]:
-    """Bookmark exists in the row of data which is an dictionary.
+def compile_bookmark_path(path: str) -> Callable[[dict], Optional[str]]:
+    """Compile the accessor of the bookmark in a row of data.
 
     The bookmark can either be a key such as row[key] but also a subkey such as
     row[key][subkey]. In the streams definition file, the key can be saved as
     a string, but [key][subkey] cannot. Therefore, in the streams file, if we
     want to use a subkey as bookmark, we save it in the format 'key.subkey',
     which is our path in the dictionary.
-    This helper function parses the string and checks whether it has a dot.
-    If it has one, it returns the value of the subkey in the row of data, e.g.
-    row[key][subkey]. If not it returns the alue of the key, e.g row[path].
+    This helper function parses the string once and checks whether it has a
+    dot. If it has one, the accessor returns the value of the subkey in the
+    row of data, e.g. row[key][subkey]. If not it returns the value of the
+    key, e.g row[path].
 
     Arguments:
         path {str} -- Path in the dictionary
-        row {dict} -- Data row
 
     Returns:
-        Optional[str] -- The value or from the key or subkey
+        Callable[[dict], Optional[str]] -- Accessor of the bookmark in a row
     """
     # If the path has a dot, then parse it as key and subkeys
-    if '.' in path:
-        return str(reduce(dict.get, path.split('.'), row))  # type: ignore
+    if path and '.' in path:
+        keys: List[str] = path.split('.')
+        return lambda row: str(reduce(dict.get, keys, row))  # type: ignore
     # Else if the path is just a key, parse it as a normal key
     elif path:
-        return row[path]
-    return None
+        return itemgetter(path)
+    return lambda row: None
+
 
+def compile_create_bookmark(
+    stream_name: str,
+) -> Callable[[Optional[str]], Optional[str]]:
+    """Compile the function that creates the bookmark of a stream.
 
-def create_bookmark(stream_name: str, bookmark_value: str) -> str:
-    """Create bookmark.
+    The bookmark is the day of the bookmark value plus the bookmark_days of
+    the stream in STREAMS, e.g. tomorrow's date for exchange_rate_EUR. Streams
+    with bookmark_exact use the bookmark value itself, streams without either
+    have no bookmark. Consecutive records mostly share their day, so the last
+    bookmark is reused.
 
     Arguments:
         stream_name {str} -- Name of stream
-        bookmark_value {str} -- Bookmark value
 
     Returns:
-        str -- Created bookmark
+        Callable[[Optional[str]], Optional[str]] -- Creates the bookmark of a
+            bookmark value, e.g. 2020-01-01T23:59:59.000000 -> 2020-01-02
     """
-    if stream_name in {
-        'exchange_rate_EUR',
-    }:
-        # Return tomorrow's date
-        tomorrow: date = datetime.strptime(
-            # Strip out hours:minutes:seconds
-            bookmark_value[:-16],
-            '%Y-%m-%d',
-        ).date() + timedelta(days=1)
-        return tomorrow.isoformat()
\ No newline at end of file
+    if STREAMS[stream_name].get('bookmark_exact'):
+        return lambda bookmark_value: bookmark_value or None
+
+    days: Optional[int] = STREAMS[stream_name].get('bookmark_days')
+    if days is None:
+        return lambda bookmark_value: None
+
+    offset: timedelta = timedelta(days=days)
+    last: List[str] = ['', '']
+
+    def create_bookmark(  # noqa: WPS430
+        bookmark_value: Optional[str],
+    ) -> Optional[str]:
+        if not bookmark_value:
+            return None
+
+        # Strip out hours:minutes:seconds
+        day: str = bookmark_value[:10]
+        if day != last[0]:
+            last[0] = day
+            last[1] = (date.fromisoformat(day) + offset).isoformat()
+        return last[1]
+
+    return create_bookmark
@@ -0,0 +1,288 @@
+"""HTTP transport."""
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+import singer
+
+if TYPE_CHECKING:
+    import httpx  # noqa: F401
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+DEFAULT_CONNECT_TIMEOUT: float = 10.0
+DEFAULT_READ_TIMEOUT: float = 30.0
+DEFAULT_MAX_RETRIES: int = 5
+DEFAULT_BACKOFF_FACTOR: float = 1.0
+DEFAULT_MAX_BACKOFF: float = 60.0
+
+# Responses with these statuses are retried
+RETRY_STATUSES: frozenset = frozenset((429, 500, 502, 503, 504))
+
+
+class ApiError(Exception):
+    """The API returned an error response."""
+
+    def __init__(
+        self,
+        status: int,
+        message: str = '',
+        description: str = '',
+    ) -> None:
+        """Initialize error.
+
+        Arguments:
+            status {int} -- HTTP status
+
+        Keyword Arguments:
+            message {str} -- API error message e.g. not_allowed (default: {''})
+            description {str} -- API error description (default: {''})
+        """
+        super().__init__(f'{status} {message}: {description}')
+        self.status: int = status
+        self.message: str = message
+        self.description: str = description
+
+
+class TransportStats(object):
+    """Counters of the transport."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.requests: int = 0
+        self.retries: int = 0
+        self.wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        """Return the counters.
+
+        Returns:
+            dict -- The counters
+        """
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'wait_seconds': round(self.wait_seconds, 3),
+        }
+
+
+class Transport(object):  # noqa: WPS230
+    """Pooled HTTP transport with timeouts and retries.
+
+    A single HTTP/2 connection is shared by every request. Failed requests are
+    retried with jittered exponential backoff, a Retry-After header on a 429
+    or 5xx response is honored up to the maximum backoff.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        http2: bool = True,
+    ) -> None:
+        """Initialize transport.
+
+        Keyword Arguments:
+            connect_timeout {float} -- Connect timeout in seconds
+            read_timeout {float} -- Read timeout in seconds
+            max_retries {int} -- Retries before a request fails
+            backoff_factor {float} -- Base of the exponential backoff
+            max_backoff {float} -- Maximum wait between retries in seconds
+            http2 {bool} -- Multiplex the requests over one HTTP/2 connection
+        """
+        self.connect_timeout: float = connect_timeout
+        self.read_timeout: float = read_timeout
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.max_backoff: float = max_backoff
+        self.http2: bool = http2
+        self.stats: TransportStats = TransportStats()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def open(self, pool_size: int) -> None:
+        """Create the connection pool inside the running event loop.
+
+        Arguments:
+            pool_size {int} -- Requests in flight, connections without HTTP/2
+        """
+        # httpx is only imported when the API is used, e.g. not on replay
+        import httpx  # noqa: WPS433
+
+        # Over HTTP/2 the requests in flight are multiplexed over a single
+        # connection, over HTTP/1.1 each needs a connection of its own
+        if self.http2:
+            pool_size = 1
+
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            timeout=httpx.Timeout(
+                self.read_timeout,
+                connect=self.connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, params: Optional[dict] = None) -> bytes:
+        """Send a GET request and return the raw response.
+
+        Arguments:
+            url {str} -- URL
+
+        Keyword Arguments:
+            params {Optional[dict]} -- Query parameters (default: {None})
+
+        Returns:
+            bytes -- The raw response
+        """
+        return (await self.get_response(url, params)).content
+
+    async def get_response(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> 'httpx.Response':
+        """Send a GET request and return the response.
+
+        Arguments:
+            url {str} -- URL
+
+        Keyword Arguments:
+            params {Optional[dict]} -- Query parameters (default: {None})
+            headers {Optional[dict]} -- Request headers, e.g. of a
+                conditional request (default: {None})
+
+        Raises:
+            ApiError: When the API responds with an error
+
+        Returns:
+            httpx.Response -- The response, e.g. 200 or 304 Not Modified
+        """
+        import httpx  # noqa: WPS433
+
+        attempt: int = 0
+        while True:  # noqa: WPS457
+            self.stats.requests += 1
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self._client.get(  # type: ignore
+                    url,
+                    params=params,
+                    headers=headers,
+                )
+            except httpx.TransportError as err:
+                if attempt >= self.max_retries:
+                    raise
+                LOGGER.warning(f'Request failed: {err!r}, retrying')
+            else:
+                if response.status_code < 400:  # noqa: WPS432
+                    return response
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    raise _api_error(response)
+                LOGGER.warning(
+                    f'Request failed with status {response.status_code}, '
+                    'retrying',
+                )
+
+            await self._wait(attempt, response)
+            attempt += 1
+
+    async def _wait(
+        self,
+        attempt: int,
+        response: Optional['httpx.Response'],
+    ) -> None:
+        """Wait before the next attempt.
+
+        Arguments:
+            attempt {int} -- Number of the failed attempt
+            response {Optional[httpx.Response]} -- The failed response
+
+        Raises:
+            ApiError: When the response asks to wait longer than max_backoff
+        """
+        delay: Optional[float] = None
+        if response is not None:
+            delay = _retry_after(response)
+        if delay is not None and delay > self.max_backoff:
+            error: ApiError = _api_error(response)  # type: ignore
+            raise ApiError(
+                error.status,
+                error.message,
+                f'Retry-After of {delay:.0f} seconds is longer than the '
+                f'maximum backoff of {self.max_backoff:.0f} seconds',
+            )
+        if delay is None:
+            # Full jitter exponential backoff
+            delay = random.uniform(  # noqa: S311
+                0,
+                min(self.max_backoff, self.backoff_factor * 2 ** attempt),
+            )
+
+        self.stats.retries += 1
+        start: float = time.monotonic()
+        await asyncio.sleep(delay)
+        self.stats.wait_seconds += time.monotonic() - start
+
+
+def _retry_after(response: 'httpx.Response') -> Optional[float]:
+    """Parse the Retry-After header of a response.
+
+    Arguments:
+        response {httpx.Response} -- Response
+
+    Returns:
+        Optional[float] -- Seconds to wait or None when there is no header
+    """
+    retry_after: Optional[str] = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at: datetime = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _api_error(response: 'httpx.Response') -> ApiError:
+    """Create the error of a failed response.
+
+    Arguments:
+        response {httpx.Response} -- Response
+
+    Returns:
+        ApiError -- The error
+    """
+    try:
+        body: dict = response.json()
+    except ValueError:
+        body = {}
+    return ApiError(
+        response.status_code,
+        body.get('message', ''),
+        body.get('description', response.text[:200]),  # noqa: WPS432
+    )
@@ -0,0 +1,116 @@
+"""Tests of the rolling aggregates."""
+# -*- coding: utf-8 -*-
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from tap_open_exchange.aggregates import RollingAggregates
+from tap_open_exchange.exchange import OpenExchange
+from tap_open_exchange.replay import ReplayFetcher
+
+
+def _add_days(aggregates: RollingAggregates, first: str, days: int) -> None:
+    """Add the rates of consecutive days.
+
+    Arguments:
+        aggregates {RollingAggregates} -- Aggregates to add to
+        first {str} -- First day e.g. 2021-01-04
+        days {int} -- Number of days
+    """
+    for offset in range(days):
+        day: date = date.fromisoformat(first) + timedelta(days=offset)
+        aggregates.add(day.isoformat(), {'USD': 1.2 + offset / 100})
+
+
+def test_partial_periods_suppressed() -> None:
+    """A period is only emitted once no day before its last day is missing."""
+    aggregates: RollingAggregates = RollingAggregates({}, ('week',))
+    aggregates.add('2021-01-04', {'USD': 1.2})
+    aggregates.add('2021-01-06', {'USD': 1.3})
+    assert not list(aggregates.changed('EUR'))
+
+    aggregates.add('2021-01-05', {'USD': 1.1})
+    records: list = list(aggregates.changed('EUR'))
+    assert [
+        (record['period_start'], record['days']) for record in records
+    ] == [('2021-01-04', 3)]
+    assert records[0]['minimum'] == 1.1
+
+
+def test_rerun_without_new_days() -> None:
+    """A rerun that aggregates no new days emits nothing."""
+    state: dict = {}
+    aggregates: RollingAggregates = RollingAggregates(state)
+    _add_days(aggregates, '2021-01-01', 10)
+    assert list(aggregates.changed('EUR'))
+
+    state = json.loads(json.dumps(state))
+    aggregates = RollingAggregates(state)
+    aggregates.prune('2021-01-10')
+    aggregates.touch('2021-01-10')
+    _add_days(aggregates, '2021-01-04', 7)
+    assert not list(aggregates.changed('EUR'))
+
+    _add_days(aggregates, '2021-01-11', 1)
+    assert {
+        record['period'] for record in aggregates.changed('EUR')
+    } == {'week', 'month'}
+
+
+def test_interrupted_emit_repeated() -> None:
+    """A period whose records were not all emitted is emitted again."""
+    state: dict = {}
+    aggregates: RollingAggregates = RollingAggregates(state, ('week',))
+    aggregates.add('2021-01-04', {'GBP': 0.9, 'USD': 1.2})
+    next(aggregates.changed('EUR'))
+
+    aggregates = RollingAggregates(state, ('week',))
+    aggregates.touch('2021-01-04')
+    assert [
+        record['currency'] for record in aggregates.changed('EUR')
+    ] == ['GBP', 'USD']
+
+
+def test_prune() -> None:
+    """Complete periods before a day and periods before the first day go."""
+    state: dict = {}
+    aggregates: RollingAggregates = RollingAggregates(state, ('week',))
+    _add_days(aggregates, '2021-01-01', 17)
+
+    aggregates.prune('2021-01-17')
+    assert sorted(state['periods']) == ['week:2021-01-11']
+
+    aggregates.prune('2021-01-18')
+    assert not state['periods']
+
+
+def test_exchange_rerun_without_new_days(tmp_path) -> None:
+    """The aggregates stream emits nothing when no day was added."""
+    for offset in range(10):
+        day: date = date(2021, 1, 1) + timedelta(days=offset)
+        midnight: datetime = datetime.combine(
+            day,
+            datetime.min.time(),
+            tzinfo=timezone.utc,
+        )
+        (tmp_path / f'{day.isoformat()}.json').write_text(json.dumps({
+            'timestamp': int(midnight.timestamp()) + 86399,
+            'base': 'EUR',
+            'rates': {'USD': 1.2 + offset / 100},
+        }))
+
+    state: dict = {}
+    bookmark: str = '2021-01-01'
+    for emitted in (True, False):
+        exchange: OpenExchange = OpenExchange(
+            'api_key',
+            fetcher=ReplayFetcher(str(tmp_path)),
+            end_date='2021-01-10',
+        )
+        records: list = list(exchange.exchange_rate_aggregates(
+            start_date=bookmark,
+            aggregates=RollingAggregates(state),
+        ))
+        assert bool(records) is emitted
+        if records:
+            bookmark = records[-1]['date']
+        state = json.loads(json.dumps(state))
@@ -0,0 +1,17 @@
+"""Tests of the rate archive."""
+# -*- coding: utf-8 -*-
+from tap_open_exchange.archive import RateArchive
+from tap_open_exchange.replay import ReplayFetcher
+
+
+def test_empty_archive(tmp_path) -> None:
+    """An archive of a run that archived no days has no days."""
+    RateArchive(str(tmp_path)).close()
+
+    archive: RateArchive = RateArchive(str(tmp_path))
+    assert archive.day('2021-01-01') is None
+    assert not archive.read('2021-01-01', '2021-01-31')
+    assert archive.days() == []
+    archive.close()
+
+    assert ReplayFetcher(str(tmp_path)).day('EUR', '2021-01-01') is None
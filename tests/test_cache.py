@@ -0,0 +1,39 @@
+"""Tests of the response cache."""
+# -*- coding: utf-8 -*-
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from tap_open_exchange.cache import CacheKey, ResponseCache
+
+
+def test_cacheable(tmp_path) -> None:
+    """Only days before the settle days are cached."""
+    cache: ResponseCache = ResponseCache(str(tmp_path), settle_days=1)
+    today: date = datetime.now(timezone.utc).date()
+
+    for days, cacheable in ((2, True), (1, False), (0, False)):
+        day: str = (today - timedelta(days=days)).isoformat()
+        key: CacheKey = CacheKey('historical', day, 'EUR')
+        assert cache.cacheable(key) is cacheable
+
+
+def test_evict_temporary_files(tmp_path) -> None:
+    """Temporary files are no entries, left over ones are removed."""
+    cache: ResponseCache = ResponseCache(str(tmp_path), max_bytes=0)
+    key: CacheKey = CacheKey('historical', '2021-01-01', 'EUR')
+    cache.put(key, b'{}')
+
+    path: str = cache.path(key)
+    left_over: str = f'{path}.1.tmp'
+    in_progress: str = f'{path}.2.tmp'
+    for temporary in (left_over, in_progress):
+        with open(temporary, 'wb') as temporary_file:
+            temporary_file.write(b'{}')
+    stale: float = time.time() - 7200
+    os.utime(left_over, (stale, stale))
+
+    assert cache.evict() == 1
+    assert not os.path.exists(path)
+    assert not os.path.exists(left_over)
+    assert os.path.exists(in_progress)
@@ -0,0 +1,108 @@
+"""Tests of the state checkpoints."""
+# -*- coding: utf-8 -*-
+import json
+
+from tap_open_exchange import checkpoint
+from tap_open_exchange.checkpoint import Checkpointer
+
+
+def _states(capsys) -> list:
+    """Read the STATE messages that were written.
+
+    Arguments:
+        capsys {CaptureFixture} -- Fixture
+
+    Returns:
+        list -- The states
+    """
+    return [
+        json.loads(line)['value']
+        for line in capsys.readouterr().out.splitlines()
+    ]
+
+
+def test_every_records(capsys) -> None:
+    """The state is written after every_records bookmarks."""
+    state: dict = {'currently_syncing': 'exchange_rate_EUR'}
+    checkpointer: Checkpointer = Checkpointer(
+        state,
+        every_records=3,
+        every_seconds=None,
+    )
+
+    for day in range(1, 8):
+        checkpointer.update(f'2021-01-{day:02d}')
+
+    assert checkpointer.writes == 2
+    assert _states(capsys) == [{}, {}]
+
+
+def test_every_seconds(monkeypatch) -> None:
+    """The state is written once every_seconds passed since the last write."""
+    now: list = [0.0]
+    monkeypatch.setattr(checkpoint.time, 'monotonic', lambda: now[0])
+    checkpointer: Checkpointer = Checkpointer(
+        {},
+        every_records=None,
+        every_seconds=60,
+    )
+
+    checkpointer.update('2021-01-01')
+    now[0] = 59.9
+    checkpointer.update('2021-01-02')
+    assert checkpointer.writes == 0
+
+    now[0] = 60
+    checkpointer.update('2021-01-03')
+    assert checkpointer.writes == 1
+
+    now[0] = 100
+    checkpointer.update('2021-01-04')
+    assert checkpointer.writes == 1
+
+
+def test_month_boundary() -> None:
+    """With month_boundary the state is written when a month is complete."""
+    checkpointer: Checkpointer = Checkpointer(
+        {},
+        every_records=None,
+        every_seconds=None,
+        month_boundary=True,
+    )
+
+    for day in ('2021-01-30', '2021-01-31', '2021-02-01', '2021-02-02'):
+        checkpointer.update(day)
+    assert checkpointer.writes == 1
+
+    checkpointer.update('2021-03-01')
+    assert checkpointer.writes == 2
+
+
+def test_no_month_boundary() -> None:
+    """Without month_boundary a new month writes nothing."""
+    checkpointer: Checkpointer = Checkpointer(
+        {},
+        every_records=None,
+        every_seconds=None,
+    )
+
+    for day in ('2021-01-31', '2021-02-01', '2021-03-01'):
+        checkpointer.update(day)
+    assert checkpointer.writes == 0
+
+
+def test_flush_only_pending(capsys) -> None:
+    """flush writes pending changes once, and nothing without them."""
+    checkpointer: Checkpointer = Checkpointer(
+        {'bookmarks': {}},
+        every_records=None,
+        every_seconds=None,
+    )
+    checkpointer.flush()
+    assert checkpointer.writes == 0
+
+    checkpointer.update('2021-01-01')
+    checkpointer.flush()
+    checkpointer.flush()
+    assert checkpointer.writes == 1
+    assert _states(capsys) == [{'bookmarks': {}}]
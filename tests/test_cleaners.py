@@ -0,0 +1,49 @@
+"""Tests of the cleaners."""
+# -*- coding: utf-8 -*-
+from tap_open_exchange.cleaners import (
+    BATCH_CLEANERS,
+    CLEANERS,
+    clean_row,
+    iter_rows,
+)
+from tap_open_exchange.streams import STREAMS
+
+
+def test_cleaner_matches_mapping() -> None:
+    """The per-record cleaner cleans like the stream mapping."""
+    response_data: dict = {
+        'timestamp': '2021-01-01T23:59:59.000000',
+        'base': 'EUR',
+        'rates': {'USD': 1.2, 'VES': 0},
+    }
+    mapping: dict = STREAMS['exchange_rate_EUR']['mapping']
+
+    assert CLEANERS['exchange_rate_EUR'](
+        '2021-01-01',
+        response_data,
+    ) == clean_row(
+        {
+            **{key: response_data['rates'].get(key) for key in mapping},
+            'timestamp': response_data['timestamp'],
+            'base': response_data['base'],
+        },
+        mapping,
+    )
+
+
+def test_cleaner_matches_batch() -> None:
+    """The compiled cleaners of every stream clean alike."""
+    responses: list = [
+        ('2021-01-01', {
+            'timestamp': '2021-01-01T23:59:59.000000',
+            'base': 'EUR',
+            'rates': {'USD': 1.2, 'GBP': 0.9},
+        }),
+        ('2021-01-02', {'timestamp': '2021-01-02T23:59:59.000000'}),
+    ]
+
+    for stream_name, cleaner in CLEANERS.items():
+        assert [
+            cleaner(date_day, response_data)
+            for date_day, response_data in responses
+        ] == list(iter_rows(BATCH_CLEANERS[stream_name](responses)))
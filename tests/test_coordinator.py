@@ -0,0 +1,160 @@
+"""Tests of the responses shared between streams."""
+# -*- coding: utf-8 -*-
+from typing import AbstractSet, Generator, Iterable, List, Tuple
+
+from tap_open_exchange.coordinator import FetchCoordinator
+from tap_open_exchange.fetcher import CacheKey, FetchRequest
+
+
+class KeyFetcher(object):
+    """Respond to every request with its key, except the missing days."""
+
+    cache = None
+
+    def __init__(self, missing: AbstractSet[str] = frozenset()) -> None:
+        """Initialize fetcher.
+
+        Keyword Arguments:
+            missing {AbstractSet[str]} -- Days without a response, as in a
+                replay (default: {frozenset()})
+        """
+        self.missing: AbstractSet[str] = missing
+        self.fetched: List[str] = []
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Yield the response of every request that is not missing.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to fetch
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        for request in requests:
+            self.fetched.append(request.key)
+            if request.key not in self.missing:
+                yield request, {'key': request.key}
+
+
+def _request(day: str, refresh: bool = False) -> FetchRequest:
+    """Build the historical request of a day.
+
+    Arguments:
+        day {str} -- Day e.g. 2021-01-01
+
+    Keyword Arguments:
+        refresh {bool} -- Bypass the cache (default: {False})
+
+    Returns:
+        FetchRequest -- The request
+    """
+    return FetchRequest(
+        day,
+        f'historical/{day}.json',
+        cache_key=CacheKey('historical', day, 'EUR'),
+        refresh=refresh,
+    )
+
+
+def _days(first: int, last: int) -> List[str]:
+    """List the days of January 2021.
+
+    Arguments:
+        first {int} -- First day of the month
+        last {int} -- Last day of the month
+
+    Returns:
+        List[str] -- The days
+    """
+    return [f'2021-01-{day:02d}' for day in range(first, last + 1)]
+
+
+def _keys(responses: Iterable[Tuple[FetchRequest, dict]]) -> List[str]:
+    """Return the keys of the responses.
+
+    Arguments:
+        responses {Iterable[Tuple[FetchRequest, dict]]} -- Responses
+
+    Returns:
+        List[str] -- Key of every response, in order
+    """
+    return [response['key'] for _, response in responses]
+
+
+def test_kept_responses_in_order() -> None:
+    """Kept responses are not fetched again and stay in request order."""
+    fetcher: KeyFetcher = KeyFetcher()
+    coordinator: FetchCoordinator = FetchCoordinator(fetcher)  # type: ignore
+
+    assert _keys(coordinator.fetch(map(_request, _days(2, 3)))) == _days(2, 3)
+    fetcher.fetched.clear()
+
+    assert _keys(coordinator.fetch(map(_request, _days(1, 5)))) == _days(1, 5)
+    assert fetcher.fetched == ['2021-01-01', '2021-01-04', '2021-01-05']
+    assert coordinator.hits == 2
+    assert coordinator.contains(_request('2021-01-05'))
+
+
+def test_keep_first_days() -> None:
+    """Only the first max_days days of responses are kept."""
+    fetcher: KeyFetcher = KeyFetcher()
+    coordinator: FetchCoordinator = FetchCoordinator(
+        fetcher,  # type: ignore
+        max_days=3,
+    )
+    list(coordinator.fetch(map(_request, _days(1, 5))))
+    fetcher.fetched.clear()
+
+    list(coordinator.fetch(map(_request, _days(1, 5))))
+    assert fetcher.fetched == ['2021-01-04', '2021-01-05']
+
+    window: FetchRequest = FetchRequest(
+        '2021-01-10',
+        'time-series.json',
+        cache_key=CacheKey('time-series', '2021-01-10..2021-01-11', 'EUR'),
+    )
+    list(coordinator.fetch([window]))
+    assert not coordinator.contains(window)
+
+
+def test_keep_nothing() -> None:
+    """With max_days 0 every request is fetched."""
+    fetcher: KeyFetcher = KeyFetcher()
+    coordinator: FetchCoordinator = FetchCoordinator(
+        fetcher,  # type: ignore
+        max_days=0,
+    )
+    for _ in range(2):
+        list(coordinator.fetch(map(_request, _days(1, 2))))
+
+    assert fetcher.fetched == _days(1, 2) * 2
+    assert coordinator.hits == 0
+
+
+def test_refresh_bypasses_kept_response() -> None:
+    """A refresh only gets a response that was refreshed as well."""
+    fetcher: KeyFetcher = KeyFetcher()
+    coordinator: FetchCoordinator = FetchCoordinator(fetcher)  # type: ignore
+
+    list(coordinator.fetch([_request('2021-01-01')]))
+    assert not coordinator.contains(_request('2021-01-01', refresh=True))
+
+    list(coordinator.fetch([_request('2021-01-01', refresh=True)]))
+    assert coordinator.contains(_request('2021-01-01', refresh=True))
+    assert fetcher.fetched == ['2021-01-01', '2021-01-01']
+
+
+def test_skipped_requests() -> None:
+    """Requests the fetcher skips do not reorder the kept responses."""
+    fetcher: KeyFetcher = KeyFetcher({'2021-01-02', '2021-01-05'})
+    coordinator: FetchCoordinator = FetchCoordinator(fetcher)  # type: ignore
+    list(coordinator.fetch(map(_request, ['2021-01-01', '2021-01-03'])))
+
+    assert _keys(coordinator.fetch(map(_request, _days(1, 5)))) == [
+        '2021-01-01',
+        '2021-01-03',
+        '2021-01-04',
+    ]
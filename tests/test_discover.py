@@ -0,0 +1,53 @@
+"""Tests of the cached catalog."""
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from tap_open_exchange import discover
+
+
+def test_catalog_cache(tmp_path, monkeypatch) -> None:
+    """A cached catalog is compiled once and loads as compiled."""
+    catalog, messages = discover.load_catalog('1.0.0', str(tmp_path))
+    cached: list = os.listdir(tmp_path)
+    assert len(cached) == 1
+
+    def compile_catalog() -> None:  # noqa: WPS430
+        raise AssertionError('The catalog is compiled again')
+
+    monkeypatch.setattr(discover, 'compile_catalog', compile_catalog)
+    hit_catalog, hit_messages = discover.load_catalog('1.0.0', str(tmp_path))
+
+    assert hit_catalog.to_dict() == catalog.to_dict()
+    assert hit_messages == messages
+    assert os.listdir(tmp_path) == cached
+
+
+def test_catalog_cache_per_version(tmp_path) -> None:
+    """The catalog of another version replaces the cached one."""
+    discover.load_catalog('1.0.0', str(tmp_path))
+    discover.load_catalog('1.0.1', str(tmp_path))
+
+    cached: list = os.listdir(tmp_path)
+    assert len(cached) == 1
+    assert cached[0].startswith('catalog-1.0.1-')
+
+
+@pytest.mark.parametrize('cache_dir', [None, 'file'])
+def test_catalog_not_cached(tmp_path, cache_dir) -> None:
+    """Without a writable cache directory the catalog is compiled."""
+    path: str = str(tmp_path / 'file')
+    with open(path, 'w') as not_a_directory:
+        not_a_directory.write('')
+
+    catalog, messages = discover.load_catalog(
+        '1.0.0',
+        path if cache_dir else None,
+    )
+
+    assert catalog.to_dict() == discover.compile_catalog().to_dict()
+    assert set(messages) == {
+        stream.tap_stream_id for stream in catalog.streams
+    }
+    assert os.listdir(tmp_path) == ['file']
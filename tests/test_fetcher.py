@@ -0,0 +1,92 @@
+"""Tests of the concurrent fetch engine."""
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+from typing import Optional
+
+from tap_open_exchange.fetcher import FetchRequest, Fetcher
+
+
+class SlowTransport(object):
+    """Respond to every request after a delay given by its URL."""
+
+    def __init__(self) -> None:
+        """Initialize transport."""
+        self.pool_size: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.completed: list = []
+
+    async def open(self, pool_size: int) -> None:
+        """Open the pool.
+
+        Arguments:
+            pool_size {int} -- Requests in flight
+        """
+        self.pool_size = pool_size
+
+    async def aclose(self) -> None:
+        """Nothing to close."""
+
+    async def get(self, url: str, params: Optional[dict] = None) -> bytes:
+        """Respond after the delay in milliseconds of the URL.
+
+        Arguments:
+            url {str} -- URL e.g. 30
+
+        Keyword Arguments:
+            params {Optional[dict]} -- Query parameters (default: {None})
+
+        Returns:
+            bytes -- The URL and the query parameters
+        """
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(int(url) / 1000)
+        finally:
+            self.in_flight -= 1
+        self.completed.append(url)
+        return json.dumps({'url': url, 'params': params}).encode()
+
+
+def test_fetch_order_under_concurrency() -> None:
+    """Responses are yielded in request order, not in completion order."""
+    transport: SlowTransport = SlowTransport()
+    fetcher: Fetcher = Fetcher(transport, concurrency=3)  # type: ignore
+    delays: list = [40, 5, 30, 1, 20, 10, 1, 15, 5, 1]
+    requests: list = [
+        FetchRequest(str(day), str(delay), {'day': day})
+        for day, delay in enumerate(delays)
+    ]
+
+    try:
+        responses: list = list(fetcher.fetch(requests))
+    finally:
+        fetcher.close()
+
+    assert [request for request, _ in responses] == requests
+    assert [response for _, response in responses] == [
+        {'url': str(delay), 'params': {'day': day}}
+        for day, delay in enumerate(delays)
+    ]
+    assert transport.completed != [str(delay) for delay in delays]
+    assert transport.max_in_flight == 3
+    assert transport.pool_size == 3
+
+
+def test_fetch_stops_early() -> None:
+    """Requests in flight are cancelled when the consumer stops."""
+    transport: SlowTransport = SlowTransport()
+    fetcher: Fetcher = Fetcher(transport, concurrency=2)  # type: ignore
+    requests: list = [FetchRequest(str(day), '50') for day in range(10)]
+
+    try:
+        for request, _ in fetcher.fetch(requests):
+            assert request.key == '0'
+            break
+    finally:
+        fetcher.close()
+
+    assert transport.in_flight == 0
+    assert len(transport.completed) < len(requests)
@@ -0,0 +1,171 @@
+"""Tests of the polled latest stream."""
+# -*- coding: utf-8 -*-
+from typing import List, Optional, Tuple
+
+from tap_open_exchange import exchange as exchange_module
+from tap_open_exchange.exchange import OpenExchange
+from tap_open_exchange.fetcher import FetchRequest, Validators
+
+# 2021-01-01T12:00:00
+NOON: int = 1609502400
+
+
+class PollFetcher(object):
+    """Serve a snapshot, or None when unchanged, per poll."""
+
+    cache = None
+
+    def __init__(self, snapshots: List[Optional[int]]) -> None:
+        """Initialize fetcher.
+
+        Arguments:
+            snapshots {List[Optional[int]]} -- Provider timestamp per poll,
+                None when the snapshot did not change
+        """
+        self.snapshots: List[Optional[int]] = snapshots
+        self.polls: int = 0
+
+    def poll(
+        self,
+        request: FetchRequest,
+        validators: Validators = Validators(),
+    ) -> Tuple[Optional[dict], Validators]:
+        """Return the snapshot of the next poll.
+
+        Arguments:
+            request {FetchRequest} -- The request
+
+        Keyword Arguments:
+            validators {Validators} -- Validators of the last response
+
+        Returns:
+            Tuple[Optional[dict], Validators] -- Snapshot and validators
+        """
+        timestamp: Optional[int] = self.snapshots[self.polls]
+        self.polls += 1
+        if timestamp is None:
+            return None, validators
+        return {
+            'timestamp': timestamp,
+            'base': 'EUR',
+            'rates': {'USD': 1.2},
+        }, Validators(digest=str(timestamp))
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+class Clock(object):
+    """Monotonic clock that only moves when slept."""
+
+    def __init__(self) -> None:
+        """Initialize clock."""
+        self.now: float = 0
+        self.sleeps: list = []
+
+    def monotonic(self) -> float:
+        """Return the time.
+
+        Returns:
+            float -- Seconds slept
+        """
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Move the clock.
+
+        Arguments:
+            seconds {float} -- Seconds to sleep
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _poll(
+    monkeypatch,
+    snapshots: List[Optional[int]],
+    duration: float,
+    timestamp: str = '',
+) -> Tuple[list, PollFetcher, Clock, list]:
+    """Poll the latest stream with a fake clock.
+
+    Arguments:
+        monkeypatch {MonkeyPatch} -- Fixture
+        snapshots {List[Optional[int]]} -- Provider timestamp per poll
+        duration {float} -- Seconds to keep polling
+
+    Keyword Arguments:
+        timestamp {str} -- Timestamp of the last snapshot (default: {''})
+
+    Returns:
+        Tuple[list, PollFetcher, Clock, list] -- Records, fetcher, clock and
+            the clock times of the waiting callbacks
+    """
+    clock: Clock = Clock()
+    monkeypatch.setattr(exchange_module.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(exchange_module.time, 'sleep', clock.sleep)
+
+    fetcher: PollFetcher = PollFetcher(snapshots)
+    exchange: OpenExchange = OpenExchange(
+        'api_key',
+        fetcher=fetcher,
+        latest_interval=60,
+        latest_duration=duration,
+    )
+    waits: list = []
+    records: list = list(exchange.exchange_rate_latest(
+        timestamp=timestamp,
+        waiting=lambda: waits.append(clock.now),
+    ))
+    return records, fetcher, clock, waits
+
+
+def test_single_poll(monkeypatch) -> None:
+    """Without a duration the latest rates are polled once."""
+    records, fetcher, clock, waits = _poll(monkeypatch, [NOON], 0)
+
+    assert [record['timestamp'] for record in records] == [
+        '2021-01-01T12:00:00.000000',
+    ]
+    assert fetcher.polls == 1
+    assert not clock.sleeps
+    assert not waits
+
+
+def test_poll_until_duration(monkeypatch) -> None:
+    """Polls continue while the next one starts within the duration."""
+    records, fetcher, clock, waits = _poll(
+        monkeypatch,
+        [NOON, None, NOON + 60, NOON + 60],
+        180,
+    )
+
+    assert [record['timestamp'] for record in records] == [
+        '2021-01-01T12:00:00.000000',
+        '2021-01-01T12:01:00.000000',
+    ]
+    assert fetcher.polls == 4
+    assert clock.sleeps == [60, 60, 60]
+    assert waits == [0, 60, 120]
+
+
+def test_poll_stops_before_deadline(monkeypatch) -> None:
+    """No poll starts when the next interval ends after the duration."""
+    _, fetcher, clock, _ = _poll(monkeypatch, [NOON, NOON], 119)
+
+    assert fetcher.polls == 2
+    assert clock.sleeps == [60]
+
+
+def test_resume_after_last_snapshot(monkeypatch) -> None:
+    """Snapshots up to the timestamp of the state are not emitted again."""
+    records, _, _, _ = _poll(
+        monkeypatch,
+        [NOON, NOON + 60],
+        60,
+        timestamp='2021-01-01T12:00:00.000000',
+    )
+
+    assert [record['timestamp'] for record in records] == [
+        '2021-01-01T12:01:00.000000',
+    ]
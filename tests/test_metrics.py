@@ -0,0 +1,73 @@
+"""Tests of the run metrics."""
+# -*- coding: utf-8 -*-
+from tap_open_exchange import metrics as run_metrics
+from tap_open_exchange.metrics import RunMetrics
+
+
+def _patch(monkeypatch) -> tuple:
+    """Replace the clock and the METRIC log of the metrics.
+
+    Arguments:
+        monkeypatch {MonkeyPatch} -- Fixture
+
+    Returns:
+        tuple -- The time, a list of one value, and the logged metrics
+    """
+    now: list = [0.0]
+    logged: list = []
+    monkeypatch.setattr(run_metrics.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(
+        run_metrics,
+        '_log',
+        lambda metric_type, metric, metric_value, phase='', summary=False: (
+            logged.append((metric, metric_value, summary))
+        ),
+    )
+    return now, logged
+
+
+def test_tick_emits_after_interval(monkeypatch) -> None:
+    """Metrics are only emitted once the log interval has passed."""
+    now, logged = _patch(monkeypatch)
+    run: RunMetrics = RunMetrics(log_interval=60)
+
+    run.add('decode', 0.5)
+    run.count('http_request_count')
+    now[0] = 59.9
+    run.tick()
+    assert not logged
+
+    now[0] = 60
+    run.tick()
+    assert logged == [
+        ('decode_duration', 0.5, False),
+        ('http_request_count', 1, False),
+    ]
+
+    # The interval restarts at the emit
+    logged.clear()
+    run.count('http_request_count', 2)
+    now[0] = 119.9
+    run.tick()
+    assert not logged
+    now[0] = 120
+    run.tick()
+    assert logged == [('http_request_count', 2, False)]
+
+
+def test_summary_totals(monkeypatch) -> None:
+    """The summary emits the pending metrics and the totals of the run."""
+    now, logged = _patch(monkeypatch)
+    run: RunMetrics = RunMetrics(log_interval=60)
+
+    run.count('records_cleaned', 3)
+    now[0] = 60
+    run.tick()
+    run.count('records_cleaned', 4)
+    logged.clear()
+    run.summary()
+
+    assert ('records_cleaned', 4, False) in logged
+    assert ('records_cleaned', 7, True) in logged
+    assert ('decode_duration', 0, True) in logged
+    assert run.total_counts['records_cleaned'] == 7
@@ -0,0 +1,167 @@
+"""Tests of the fetch planner."""
+# -*- coding: utf-8 -*-
+import pytest
+
+from tap_open_exchange.planner import DayRanges, plan_days, schedule_days
+
+
+def test_merge_touching_ranges() -> None:
+    """Ranges that touch are merged into one."""
+    ranges: DayRanges = DayRanges()
+    ranges.add_range('2021-01-06', '2021-01-10')
+    ranges.add_range('2021-01-01', '2021-01-05')
+    ranges.add('2021-01-11')
+
+    assert ranges.ranges == [['2021-01-01', '2021-01-11']]
+
+
+def test_merge_overlapping_ranges() -> None:
+    """Ranges that overlap are merged, also across ranges between them."""
+    ranges: DayRanges = DayRanges()
+    ranges.add_range('2021-01-01', '2021-01-10')
+    ranges.add_range('2021-01-05', '2021-01-12')
+    ranges.add_range('2021-01-20', '2021-01-25')
+    ranges.add_range('2021-02-01', '2021-02-03')
+    assert ranges.ranges == [
+        ['2021-01-01', '2021-01-12'],
+        ['2021-01-20', '2021-01-25'],
+        ['2021-02-01', '2021-02-03'],
+    ]
+
+    ranges.add_range('2021-01-11', '2021-01-22')
+    assert ranges.ranges == [
+        ['2021-01-01', '2021-01-25'],
+        ['2021-02-01', '2021-02-03'],
+    ]
+
+
+def test_ranges_in_place() -> None:
+    """The ranges of a state are changed in place."""
+    completed: list = [['2021-01-01', '2021-01-02']]
+    DayRanges(completed).add('2021-01-03')
+
+    assert completed == [['2021-01-01', '2021-01-03']]
+
+
+def test_missing() -> None:
+    """Missing days are the days between and around the ranges."""
+    ranges: DayRanges = DayRanges.parse([
+        ['2021-01-02', '2021-01-03'],
+        '2021-01-05',
+    ])
+
+    assert list(ranges.missing('2021-01-01', '2021-01-07')) == [
+        '2021-01-01',
+        '2021-01-04',
+        '2021-01-06',
+        '2021-01-07',
+    ]
+    assert not list(ranges.missing('2021-01-02', '2021-01-03'))
+
+
+def test_plan_without_manifest() -> None:
+    """Without a manifest the completed days are done."""
+    completed: DayRanges = DayRanges([['2021-01-01', '2021-01-03']])
+
+    assert plan_days('2021-01-06', '2021-01-08', completed) == [
+        '2021-01-04',
+        '2021-01-05',
+        '2021-01-06',
+        '2021-01-07',
+        '2021-01-08',
+    ]
+
+
+def test_plan_with_manifest() -> None:
+    """The manifest decides until its last day, the completed days after."""
+    completed: DayRanges = DayRanges([['2021-01-01', '2021-01-08']])
+    manifest: DayRanges = DayRanges.parse([
+        '2021-01-01',
+        '2021-01-02',
+        ['2021-01-04', '2021-01-05'],
+    ])
+
+    assert plan_days('2021-01-09', '2021-01-10', completed, manifest) == [
+        '2021-01-03',
+        '2021-01-09',
+        '2021-01-10',
+    ]
+
+
+def test_run_end_on_gap() -> None:
+    """The run of a day ends at the range that holds or precedes it."""
+    ranges: DayRanges = DayRanges([
+        ['2021-01-01', '2021-01-03'],
+        ['2021-01-05', '2021-01-06'],
+    ])
+
+    assert ranges.run_end('2021-01-02') == '2021-01-03'
+    assert ranges.run_end('2021-01-04') == '2021-01-03'
+    assert ranges.run_end('2021-01-05') == '2021-01-06'
+    assert ranges.run_end('2021-01-07') == '2021-01-06'
+    assert ranges.run_end('2021-01-08') is None
+    assert ranges.run_end('2020-12-31') is None
+
+
+def test_schedule_newest_with_priority() -> None:
+    """Priority blocks come first, the other blocks newest first."""
+    days: list = [f'2021-01-{day:02d}' for day in range(1, 11)]
+
+    assert schedule_days(
+        days,
+        'newest',
+        [['2021-01-04', '2021-01-05']],
+        block_days=3,
+    ) == [
+        '2021-01-04',
+        '2021-01-05',
+        '2021-01-08',
+        '2021-01-09',
+        '2021-01-10',
+        '2021-01-06',
+        '2021-01-07',
+        '2021-01-01',
+        '2021-01-02',
+        '2021-01-03',
+    ]
+
+
+def test_schedule_oldest_keeps_order() -> None:
+    """Oldest first without priority is the order of the days."""
+    days: list = [f'2021-01-{day:02d}' for day in (1, 2, 3, 7, 8, 20)]
+    assert schedule_days(days, block_days=2) == days
+
+
+def test_schedule_newest_blocks_ascending() -> None:
+    """Newest first blocks are full at the end and ascending inside."""
+    days: list = [f'2021-01-{day:02d}' for day in range(1, 8)]
+    assert schedule_days(days, 'newest', block_days=3) == [
+        '2021-01-05',
+        '2021-01-06',
+        '2021-01-07',
+        '2021-01-02',
+        '2021-01-03',
+        '2021-01-04',
+        '2021-01-01',
+    ]
+
+
+def test_schedule_priority_order() -> None:
+    """Priority days and ranges come first, most important first."""
+    days: list = [f'2021-01-{day:02d}' for day in range(1, 11)]
+    scheduled: list = schedule_days(
+        days,
+        priority=['2021-01-09', ['2021-01-02', '2021-01-03'], '2021-01-30'],
+    )
+
+    assert scheduled[:3] == ['2021-01-09', '2021-01-02', '2021-01-03']
+    assert scheduled[3:] == [
+        day for day in days
+        if day not in {'2021-01-09', '2021-01-02', '2021-01-03'}
+    ]
+
+
+def test_schedule_unknown_order() -> None:
+    """An unknown order is refused."""
+    with pytest.raises(ValueError):
+        schedule_days(['2021-01-01'], 'random')
@@ -0,0 +1,166 @@
+"""Tests of the request budget."""
+# -*- coding: utf-8 -*-
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Generator, Iterable, Tuple
+
+import pytest
+from singer.catalog import Catalog
+
+from tap_open_exchange.discover import discover
+from tap_open_exchange.exchange import OpenExchange
+from tap_open_exchange.fetcher import FetchRequest
+from tap_open_exchange.quota import RequestBudget, parse_usage
+from tap_open_exchange.sync import sync
+
+
+class UsageFetcher(object):
+    """Serve a usage response and the historical rates of every day."""
+
+    cache = None
+
+    def __init__(self, remaining: int) -> None:
+        """Initialize fetcher.
+
+        Arguments:
+            remaining {int} -- Requests remaining, -1 when unlimited
+        """
+        self.remaining: int = remaining
+        self.days: list = []
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Yield the response of every request.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to fetch
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        for request in requests:
+            if request.key == 'usage':
+                yield request, {'data': {'usage': {
+                    'requests_remaining': self.remaining,
+                    'days_remaining': 10,
+                }}}
+                continue
+
+            self.days.append(request.key)
+            midnight: datetime = datetime.combine(
+                date.fromisoformat(request.key),
+                datetime.min.time(),
+                tzinfo=timezone.utc,
+            )
+            yield request, {
+                'timestamp': int(midnight.timestamp()) + 86399,
+                'base': 'EUR',
+                'rates': {'USD': 1.2},
+            }
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def _exchange(remaining: int, quota_state: dict) -> OpenExchange:
+    """Build a client with a request budget.
+
+    Arguments:
+        remaining {int} -- Requests remaining, -1 when unlimited
+        quota_state {dict} -- State of the budget
+
+    Returns:
+        OpenExchange -- The client
+    """
+    return OpenExchange(
+        'api_key',
+        fetcher=UsageFetcher(remaining),
+        end_date='2021-01-10',
+        quota_state=quota_state,
+        quota_reserve_per_day=0,
+        incremental_days=3,
+    )
+
+
+def _requests(exchange: OpenExchange) -> Generator[FetchRequest, None, None]:
+    """Build the historical requests of the first ten days of 2021.
+
+    Arguments:
+        exchange {OpenExchange} -- The client
+
+    Yields:
+        Generator[FetchRequest] -- A request per day
+    """
+    for day in range(1, 11):
+        yield exchange._historical_request(f'2021-01-{day:02d}', 'EUR')
+
+
+def test_parse_usage() -> None:
+    """Usage without a limit is unlimited."""
+    assert parse_usage({}) == (-1, 0)
+    assert parse_usage({'data': {'usage': {
+        'requests_remaining': 5,
+        'days_remaining': 3,
+    }}}) == (5, 3)
+
+
+def test_reserve() -> None:
+    """The reserve is not available to backfills."""
+    budget: RequestBudget = RequestBudget({}, 100, 6, 40)
+    assert budget.rate == 10
+    assert sum(budget.take() for _ in range(100)) == 60
+
+
+def test_refill() -> None:
+    """Tokens refill at the rate up to the capacity."""
+    state: dict = {'tokens': 0, 'updated': time.time() - 43200}
+    budget: RequestBudget = RequestBudget(state, 100, 10, 0)
+    assert budget.tokens == pytest.approx(5, abs=0.01)
+    assert state['tokens'] == pytest.approx(5, abs=0.01)
+
+    state = {'tokens': 0, 'updated': time.time() - 864000}
+    assert RequestBudget(state, 100, 10, 0, burst=20).tokens == 20
+
+
+def test_unlimited_quota() -> None:
+    """An unlimited quota is not budgeted."""
+    exchange: OpenExchange = _exchange(-1, {})
+    assert len(list(exchange._budgeted(_requests(exchange)))) == 10
+    assert exchange.quota_state is None
+
+
+def test_incremental_days_exempt() -> None:
+    """Requests of the incremental days are sent without a budget."""
+    exchange: OpenExchange = _exchange(0, {})
+    assert [
+        request.key for request in exchange._budgeted(_requests(exchange))
+    ] == ['2021-01-08', '2021-01-09', '2021-01-10']
+
+
+def test_deferred_days_keep_bookmark() -> None:
+    """Deferred days with an end date keep the bookmark before them."""
+    catalog: Catalog = discover()
+    for stream in catalog.streams:
+        stream.metadata[0]['metadata']['selected'] = (
+            stream.tap_stream_id == 'exchange_rate_EUR'
+        )
+
+    state: dict = {}
+    sync(_exchange(0, {}), state, catalog, '2021-01-01')
+    assert state['bookmarks']['exchange_rate_EUR'] == {
+        'start_date': '2021-01-01',
+        'completed': [['2021-01-08', '2021-01-10']],
+    }
+
+    exchange: OpenExchange = _exchange(100, {})
+    sync(exchange, state, catalog, '2021-01-01')
+    assert exchange.fetcher.days == [  # type: ignore
+        (date(2021, 1, 1) + timedelta(days=day)).isoformat()
+        for day in range(7)
+    ]
+    assert state['bookmarks']['exchange_rate_EUR'] == {
+        'start_date': '2021-01-11',
+        'completed': [['2021-01-01', '2021-01-10']],
+    }
@@ -0,0 +1,40 @@
+"""Tests of the derived base currencies."""
+# -*- coding: utf-8 -*-
+import pytest
+
+from tap_open_exchange.rebase import rebase
+from tap_open_exchange.streams import CURRENCIES
+
+RATES: dict = {'EUR': 1.0, 'USD': 1.25, 'GBP': 0.9, 'JPY': 130.0}
+
+
+def test_fetched_base_unchanged() -> None:
+    """The fetched base keeps its rates, for every currency."""
+    (base, rates), = rebase(RATES, 'EUR', ['EUR'])
+
+    assert base == 'EUR'
+    assert list(rates) == list(CURRENCIES)
+    assert {
+        currency: rate for currency, rate in rates.items()
+        if rate is not None
+    } == RATES
+
+
+def test_derived_base() -> None:
+    """The rates of a base are divided by the rate of that base."""
+    derived: dict = dict(rebase(RATES, 'EUR', ['EUR', 'USD', 'GBP']))
+
+    assert list(derived) == ['EUR', 'USD', 'GBP']
+    assert derived['USD']['USD'] == 1
+    assert derived['USD']['EUR'] == pytest.approx(0.8)
+    assert derived['USD']['JPY'] == pytest.approx(104)
+    assert derived['GBP']['USD'] == pytest.approx(1.25 / 0.9)
+    assert derived['USD']['AED'] is None
+
+
+def test_base_without_rate_skipped() -> None:
+    """A base without a rate, or with a zero rate, is not derived."""
+    rates: dict = {**RATES, 'BTC': 0}
+    assert [
+        base for base, _ in rebase(rates, 'EUR', ['CHF', 'BTC', 'USD'])
+    ] == ['USD']
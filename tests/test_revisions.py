@@ -0,0 +1,112 @@
+"""Tests of the revision index."""
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+from tap_open_exchange.exchange import OpenExchange
+from tap_open_exchange.revisions import RevisionIndex
+
+
+def _records(day: str, rate: float = 1.2) -> list:
+    """Build the records of a day.
+
+    Arguments:
+        day {str} -- Day e.g. 2021-01-01
+
+    Keyword Arguments:
+        rate {float} -- USD rate (default: {1.2})
+
+    Returns:
+        list -- The records
+    """
+    return [{
+        'timestamp': f'{day}T23:59:59.000000',
+        'base': 'EUR',
+        'USD': rate,
+    }]
+
+
+def test_changed_digest() -> None:
+    """Only records that differ from the committed digest changed."""
+    revisions: RevisionIndex = RevisionIndex({}, 7)
+    assert revisions.changed('2021-01-01', _records('2021-01-01'))
+    revisions.commit('2021-01-01')
+
+    assert not revisions.changed('2021-01-01', _records('2021-01-01'))
+    assert revisions.changed('2021-01-01', _records('2021-01-01', 1.3))
+
+
+def test_commit_after_emit() -> None:
+    """A revision whose records were not emitted is detected again."""
+    digests: dict = {}
+    exchange: OpenExchange = OpenExchange('api_key', end_date='2021-01-10')
+    revisions: RevisionIndex = RevisionIndex(digests, 7)
+    records: list = _records('2021-01-01') + _records('2021-01-02')
+
+    emitted: list = list(islice(
+        exchange._revised(records, revisions, frozenset()),
+        1,
+    ))
+    assert emitted == records[:1]
+    assert not digests
+
+    revisions = RevisionIndex(digests, 7)
+    assert list(exchange._revised(records, revisions, frozenset())) == records
+    assert sorted(digests) == ['2021-01-01', '2021-01-02']
+
+    revised: list = _records('2021-01-01', 1.3) + _records('2021-01-02')
+    assert list(exchange._revised(
+        revised,
+        RevisionIndex(digests, 7),
+        frozenset(('2021-01-01', '2021-01-02')),
+    )) == revised[:1]
+
+
+def test_prune_outside_lookback() -> None:
+    """Only the digests of the lookback of the latest day are kept."""
+    digests: dict = {}
+    revisions: RevisionIndex = RevisionIndex(digests, 2)
+    for day in range(1, 6):
+        date_day: str = f'2021-01-{day:02d}'
+        revisions.changed(date_day, _records(date_day))
+        revisions.commit(date_day)
+
+    assert sorted(digests) == ['2021-01-04', '2021-01-05']
+
+
+def test_prune_keeps_lookback_days() -> None:
+    """The index holds a digest per day of the lookback, not more."""
+    digests: dict = {}
+    exchange: OpenExchange = OpenExchange(
+        'api_key',
+        end_date='2021-02-28',
+        lookback_days=7,
+    )
+    revisions: RevisionIndex = RevisionIndex(digests, 7)
+    for day in range(1, 32):
+        date_day: str = f'2021-01-{day:02d}'
+        revisions.changed(date_day, _records(date_day))
+        revisions.commit(date_day)
+        assert len(digests) == min(day, 7)
+
+    assert set(digests) == exchange._lookback_days('2021-02-01', revisions)
+
+
+def test_lookback_days() -> None:
+    """The lookback starts once days are indexed and ends at the last day."""
+    exchange: OpenExchange = OpenExchange(
+        'api_key',
+        end_date='2021-01-10',
+        lookback_days=3,
+    )
+    revisions: RevisionIndex = RevisionIndex({}, 3)
+    assert not exchange._lookback_days('2021-01-08', revisions)
+
+    revisions.digests['2021-01-07'] = '3f2a9c0d1e4b5a67'
+    assert exchange._lookback_days('2021-01-08', revisions) == {
+        '2021-01-05',
+        '2021-01-06',
+        '2021-01-07',
+    }
+    assert exchange._lookback_days('2021-01-13', revisions) == {
+        '2021-01-10',
+    }
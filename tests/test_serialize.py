@@ -0,0 +1,59 @@
+"""Tests of the RECORD serializer."""
+# -*- coding: utf-8 -*-
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import singer
+
+from tap_open_exchange.serialize import RecordWriter
+
+TIME_EXTRACTED: datetime = datetime(2021, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _singer(record: dict) -> str:
+    """Format a RECORD message with singer.
+
+    Arguments:
+        record {dict} -- Record
+
+    Returns:
+        str -- The message
+    """
+    return singer.format_message(singer.RecordMessage(
+        'exchange_rate_EUR',
+        record,
+        time_extracted=TIME_EXTRACTED,
+    ))
+
+
+def test_template_matches_singer() -> None:
+    """The template serializer writes the same bytes as singer."""
+    output: io.StringIO = io.StringIO()
+    writer: RecordWriter = RecordWriter('exchange_rate_EUR', output=output)
+    records: list = [
+        {'timestamp': '2021-01-01T23:59:59.000000', 'base': 'EUR'},
+        {'USD': 1.2, 'VES': None, 'JPY': 126.0, 'BTC': 1e-05},
+        {'name': 'Złoty "PLN"\n', 'count': 2 ** 70},
+        {'nan': float('nan'), 'inf': float('inf')},
+        {'rate': Decimal('1.25')},
+    ]
+
+    for record in records:
+        writer.write(record, TIME_EXTRACTED)
+
+    assert output.getvalue() == ''.join(
+        f'{_singer(record)}\n' for record in records
+    )
+
+
+def test_dumps_falls_back_to_singer() -> None:
+    """Records the orjson encoder rejects are formatted by singer."""
+    def dumps(message: dict) -> bytes:  # noqa: WPS430
+        raise TypeError('Integer exceeds 64-bit range')
+
+    writer: RecordWriter = RecordWriter('exchange_rate_EUR')
+    writer._dumps = dumps
+
+    record: dict = {'count': 2 ** 70}
+    assert writer.format(record, TIME_EXTRACTED) == _singer(record)
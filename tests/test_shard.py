@@ -0,0 +1,105 @@
+"""Tests of sharded backfills."""
+# -*- coding: utf-8 -*-
+import json
+import os
+from typing import Optional
+
+import pytest
+
+from tap_open_exchange.shard import merge_states, plan_shards, write_plan
+
+CONFIG: dict = {
+    'api_key': 'api_key',
+    'start_date': '2021-01-01',
+    'end_date': '2021-01-10',
+}
+
+
+def _write_state(directory: str, shard: int, bookmark: dict) -> None:
+    """Write the state of a shard with the bookmark of exchange_rate_EUR.
+
+    Arguments:
+        directory {str} -- Directory of the shards
+        shard {int} -- Number of the shard
+        bookmark {dict} -- Bookmark of the stream
+    """
+    path: str = os.path.join(directory, f'shard-{shard:03d}', 'state.json')
+    with open(path, 'w') as state_file:
+        json.dump({'bookmarks': {'exchange_rate_EUR': bookmark}}, state_file)
+
+
+def test_plan_remainder() -> None:
+    """The remainder of the days goes to the first windows."""
+    assert plan_shards('2021-01-01', 3, '2021-01-10') == [
+        ('2021-01-01', '2021-01-04'),
+        ('2021-01-05', '2021-01-07'),
+        ('2021-01-08', '2021-01-10'),
+    ]
+
+
+def test_plan_more_shards_than_days() -> None:
+    """There is at most one window per day."""
+    assert plan_shards('2021-01-01', 5, '2021-01-02') == [
+        ('2021-01-01', '2021-01-01'),
+        ('2021-01-02', '2021-01-02'),
+    ]
+
+
+@pytest.mark.parametrize('shards, end_date', [
+    (0, '2021-01-10'),
+    (3, '2020-12-31'),
+])
+def test_plan_nothing_to_split(shards: int, end_date: Optional[str]) -> None:
+    """Without days or shards there is no plan."""
+    with pytest.raises(ValueError):
+        plan_shards('2021-01-01', shards, end_date)
+
+
+def test_merge_with_shard_without_state(tmp_path) -> None:
+    """Days of a shard that did not start, or did not complete, are gaps."""
+    directory: str = str(tmp_path)
+    write_plan(CONFIG, 3, directory)
+
+    # The first shard is done, the second deferred its last day
+    _write_state(directory, 0, {'start_date': '2021-01-05'})
+    _write_state(directory, 1, {
+        'start_date': '2021-01-07',
+        'completed': [['2021-01-05', '2021-01-06']],
+    })
+
+    assert merge_states(directory) == {'bookmarks': {'exchange_rate_EUR': {
+        'start_date': '2021-01-07',
+        'completed': [['2021-01-01', '2021-01-06']],
+    }}}
+
+
+def test_merge_gap_before_complete_shard(tmp_path) -> None:
+    """The bookmark stops at a gap, later completed days are kept."""
+    directory: str = str(tmp_path)
+    write_plan(CONFIG, 3, directory)
+
+    _write_state(directory, 0, {'start_date': '2021-01-03'})
+    _write_state(directory, 1, {'start_date': '2021-01-08'})
+    _write_state(directory, 2, {'start_date': '2021-01-11'})
+
+    assert merge_states(directory) == {'bookmarks': {'exchange_rate_EUR': {
+        'start_date': '2021-01-03',
+        'completed': [
+            ['2021-01-01', '2021-01-02'],
+            ['2021-01-05', '2021-01-10'],
+        ],
+    }}}
+
+
+def test_merge_complete(tmp_path) -> None:
+    """When every shard is complete the bookmark follows the last day."""
+    directory: str = str(tmp_path)
+    write_plan(CONFIG, 2, directory)
+
+    _write_state(directory, 0, {'start_date': '2021-01-06'})
+    _write_state(directory, 1, {'start_date': '2021-01-11'})
+
+    assert merge_states(directory)['bookmarks']['exchange_rate_EUR'] == {
+        'start_date': '2021-01-11',
+        'completed': [['2021-01-01', '2021-01-10']],
+    }
@@ -0,0 +1,117 @@
+"""Tests of the bookmarks of synced records."""
+# -*- coding: utf-8 -*-
+import io
+
+from singer.catalog import Catalog
+
+from tap_open_exchange.checkpoint import Checkpointer
+from tap_open_exchange.discover import discover
+from tap_open_exchange.metrics import RunMetrics
+from tap_open_exchange.serialize import RecordWriter
+from tap_open_exchange.sync import StreamContext, sync_record
+
+CATALOG: Catalog = discover()
+
+
+def _context(
+    stream_name: str,
+    state: dict,
+    fill_gaps: bool = False,
+) -> StreamContext:
+    """Compile the context of a stream that writes to a buffer.
+
+    Arguments:
+        stream_name {str} -- Name of the stream
+        state {dict} -- Tap state
+
+    Keyword Arguments:
+        fill_gaps {bool} -- Track the completed days (default: {False})
+
+    Returns:
+        StreamContext -- The context
+    """
+    return StreamContext(
+        CATALOG.get_stream(stream_name),
+        state,
+        Checkpointer(state, every_records=None, every_seconds=None),
+        RecordWriter(stream_name, output=io.StringIO()),
+        RunMetrics(),
+        fill_gaps,
+    )
+
+
+def _record(day: str, base: str = 'EUR') -> dict:
+    """Build a record of a day.
+
+    Arguments:
+        day {str} -- Day e.g. 2021-01-01
+
+    Keyword Arguments:
+        base {str} -- Base currency (default: {'EUR'})
+
+    Returns:
+        dict -- The record
+    """
+    return {'timestamp': f'{day}T23:59:59.000000', 'base': base, 'USD': 1.2}
+
+
+def test_bases_bookmark_after_complete_day() -> None:
+    """The bookmark of the bases moves past a day once all bases are in."""
+    state: dict = {
+        'bookmarks': {'exchange_rate_bases': {'start_date': '2021-01-01'}},
+    }
+    context: StreamContext = _context('exchange_rate_bases', state)
+
+    for base in ('EUR', 'USD', 'GBP'):
+        sync_record(context, _record('2021-01-01', base))
+    assert context.bookmarks['start_date'] == '2021-01-01'
+
+    sync_record(context, _record('2021-01-02'))
+    assert context.bookmarks['start_date'] == '2021-01-02'
+
+
+def test_long_bookmark_after_complete_day() -> None:
+    """The bookmark of the long rows moves past a day once it is written."""
+    state: dict = {
+        'bookmarks': {'exchange_rate_long': {'start_date': '2021-01-01'}},
+    }
+    context: StreamContext = _context('exchange_rate_long', state)
+
+    for currency in ('GBP', 'USD'):
+        sync_record(context, {
+            'date': '2021-01-01',
+            'timestamp': '2021-01-01T23:59:59.000000',
+            'base': 'EUR',
+            'currency': currency,
+            'rate': 1.2,
+        })
+    assert context.bookmarks['start_date'] == '2021-01-01'
+
+    sync_record(context, {
+        'date': '2021-01-02',
+        'timestamp': '2021-01-02T23:59:59.000000',
+        'base': 'EUR',
+        'currency': 'GBP',
+        'rate': 0.9,
+    })
+    assert context.bookmarks['start_date'] == '2021-01-02'
+
+
+def test_frontier_out_of_order() -> None:
+    """The bookmark follows the completed days that run from it."""
+    state: dict = {
+        'bookmarks': {'exchange_rate_EUR': {'start_date': '2021-01-01'}},
+    }
+    context: StreamContext = _context(
+        'exchange_rate_EUR',
+        state,
+        fill_gaps=True,
+    )
+
+    for day in ('2021-01-03', '2021-01-02', '2021-01-01'):
+        sync_record(context, _record(day))
+        assert context.bookmarks['start_date'] == '2021-01-01'
+
+    sync_record(context, _record('2021-01-06'))
+    assert context.bookmarks['start_date'] == '2021-01-04'
+    assert context.bookmarks['completed'] == [['2021-01-01', '2021-01-03']]
@@ -0,0 +1,211 @@
+"""Tests of the time-series requests."""
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta, timezone
+from typing import Generator, Iterable, List, Tuple
+
+import pytest
+
+from tap_open_exchange.exchange import (
+    OpenExchange,
+    _split_time_series,
+    _windows,
+)
+from tap_open_exchange.fetcher import FetchRequest
+from tap_open_exchange.transport import ApiError
+
+
+def _days(first: str, count: int) -> List[str]:
+    """List consecutive days.
+
+    Arguments:
+        first {str} -- First day e.g. 2021-01-01
+        count {int} -- Number of days
+
+    Returns:
+        List[str] -- The days
+    """
+    start: date = date.fromisoformat(first)
+    return [
+        (start + timedelta(days=day)).isoformat() for day in range(count)
+    ]
+
+
+def _timestamp(day: str) -> int:
+    """Return the last second of a day.
+
+    Arguments:
+        day {str} -- Day e.g. 2021-01-01
+
+    Returns:
+        int -- Unix timestamp
+    """
+    return int(datetime.combine(
+        date.fromisoformat(day),
+        datetime.max.time(),
+        tzinfo=timezone.utc,
+    ).timestamp())
+
+
+class TimeSeriesFetcher(object):
+    """Serve time-series windows until one is refused, and every day."""
+
+    cache = None
+
+    def __init__(self, windows_allowed: int, status: int = 403) -> None:
+        """Initialize fetcher.
+
+        Arguments:
+            windows_allowed {int} -- Time-series requests served before the
+                endpoint is refused
+
+        Keyword Arguments:
+            status {int} -- Status of the refusal (default: {403})
+        """
+        self.windows_allowed: int = windows_allowed
+        self.status: int = status
+        self.windows: list = []
+        self.days: list = []
+
+    def fetch(
+        self,
+        requests: Iterable[FetchRequest],
+    ) -> Generator[Tuple[FetchRequest, dict], None, None]:
+        """Yield the response of every request.
+
+        Arguments:
+            requests {Iterable[FetchRequest]} -- Requests to fetch
+
+        Raises:
+            ApiError: When the time-series endpoint is refused
+
+        Yields:
+            Generator[Tuple[FetchRequest, dict]] -- Request and its response
+        """
+        for request in requests:
+            if request.cache_key.endpoint == 'historical':  # type: ignore
+                self.days.append(request.key)
+                yield request, {
+                    'timestamp': _timestamp(request.key),
+                    'base': 'EUR',
+                    'rates': {'USD': 1.2},
+                }
+                continue
+
+            if len(self.windows) >= self.windows_allowed:
+                raise ApiError(self.status, 'not_allowed', 'Upgrade')
+            params: dict = request.params  # type: ignore
+            window: List[str] = _days(
+                params['start'],
+                (
+                    date.fromisoformat(params['end'])
+                    - date.fromisoformat(params['start'])
+                ).days + 1,
+            )
+            self.windows.append(window)
+            yield request, {
+                'base': 'EUR',
+                'rates': {day: {'USD': 1.2} for day in window},
+            }
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def _exchange(fetcher: TimeSeriesFetcher) -> OpenExchange:
+    """Build a client that fetches ranges of ten days.
+
+    Arguments:
+        fetcher {TimeSeriesFetcher} -- Fetcher
+
+    Returns:
+        OpenExchange -- The client
+    """
+    return OpenExchange(
+        'api_key',
+        fetcher=fetcher,
+        end_date='2021-12-31',
+        time_series=True,
+        time_series_days=10,
+    )
+
+
+def test_windows_split_gaps_and_full() -> None:
+    """Windows end at a gap and when they are full."""
+    days: List[str] = _days('2021-01-01', 5) + _days('2021-01-08', 3)
+    assert list(_windows(days, 3)) == [
+        ['2021-01-01', '2021-01-02', '2021-01-03'],
+        ['2021-01-04', '2021-01-05'],
+        ['2021-01-08', '2021-01-09', '2021-01-10'],
+    ]
+    assert list(_windows([], 3)) == []
+
+
+def test_windows_over_month_end() -> None:
+    """Consecutive days over a month and year end share a window."""
+    days: List[str] = _days('2020-12-30', 4)
+    assert list(_windows(days, 31)) == [days]
+
+
+def test_split_time_series() -> None:
+    """Every day of the range becomes a response, missing days are skipped."""
+    request: FetchRequest = FetchRequest(
+        '2021-01-01',
+        'time-series.json',
+        {'start': '2021-01-01', 'end': '2021-01-03'},
+    )
+    response_data: dict = {
+        'base': 'EUR',
+        'rates': {
+            '2021-01-01': {'USD': 1.2},
+            '2021-01-03': {'USD': 1.3},
+        },
+    }
+
+    assert list(_split_time_series(request, response_data)) == [
+        ('2021-01-01', {
+            'timestamp': _timestamp('2021-01-01'),
+            'base': 'EUR',
+            'rates': {'USD': 1.2},
+        }),
+        ('2021-01-03', {
+            'timestamp': _timestamp('2021-01-03'),
+            'base': 'EUR',
+            'rates': {'USD': 1.3},
+        }),
+    ]
+
+
+def test_time_series_windows() -> None:
+    """Days are fetched in windows of time_series_days days."""
+    fetcher: TimeSeriesFetcher = TimeSeriesFetcher(windows_allowed=10)
+    days: List[str] = _days('2021-01-01', 25)
+
+    fetched: list = list(_exchange(fetcher)._daily_rates(days, 'EUR'))
+
+    assert [day for day, _ in fetched] == days
+    assert [len(window) for window in fetcher.windows] == [10, 10, 5]
+    assert not fetcher.days
+
+
+def test_fallback_per_day() -> None:
+    """A refused time-series falls back to the days not fetched yet."""
+    fetcher: TimeSeriesFetcher = TimeSeriesFetcher(windows_allowed=1)
+    exchange: OpenExchange = _exchange(fetcher)
+    days: List[str] = _days('2021-01-01', 25)
+
+    fetched: list = list(exchange._daily_rates(days, 'EUR'))
+
+    assert [day for day, _ in fetched] == days
+    assert fetcher.windows == [days[:10]]
+    assert fetcher.days == days[10:]
+    assert not exchange.time_series
+
+
+def test_other_errors_are_raised() -> None:
+    """Only a refused time-series endpoint falls back."""
+    fetcher: TimeSeriesFetcher = TimeSeriesFetcher(0, status=401)
+    exchange: OpenExchange = _exchange(fetcher)
+
+    with pytest.raises(ApiError):
+        list(exchange._daily_rates(_days('2021-01-01', 3), 'EUR'))
+    assert exchange.time_series
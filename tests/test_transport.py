@@ -0,0 +1,110 @@
+"""Tests of the retries of the HTTP transport."""
+# -*- coding: utf-8 -*-
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Optional
+
+import httpx
+import pytest
+
+from tap_open_exchange import transport
+from tap_open_exchange.transport import ApiError, Transport, _retry_after
+
+
+def _response(retry_after: Optional[str] = None) -> httpx.Response:
+    """Build a rate limited response.
+
+    Keyword Arguments:
+        retry_after {Optional[str]} -- Retry-After header (default: {None})
+
+    Returns:
+        httpx.Response -- The response
+    """
+    headers: dict = {}
+    if retry_after is not None:
+        headers['Retry-After'] = retry_after
+    return httpx.Response(
+        429,
+        headers=headers,
+        json={'message': 'too_many_requests', 'description': 'Slow down'},
+    )
+
+
+def _waits(
+    monkeypatch,
+    client: Transport,
+    attempt: int,
+    response: Optional[httpx.Response],
+) -> list:
+    """Wait before a retry without sleeping.
+
+    Arguments:
+        monkeypatch {MonkeyPatch} -- Fixture
+        client {Transport} -- The transport
+        attempt {int} -- Number of the failed attempt
+        response {Optional[httpx.Response]} -- The failed response
+
+    Returns:
+        list -- The delays slept
+    """
+    delays: list = []
+
+    async def sleep(delay: float) -> None:  # noqa: WPS430
+        delays.append(delay)
+
+    monkeypatch.setattr(transport.asyncio, 'sleep', sleep)
+    asyncio.run(client._wait(attempt, response))
+    return delays
+
+
+def test_retry_after_seconds() -> None:
+    """A Retry-After in seconds is waited, never negative."""
+    assert _retry_after(_response('3')) == 3
+    assert _retry_after(_response('1.5')) == 1.5
+    assert _retry_after(_response('-1')) == 0
+
+
+def test_retry_after_date() -> None:
+    """A Retry-After date is waited until, a past date not at all."""
+    retry_at: datetime = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert _retry_after(
+        _response(format_datetime(retry_at, usegmt=True)),
+    ) == pytest.approx(30, abs=2)
+
+    past: datetime = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert _retry_after(_response(format_datetime(past, usegmt=True))) == 0
+
+
+@pytest.mark.parametrize('retry_after', [None, '', 'soon'])
+def test_retry_after_missing(retry_after) -> None:
+    """Without a valid Retry-After header there is nothing to wait."""
+    assert _retry_after(_response(retry_after)) is None
+
+
+def test_wait_retry_after(monkeypatch) -> None:
+    """The Retry-After of a response replaces the backoff."""
+    client: Transport = Transport(max_backoff=10)
+    assert _waits(monkeypatch, client, 4, _response('7')) == [7]
+    assert client.stats.retries == 1
+
+
+def test_wait_backoff(monkeypatch) -> None:
+    """Without a Retry-After the backoff is jittered up to the maximum."""
+    client: Transport = Transport(backoff_factor=1, max_backoff=10)
+    for attempt in range(6):
+        delays: list = _waits(monkeypatch, client, attempt, None)
+        assert 0 <= delays[0] <= min(10, 2 ** attempt)
+    assert client.stats.retries == 6
+
+
+def test_wait_retry_after_over_max_backoff(monkeypatch) -> None:
+    """A Retry-After longer than the maximum backoff fails the request."""
+    client: Transport = Transport(max_backoff=10)
+    with pytest.raises(ApiError) as error:
+        _waits(monkeypatch, client, 0, _response('3600'))
+
+    assert error.value.status == 429
+    assert error.value.message == 'too_many_requests'
+    assert 'Retry-After of 3600 seconds' in error.value.description
+    assert client.stats.retries == 0